@@ -0,0 +1,235 @@
+"""
+RGDS archive inputs — archive_inputs.py
+
+Purpose
+-------
+Decision logs often arrive inside submission packages (zip / tar archives
+with hundreds of MB of other content). These helpers let the validators
+read the decision-log members straight from the archive, so nothing is
+extracted to disk first.
+
+Addressing
+----------
+    package.zip                     every *.json member
+    package.tar.gz!decision-logs/*  members matching the glob after "!"
+    package.zip!logs/rgds-1.json    one member
+
+Results are reported as "<archive>!<member>".
+
+Reading
+-------
+- zip: the central directory is read from a memory-mapped view of the
+  archive, and only the selected members are decompressed, on demand.
+  Open archives are memoized per process (and reopened if the file changes).
+- tar (.tar, .tar.gz/.tgz, .tar.bz2, .tar.xz): read as a forward-only
+  stream (no seeking, no temporary files). Matching members are read into
+  memory while the stream passes them; everything else is skipped. A
+  single "archive!member" input is read once, when it is resolved.
+- Member names are matched and looked up without a leading "./".
+
+Only member *names* are matched; a member is never written to disk, so
+hostile paths ("../x", absolute names) are harmless.
+
+Only the standard library is used.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import io
+import mmap
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, NamedTuple, Tuple
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+DEFAULT_MEMBER_PATTERN = "*.json"
+MEMBER_SEPARATOR = "!"
+
+
+class ArchiveMember(NamedTuple):
+    """A JSON member of an archive; duck-types the Path methods the validators use."""
+
+    archive: Path
+    member: str
+    data: bytes | None = None  # preloaded bytes (tar streams); None = read on demand (zip)
+
+    def __str__(self) -> str:
+        return f"{self.archive}{MEMBER_SEPARATOR}{self.member}"
+
+    # Identity is (archive, member); preloaded bytes do not take part.
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ArchiveMember) and (self.archive, self.member) == (other.archive, other.member)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash((self.archive, self.member))
+
+    def read_bytes(self) -> bytes:
+        if self.data is not None:
+            return self.data
+        return read_member(self.archive, self.member)
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return self.read_bytes().decode(encoding)
+
+    def exists(self) -> bool:
+        try:
+            self.read_bytes()
+        except (OSError, KeyError, tarfile.TarError, zipfile.BadZipFile):
+            return False
+        return True
+
+
+def is_archive(path: Path) -> bool:
+    name = path.name.lower()
+    return any(name.endswith(suffix) for suffix in ARCHIVE_SUFFIXES)
+
+
+def split_spec(target: str) -> Tuple[Path, str] | None:
+    """
+    Split "archive[!pattern]" into (archive, pattern), or None if `target`
+    does not name an existing archive file.
+    """
+    head, sep, pattern = target.partition(MEMBER_SEPARATOR)
+    path = Path(head)
+    if not is_archive(path) or not path.is_file():
+        return None
+    return path, (pattern if sep and pattern else DEFAULT_MEMBER_PATTERN)
+
+
+def source_file(item) -> Path:
+    """The file on disk behind an input (the archive, for an ArchiveMember)."""
+    return item.archive if isinstance(item, ArchiveMember) else item
+
+
+def resolve_input(target: str, preload: bool = True):
+    """
+    A Path, or an ArchiveMember for "archive!member" targets (daemon requests, --instance).
+
+    A tar member is read here, once, and carries its bytes: the existence
+    check, cache key and load that follow would otherwise each re-stream
+    the archive. A member that cannot be read is returned without data and
+    fails on its own read. preload=False skips the read (for callers that
+    read many members of one archive in a single pass).
+    """
+    spec = split_spec(target)
+    if spec is None or MEMBER_SEPARATOR not in target:
+        return Path(target)
+    archive, member = spec[0].resolve(), spec[1]
+    if preload and not archive.name.lower().endswith(".zip"):
+        try:
+            data = read_members(archive, [member]).get(member)
+        except (OSError, tarfile.TarError):
+            data = None
+        return ArchiveMember(archive, member, data)
+    return ArchiveMember(archive, member)
+
+
+# -----------------------------
+# zip
+# -----------------------------
+
+_ZIPS: Dict[Path, Tuple[Tuple[int, int], zipfile.ZipFile]] = {}
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only mmap usable as a ZipFile source (mmap lacks seekable() before Python 3.13)."""
+
+    def seekable(self) -> bool:
+        return True
+
+
+def _open_zip(archive: Path) -> zipfile.ZipFile:
+    """Memoized ZipFile over a read-only memory map of `archive`."""
+    st = archive.stat()
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _ZIPS.get(archive)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    if cached is not None:
+        cached[1].close()
+    with archive.open("rb") as f:
+        # mmap cannot map an empty file; ZipFile then reports BadZipFile as usual.
+        view = _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else io.BytesIO()
+    zf = zipfile.ZipFile(view)
+    _ZIPS[archive] = (version, zf)
+    return zf
+
+
+# -----------------------------
+# Listing and reading
+# -----------------------------
+
+
+def _member_name(name: str) -> str:
+    # "tar czf pkg.tgz ." stores "./decision-logs/x.json"; address it as "decision-logs/x.json".
+    return name.removeprefix("./")
+
+
+def _matches(name: str, pattern: str) -> bool:
+    return fnmatch.fnmatchcase(_member_name(name), pattern)
+
+
+def iter_members(archive: Path, pattern: str = DEFAULT_MEMBER_PATTERN) -> Iterator[ArchiveMember]:
+    """
+    Yield the members of `archive` whose names match `pattern`, in archive order.
+
+    zip members are yielded without data (read on demand); tar members
+    carry their bytes, because a compressed tar stream cannot be revisited
+    cheaply.
+    """
+    archive = archive.resolve()
+    if archive.name.lower().endswith(".zip"):
+        for info in _open_zip(archive).infolist():
+            if not info.is_dir() and _matches(info.filename, pattern):
+                yield ArchiveMember(archive, info.filename)
+        return
+
+    with tarfile.open(archive, mode="r|*") as tf:
+        for info in tf:
+            if info.isfile() and _matches(info.name, pattern):
+                f = tf.extractfile(info)
+                yield ArchiveMember(archive, info.name, f.read() if f is not None else b"")
+
+
+def read_members(archive: Path, members: Iterable[str]) -> Dict[str, bytes]:
+    """
+    Bytes of the named members of a tar archive, keyed by the names asked
+    for, read in one pass of the stream; other members are skipped unread
+    and missing members are absent.
+    """
+    wanted: Dict[str, list] = {}
+    for member in members:
+        wanted.setdefault(_member_name(member), []).append(member)
+    found: Dict[str, bytes] = {}
+    with tarfile.open(archive, mode="r|*") as tf:
+        for info in tf:
+            names = wanted.pop(_member_name(info.name), None) if info.isfile() else None
+            if names:
+                f = tf.extractfile(info)
+                data = f.read() if f is not None else b""
+                found.update((name, data) for name in names)
+                if not wanted:
+                    break
+    return found
+
+
+def read_member(archive: Path, member: str) -> bytes:
+    """Bytes of one member; raises KeyError if the archive has no such member."""
+    if archive.name.lower().endswith(".zip"):
+        zf = _open_zip(archive.resolve())
+        if member in zf.NameToInfo:
+            return zf.read(member)
+        name = _member_name(member)
+        for info in zf.infolist():
+            if _member_name(info.filename) == name and not info.is_dir():
+                return zf.read(info)
+    else:
+        data = read_members(archive, [member]).get(member)
+        if data is not None:
+            return data
+    raise KeyError(f"There is no item named {member!r} in the archive")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+RGDS Benchmark Script — benchmark_format_checks.py
+
+Purpose
+-------
+Measures the shared format checker (format_checks.py) against the stock
+jsonschema FormatChecker on a synthetic corpus with long change logs,
+where date / date-time checks are a visible share of schema validation.
+
+Measurements
+------------
+calls    every (value, format) pair the schema checks in the corpus, run
+         through each checker: stock, shared with a cold memo, shared
+         with a warm memo (nanoseconds per call)
+schema   full JSON Schema validation of the corpus with no format
+         checking, the stock checker, and the shared checker (best of
+         --repeat passes); the difference to "none" is the
+         format-checking cost
+
+Both checkers are also compared on every value, and the run fails if they
+ever disagree.
+
+Report
+------
+JSON written to build/benchmark/format-benchmark.json (or --report).
+
+Typical usage
+-------------
+    python3 scripts/benchmark_format_checks.py
+    python3 scripts/benchmark_format_checks.py --count 2000 --change-log 500
+
+Exit codes
+----------
+0 — Benchmark completed
+1 — The shared checker disagreed with the stock checker
+2 — Script/configuration error
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from format_checks import clear_memo, format_checker, memo_info
+from generate_synthetic_corpus import Shape, load_templates, synthesize
+from schema_cache import build_validator, load_compiled_schema
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_PATH = ROOT / "decision-log" / "decision-log.schema.json"
+DEFAULT_REPORT = ROOT / "build" / "benchmark" / "format-benchmark.json"
+
+
+def collect_checks(schema: dict, records: List[dict]) -> List[Tuple[object, str]]:
+    """Every (value, format) pair schema validation asks the format checker about."""
+    from jsonschema import FormatChecker
+
+    seen: List[Tuple[object, str]] = []
+    recorder = FormatChecker()
+
+    def record(name, func):
+        def run(instance):
+            seen.append((instance, name))
+            return func(instance)
+
+        return run
+
+    recorder.checkers = {name: (record(name, func), raises) for name, (func, raises) in recorder.checkers.items()}
+    validator = build_validator(schema, format_check=True, format_checker=recorder)
+    for record_ in records:
+        for _ in validator.iter_errors(record_):
+            pass
+    return seen
+
+
+def time_calls(checker, checks: List[Tuple[object, str]]) -> float:
+    t0 = time.perf_counter()
+    conforms = checker.conforms
+    for value, name in checks:
+        conforms(value, name)
+    return time.perf_counter() - t0
+
+
+def time_schema(schema: dict, records: List[dict], mode: str) -> float:
+    from jsonschema import FormatChecker
+
+    if mode == "none":
+        validator = build_validator(schema, format_check=False)
+    else:
+        validator = build_validator(schema, format_check=True, format_checker=FormatChecker() if mode == "stock" else None)
+    t0 = time.perf_counter()
+    for record in records:
+        for _ in validator.iter_errors(record):
+            pass
+    return time.perf_counter() - t0
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="benchmark_format_checks.py",
+        description="Benchmark the shared date / date-time format checker against the stock FormatChecker.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("--count", type=int, default=200, help="Synthetic records. Default: 200")
+    p.add_argument("--change-log", dest="change_log", type=int, default=200, help="audit.change_log entries per record. Default: 200")
+    p.add_argument("--evidence", type=int, default=0, help="Pad evidence_items up to N items.")
+    p.add_argument("--repeat", type=int, default=3, help="Schema passes per mode (best is reported). Default: 3")
+    p.add_argument("--seed", type=int, default=0, help="Generator seed. Default: 0")
+    p.add_argument("--report", type=str, default=None, help="Report path. Default: build/benchmark/format-benchmark.json")
+    return p.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.count < 1 or args.repeat < 1 or args.change_log < 0 or args.evidence < 0:
+        print("[ERROR] --count and --repeat must be >= 1 and sizes >= 0")
+        return 2
+
+    from jsonschema import FormatChecker
+
+    try:
+        schema, _ = load_compiled_schema(SCHEMA_PATH)
+        templates = load_templates()
+    except Exception as e:
+        print(f"[ERROR] Failed to load schema or templates\n  {e}")
+        return 2
+
+    records = list(synthesize(templates, args.count, Shape(evidence=args.evidence, change_log=args.change_log), args.seed))
+    checks = collect_checks(schema, records)
+
+    stock, shared = FormatChecker(), format_checker()
+    disagreements = [(v, f) for v, f in checks if stock.conforms(v, f) != shared.conforms(v, f)]
+
+    clear_memo()
+    calls: Dict[str, float] = {"stock": time_calls(stock, checks)}
+    clear_memo()
+    calls["shared_cold"] = time_calls(shared, checks)
+    calls["shared_warm"] = time_calls(shared, checks)
+    memo = memo_info()
+
+    clear_memo()
+    schema_s = {mode: min(time_schema(schema, records, mode) for _ in range(args.repeat)) for mode in ("none", "stock", "shared")}
+
+    n = max(1, len(checks))
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {"count": args.count, "change_log": args.change_log, "evidence": args.evidence, "seed": args.seed},
+        "format_checks": len(checks),
+        "distinct_values": len({(v, f) for v, f in checks if isinstance(v, str)}),
+        "calls_ns_per_check": {k: round(v / n * 1e9, 1) for k, v in calls.items()},
+        "schema_s": {k: round(v, 4) for k, v in schema_s.items()},
+        "format_overhead_s": {k: round(schema_s[k] - schema_s["none"], 4) for k in ("stock", "shared")},
+        "memo": memo,
+        "disagreements": len(disagreements),
+    }
+    out = Path(args.report) if args.report else DEFAULT_REPORT
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print(f"Format benchmark: {args.count} record(s), {len(checks)} format check(s), {report['distinct_values']} distinct value(s)")
+    for name, ns in report["calls_ns_per_check"].items():
+        print(f"  {name:<12} {ns:8.1f} ns/check  ({calls['stock'] / calls[name]:.1f}x vs stock)")
+    for name, seconds in report["schema_s"].items():
+        overhead = "" if name == "none" else f"  (format checks {report['format_overhead_s'][name]:.3f}s)"
+        print(f"  schema/{name:<6} {seconds:8.3f}s{overhead}")
+    print(f"  Report: {out}")
+
+    if disagreements:
+        print(f"\n[FAIL] Shared checker disagreed with the stock checker on {len(disagreements)} value(s), e.g. {disagreements[0]!r}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
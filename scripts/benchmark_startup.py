@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+RGDS Benchmark Script — benchmark_startup.py
+
+Purpose
+-------
+Measures cold-start latency of validate_decision_log.py, which hooks call
+thousands of times. Each scenario is run as a fresh process several times
+and the median / p95 wall time is reported next to a bare interpreter
+start, so the number that matters (our overhead) is visible.
+
+Scenarios
+---------
+python     bare interpreter start (baseline)
+version    --version
+help       --help
+arg_error  an invalid argument (argparse exits with 2)
+cached     --semantic --format json on a record whose outcome is cached
+cold       --semantic --no-cache (full validation, jsonschema imported)
+
+Each scenario is also run once under -X importtime to record whether it
+imported jsonschema; only "cold" should.
+
+Report
+------
+JSON written to build/benchmark/startup-benchmark.json (or --report).
+
+Typical usage
+-------------
+    python3 scripts/benchmark_startup.py
+    python3 scripts/benchmark_startup.py --runs 30
+
+Exit codes
+----------
+0 — Benchmark completed
+2 — Script/configuration error
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = Path(__file__).resolve().parent / "validate_decision_log.py"
+EXAMPLE = ROOT / "examples" / "rgds-dec-0001.json"
+DEFAULT_REPORT = ROOT / "build" / "benchmark" / "startup-benchmark.json"
+
+SCENARIOS: Dict[str, List[str]] = {
+    "python": ["-c", "pass"],
+    "version": [str(SCRIPT), "--version"],
+    "help": [str(SCRIPT), "--help"],
+    "arg_error": [str(SCRIPT), "--format", "xml"],
+    "cached": [str(SCRIPT), "--semantic", "--format", "json", str(EXAMPLE)],
+    "cold": [str(SCRIPT), "--semantic", "--no-cache", str(EXAMPLE)],
+}
+
+
+def run_scenario(args: List[str], runs: int, env: Dict[str, str]) -> Dict[str, float]:
+    """Median / p95 / min wall time in milliseconds over `runs` fresh processes."""
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, *args], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(samples[min(len(samples) - 1, int(0.95 * len(samples)))], 2),
+        "min_ms": round(samples[0], 2),
+    }
+
+
+def imports_jsonschema(args: List[str], env: Dict[str, str]) -> bool:
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env, text=True)
+    return any(line.rstrip().endswith("| jsonschema") for line in proc.stderr.splitlines())
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="benchmark_startup.py",
+        description="Benchmark validate_decision_log.py cold-start latency.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("--runs", type=int, default=15, help="Fresh processes per scenario. Default: 15")
+    p.add_argument("--report", type=str, default=None, help="Report path. Default: build/benchmark/startup-benchmark.json")
+    return p.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.runs < 1:
+        print("[ERROR] --runs must be at least 1")
+        return 2
+
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="rgds-startup-") as tmp:
+        # Private cache dir: "cached" is warmed here, and the user's cache is untouched.
+        env = {**os.environ, "RGDS_CACHE_DIR": tmp}
+        subprocess.run([sys.executable, *SCENARIOS["cached"]], stdout=subprocess.DEVNULL, env=env)
+
+        for name, scenario in SCENARIOS.items():
+            results[name] = run_scenario(scenario, args.runs, env)
+            results[name]["imports_jsonschema"] = imports_jsonschema(scenario, env)
+
+    base = results["python"]["median_ms"]
+    for stats in results.values():
+        stats["overhead_ms"] = round(stats["median_ms"] - base, 2)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "scenarios": results,
+    }
+    out = Path(args.report) if args.report else DEFAULT_REPORT
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print(f"Startup benchmark ({args.runs} run(s) per scenario)")
+    for name, stats in results.items():
+        flag = "  [imports jsonschema]" if stats["imports_jsonschema"] else ""
+        print(f"  {name:<10} median {stats['median_ms']:7.1f}ms  p95 {stats['p95_ms']:7.1f}ms  overhead {stats['overhead_ms']:+7.1f}ms{flag}")
+    print(f"  Report: {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
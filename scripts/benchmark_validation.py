@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+RGDS Benchmark Script — benchmark_validation.py
+
+Purpose
+-------
+Measures how the validators scale, phase by phase, on a synthetic corpus
+(generate_synthetic_corpus.py) and writes a machine-readable report so
+throughput regressions show up between versions.
+
+Phases (timed separately, per record)
+-------------------------------------
+parse     json.loads of the record bytes
+schema    JSON Schema validation (compiled schema, format checks on)
+semantic  semantic_checks() with the default rule plan
+format    building and serialising the --format json payload
+
+End-to-end (optional, --e2e)
+----------------------------
+Wall-clock runs of the real CLIs over the same corpus:
+validate_all_examples.py --full (serial and --parallel) and
+validate_decision_log.py --ndjson.
+
+Report
+------
+JSON written to build/benchmark/validation-benchmark.json (or --report):
+script versions, Python/platform, corpus shape, per-phase totals and
+per-record percentiles (microseconds), and end-to-end records/second.
+
+With --baseline OLD.json, per-record phase means are compared to the old
+report and the run fails if any phase regressed by more than
+--max-regression percent.
+
+Typical usage
+-------------
+    python3 scripts/benchmark_validation.py
+    python3 scripts/benchmark_validation.py --count 5000 --evidence 200 --e2e
+    python3 scripts/benchmark_validation.py --baseline build/benchmark/previous.json
+
+Exit codes
+----------
+0 — Benchmark completed (and no regression beyond the threshold)
+1 — A phase regressed beyond --max-regression versus --baseline
+2 — Script/configuration error
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import validate_all_examples
+import validate_decision_log
+from generate_synthetic_corpus import Shape, load_templates, synthesize
+from schema_cache import get_validator
+from semantic_rules import semantic_checks
+
+BENCHMARK_VERSION = "1"
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_PATH = ROOT / "decision-log" / "decision-log.schema.json"
+DEFAULT_REPORT = ROOT / "build" / "benchmark" / "validation-benchmark.json"
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+PHASES = ("parse", "schema", "semantic", "format")
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Totals and per-record statistics (microseconds) for one phase."""
+    ordered = sorted(samples)
+    n = len(ordered)
+
+    def pct(p: float) -> float:
+        return ordered[min(n - 1, int(p * n))] * 1e6
+
+    return {
+        "total_s": round(sum(ordered), 6),
+        "mean_us": round(sum(ordered) / n * 1e6, 2),
+        "p50_us": round(pct(0.50), 2),
+        "p95_us": round(pct(0.95), 2),
+        "max_us": round(ordered[-1] * 1e6, 2),
+    }
+
+
+def time_phases(blobs: List[bytes]) -> Dict[str, Dict[str, float]]:
+    """Run every phase on every record in-process, timing each phase separately."""
+    validator, schema_dict, _ = get_validator(SCHEMA_PATH, format_check=True)
+    samples: Dict[str, List[float]] = {p: [] for p in PHASES}
+    clock = time.perf_counter
+
+    for blob in blobs:
+        t0 = clock()
+        instance = json.loads(blob)
+        t1 = clock()
+        schema_errors = list(validator.iter_errors(instance))
+        t2 = clock()
+        sem_errs, sem_warns = semantic_checks(instance)
+        t3 = clock()
+        outcome = {
+            "schema_ok": not schema_errors,
+            "schema_errors": [],
+            "schema_errors_json": [{"path": validate_decision_log.format_path(e.path), "message": e.message} for e in schema_errors],
+            "sem_errors": sem_errs,
+            "sem_warnings": sem_warns,
+        }
+        json.dumps(validate_decision_log.outcome_payload(SCHEMA_PATH, Path("synthetic.json"), schema_dict, outcome, True, False), indent=2)
+        t4 = clock()
+
+        samples["parse"].append(t1 - t0)
+        samples["schema"].append(t2 - t1)
+        samples["semantic"].append(t3 - t2)
+        samples["format"].append(t4 - t3)
+
+    return {p: summarize(samples[p]) for p in PHASES}
+
+
+def run_e2e(blobs: List[bytes]) -> Dict[str, Dict[str, float]]:
+    """End-to-end throughput of both CLIs over a temporary copy of the corpus."""
+    py = sys.executable
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="rgds-bench-") as tmp:
+        corpus = Path(tmp) / "corpus"
+        corpus.mkdir()
+        for i, blob in enumerate(blobs):
+            (corpus / f"rec-{i:07d}.json").write_bytes(blob)
+        ndjson = Path(tmp) / "corpus.ndjson"
+        ndjson.write_bytes(b"\n".join(blobs) + b"\n")
+
+        env_cache = {**os.environ, "RGDS_CACHE_DIR": str(Path(tmp) / "cache")}
+        batch = [py, str(SCRIPTS_DIR / "validate_all_examples.py"), str(corpus), "--full"]
+        for name, cmd in (
+            ("validate_all_examples.serial", batch),
+            ("validate_all_examples.parallel", batch + ["--parallel"]),
+            ("validate_decision_log.ndjson", [py, str(SCRIPTS_DIR / "validate_decision_log.py"), "--ndjson", str(ndjson), "--semantic"]),
+        ):
+            t0 = time.perf_counter()
+            proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env_cache)
+            elapsed = time.perf_counter() - t0
+            results[name] = {
+                "exit_code": proc.returncode,
+                "wall_s": round(elapsed, 4),
+                "records_per_s": round(len(blobs) / elapsed, 1),
+            }
+    return results
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> List[str]:
+    """Phases whose mean per-record time regressed by more than max_regression percent."""
+    regressions = []
+    for phase, stats in report["phases"].items():
+        old = (baseline.get("phases") or {}).get(phase)
+        if not old or not old.get("mean_us"):
+            continue
+        change = (stats["mean_us"] - old["mean_us"]) / old["mean_us"] * 100.0
+        line = f"{phase}: {old['mean_us']:.1f}us -> {stats['mean_us']:.1f}us ({change:+.1f}%)"
+        print(f"  {line}")
+        if change > max_regression:
+            regressions.append(line)
+    return regressions
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="benchmark_validation.py",
+        description="Benchmark RGDS validation phases on a synthetic corpus.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("--count", type=int, default=2000, help="Synthetic records to generate. Default: 2000")
+    p.add_argument("--seed", type=int, default=0, help="Generator seed. Default: 0")
+    p.add_argument("--options", type=int, default=0, help="Pad options_considered up to N options.")
+    p.add_argument("--evidence", type=int, default=0, help="Pad evidence_items up to N items.")
+    p.add_argument("--change-log", dest="change_log", type=int, default=0, help="Write N audit.change_log entries.")
+    p.add_argument("--ai-ratio", dest="ai_ratio", type=float, default=0.5, help="Fraction of records with AI used. Default: 0.5")
+    p.add_argument("--e2e", action="store_true", help="Also time the real CLIs end to end (subprocess runs).")
+    p.add_argument("--report", type=str, default=None, help="Report path. Default: build/benchmark/validation-benchmark.json")
+    p.add_argument("--baseline", type=str, default=None, help="Previous report to compare against.")
+    p.add_argument(
+        "--max-regression",
+        dest="max_regression",
+        type=float,
+        default=20.0,
+        help="Allowed per-phase slowdown versus --baseline, in percent. Default: 20",
+    )
+    return p.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.count < 1:
+        print("[ERROR] --count must be at least 1")
+        return 2
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"[ERROR] Failed to read baseline: {args.baseline}\n  {e}")
+            return 2
+
+    shape = Shape(args.options, args.evidence, args.change_log, args.ai_ratio)
+    blobs = [
+        json.dumps(r, separators=(",", ":")).encode("utf-8")
+        for r in synthesize(load_templates(), args.count, shape, args.seed)
+    ]
+
+    report = {
+        "benchmark_version": BENCHMARK_VERSION,
+        "script_versions": {
+            "validate_decision_log": validate_decision_log.SCRIPT_VERSION,
+            "validate_all_examples": validate_all_examples.SCRIPT_VERSION,
+        },
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "corpus": {"count": args.count, "seed": args.seed, "bytes": sum(map(len, blobs)), **shape._asdict()},
+        "phases": time_phases(blobs),
+    }
+    if args.e2e:
+        report["e2e"] = run_e2e(blobs)
+
+    out = Path(args.report) if args.report else DEFAULT_REPORT
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print(f"Benchmark: {args.count} record(s), {report['corpus']['bytes']} bytes")
+    for phase, stats in report["phases"].items():
+        print(f"  {phase:<9} total {stats['total_s']:.3f}s  mean {stats['mean_us']:.1f}us  p95 {stats['p95_us']:.1f}us")
+    for name, stats in report.get("e2e", {}).items():
+        print(f"  {name:<31} {stats['wall_s']:.2f}s  {stats['records_per_s']:.0f} records/s (exit {stats['exit_code']})")
+    print(f"  Report: {out}")
+
+    if baseline is not None:
+        print("\nVersus baseline:")
+        regressions = compare(report, baseline, args.max_regression)
+        if regressions:
+            print(f"\n[FAIL] Regression beyond {args.max_regression:g}%:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"[PASS] No phase regressed beyond {args.max_regression:g}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
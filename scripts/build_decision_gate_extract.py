@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+RGDS Extract Script — build_decision_gate_extract.py
+
+Purpose
+-------
+Generates the flat Decision Gate Extract described in
+evaluation/decision-gate-extract.md from RGDS decision log JSON, using the
+column layout of evaluation/scorecard-template.csv so the scorecard and the
+Power BI model (evaluation/decision-gate-extract-powerbi-sample.md) load the
+same table.
+
+The extract is derived, read-only and never a source of truth. Columns that
+record human review judgments (missed_risk_notes, reviewer_confidence_rating,
+reviewer_comments) are emitted empty for reviewers to fill in.
+
+How it works
+------------
+- Records are streamed from disk in batches (--batch-size) and every column
+  is computed column-wise over the whole batch, sharing per-batch derived
+  arrays (evidence tallies, AI disclosure) between columns.
+- Outputs:
+    <prefix>.csv              scorecard-compatible CSV
+    <prefix>.columns.jsonl.gz gzip column store: one {"columns": {...}} row
+                              group per line, one gzip member per write
+    <prefix>.manifest.json    per-file content hash + extracted row
+- Incremental: files whose content hash is unchanged reuse their manifest
+  row and are not re-parsed. If the only change is new files, their rows are
+  appended to the CSV and as a new row group to the column store; any edit
+  or removal rewrites both outputs from the manifest (still without
+  re-parsing unchanged files).
+
+Typical usage
+-------------
+    python3 scripts/build_decision_gate_extract.py
+    python3 scripts/build_decision_gate_extract.py path/to/corpus --output build/extract/decision-gate
+    python3 scripts/build_decision_gate_extract.py path/to/corpus --full   # rebuild from scratch
+
+Exit codes
+----------
+0 — Extract written
+1 — Extract written, but some files could not be read (or were malformed) and were skipped
+2 — Script/configuration error
+"""
+
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+from corpus_inputs import collect_inputs
+
+EXTRACT_VERSION = "2"  # bump when column derivations change (invalidates manifests)
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUTPUT = ROOT / "build" / "decision-gate-extract"
+DEFAULT_BATCH_SIZE = 512
+
+GAP_ID_RE = re.compile(r"\bIND-GAP-\d+\b")
+BACKLOG_ID_RE = re.compile(r"\bP\d-BL-\d+\b")
+SEVERITY_ORDER = ("low", "medium", "high", "critical")
+
+
+# -----------------------------
+# Column derivations
+# -----------------------------
+# Each column function takes (records, shared) and returns one value per
+# record. `shared` caches per-batch arrays that several columns read.
+
+def _yes_no(flag) -> str:
+    return "Yes" if flag else "No"
+
+
+def _str(value) -> str:
+    """`value` if it is a string, else "" (records are not validated; leaves may be any JSON type)."""
+    return value if isinstance(value, str) else ""
+
+
+def _date_part(value) -> str:
+    return value[:10] if isinstance(value, str) else ""
+
+
+def _parse_date(value):
+    try:
+        return date.fromisoformat(value[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+def _get(d, *keys):
+    for k in keys:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(k)
+    return d
+
+
+def _shared(shared: dict, name: str, records: list, fn):
+    if name not in shared:
+        shared[name] = [fn(r) for r in records]
+    return shared[name]
+
+
+def _evidence_tally(record) -> dict:
+    items = _get(record, "evidence", "evidence_items") or []
+    tally = {"total": len(items)}
+    for item in items:
+        for key in ("completeness_state", "confidence"):
+            v = item.get(key)
+            if isinstance(v, str):
+                tally[v] = tally.get(v, 0) + 1
+    return tally
+
+
+def _ai(record) -> dict:
+    return record.get("ai_assistance") or {}
+
+
+def _decision_date(record) -> str:
+    gov = record.get("governance") or {}
+    stamp = _str(_get(gov, "final_signoff", "timestamp"))
+    if not stamp:
+        stamps = [a.get("timestamp") for a in gov.get("approvals") or [] if _str(a.get("timestamp"))]
+        stamp = max(stamps) if stamps else _get(record, "gate", "gate_date")
+    return _date_part(stamp)
+
+
+def _referenced_ids(record, pattern) -> str:
+    text = json.dumps(record, ensure_ascii=False)
+    seen = dict.fromkeys(pattern.findall(text))
+    return "|".join(seen)
+
+
+def _col(fn):
+    """Lift a per-record function into a column function."""
+    return lambda records, shared: [fn(r) for r in records]
+
+
+def _evidence_col(key):
+    def column(records, shared):
+        return [t.get(key, 0) for t in _shared(shared, "evidence", records, _evidence_tally)]
+
+    return column
+
+
+def _ai_col(fn):
+    def column(records, shared):
+        return [fn(ai) for ai in _shared(shared, "ai", records, _ai)]
+
+    return column
+
+
+def _time_to_decision(records, shared):
+    decided = _shared(shared, "decision_date", records, _decision_date)
+    out = []
+    for record, d in zip(records, decided):
+        start, end = _parse_date(record.get("created_at")), _parse_date(d)
+        out.append((end - start).days if start and end else "")
+    return out
+
+
+def _residual_risk_level(record) -> str:
+    levels = [r.get("severity") for r in _get(record, "risk_assessment", "key_risks") or []]
+    ranked = [SEVERITY_ORDER.index(v) for v in levels if v in SEVERITY_ORDER]
+    return SEVERITY_ORDER[max(ranked)] if ranked else ""
+
+
+def _benchmark_recorded(record) -> str:
+    posture = record.get("risk_posture")
+    return _yes_no(isinstance(posture, dict) and posture.get("benchmark_basis"))
+
+
+def _governance_complete(record) -> str:
+    gov = record.get("governance") or {}
+    return _yes_no(gov.get("decision_owner") and gov.get("approvers") and gov.get("final_signoff"))
+
+
+def _override_rate(ai) -> str:
+    if not ai.get("used"):
+        return "0.00"
+    reviewed = len(ai.get("artifacts") or []) or 1
+    return f"{len(ai.get('human_override_log') or []) / reviewed:.2f}"
+
+
+def _override_categories(ai) -> str:
+    cats = dict.fromkeys(o.get("category") for o in ai.get("human_override_log") or [] if _str(o.get("category")))
+    return "|".join(cats)
+
+
+def _confidence_band(ai) -> str:
+    if not ai.get("used"):
+        return ""
+    return _str(_get(ai, "ai_risk_assessment", "confidence_band")) or _str(ai.get("confidence_band"))
+
+
+COLUMNS = {
+    "decision_id": _col(lambda r: _str(r.get("decision_id"))),
+    "program_id": _col(lambda r: _str(_get(r, "program_context", "program_id"))),
+    "gate_name": _col(lambda r: _str(_get(r, "gate", "gate_name"))),
+    "decision_category": _col(lambda r: _str(r.get("decision_category"))),
+    "decision_outcome": _col(lambda r: _str(_get(r, "decision_outcome", "outcome"))),
+    "decision_status": _col(lambda r: _str(r.get("status"))),
+    "decision_date": lambda records, shared: _shared(shared, "decision_date", records, _decision_date),
+    "decision_deadline": _col(lambda r: _date_part(_get(r, "gate", "decision_deadline"))),
+    "options_count": _col(lambda r: len(r.get("options_considered") or [])),
+    "selected_option_id_present": _col(lambda r: _yes_no(_get(r, "decision_outcome", "selected_option_id"))),
+    "evidence_items_total": _evidence_col("total"),
+    "evidence_complete_count": _evidence_col("complete"),
+    "evidence_partial_count": _evidence_col("partial"),
+    "evidence_placeholder_count": _evidence_col("placeholder"),
+    "evidence_high_count": _evidence_col("high"),
+    "evidence_medium_count": _evidence_col("medium"),
+    "evidence_low_count": _evidence_col("low"),
+    "evidence_completeness_state": _col(lambda r: _str(_get(r, "evidence_completeness", "state"))),
+    "propagation_declared": _col(lambda r: _yes_no(r.get("propagation_required"))),
+    "residual_risk_level": _col(_residual_risk_level),
+    "residual_risk_statement_present": _col(
+        lambda r: _yes_no((_get(r, "risk_assessment", "residual_risk_statement") or "").strip())
+    ),
+    "risk_benchmark_basis_recorded": _col(_benchmark_recorded),
+    "governance_complete": _col(_governance_complete),
+    "decision_owner_recorded": _col(lambda r: _yes_no(_get(r, "governance", "decision_owner"))),
+    "approver_count": _col(lambda r: len(_get(r, "governance", "approvers") or [])),
+    "authority_scope_recorded": _col(lambda r: _yes_no(_get(r, "governance", "authority_scope"))),
+    "escalation_path_recorded": _col(lambda r: _yes_no(_get(r, "governance", "escalation_path"))),
+    "time_to_decision_days": _time_to_decision,
+    "gap_ids": _col(lambda r: _referenced_ids(r, GAP_ID_RE)),
+    "backlog_ids": _col(lambda r: _referenced_ids(r, BACKLOG_ID_RE)),
+    "ai_used": _ai_col(lambda ai: _yes_no(ai.get("used"))),
+    "ai_tool_name": _ai_col(lambda ai: _str(ai.get("tool_name")) if ai.get("used") else ""),
+    "ai_tool_purpose": _ai_col(lambda ai: _str(ai.get("tool_purpose")) if ai.get("used") else ""),
+    "ai_human_review_tiers": _ai_col(
+        lambda ai: ";".join(dict.fromkeys(_str(h.get("tier")) for h in ai.get("human_review") or [])) if ai.get("used") else ""
+    ),
+    "ai_confidence_band": _ai_col(_confidence_band),
+    "ai_override_rate": _ai_col(_override_rate),
+    "ai_override_categories": _ai_col(_override_categories),
+    # Human review judgments: never derived.
+    "missed_risk_notes": _col(lambda r: ""),
+    "reviewer_confidence_rating": _col(lambda r: ""),
+    "reviewer_comments": _col(lambda r: ""),
+}
+COLUMN_NAMES = list(COLUMNS)
+
+# Nested values the column derivations read, with the type they need:
+# (path, container type, item type for lists). Missing / null values are fine.
+SHAPE = (
+    (("program_context",), dict, None),
+    (("gate",), dict, None),
+    (("decision_outcome",), dict, None),
+    (("options_considered",), list, None),
+    (("evidence",), dict, None),
+    (("evidence", "evidence_items"), list, dict),
+    (("evidence_completeness",), dict, None),
+    (("risk_assessment",), dict, None),
+    (("risk_assessment", "key_risks"), list, dict),
+    (("risk_assessment", "residual_risk_statement"), str, None),
+    (("governance",), dict, None),
+    (("governance", "approvers"), list, None),
+    (("governance", "approvals"), list, dict),
+    (("governance", "final_signoff"), dict, None),
+    (("ai_assistance",), dict, None),
+    (("ai_assistance", "artifacts"), list, None),
+    (("ai_assistance", "human_review"), list, dict),
+    (("ai_assistance", "human_override_log"), list, dict),
+    (("ai_assistance", "ai_risk_assessment"), dict, None),
+)
+
+
+def shape_problem(record: dict) -> str | None:
+    """The first nested value the columns cannot read (e.g. governance is a string), or None."""
+    for path, container, item_type in SHAPE:
+        value = _get(record, *path)
+        if value is None:
+            continue
+        name = ".".join(path)
+        if not isinstance(value, container):
+            return f"{name} must be {container.__name__}, got {type(value).__name__}"
+        if item_type is not None:
+            for i, item in enumerate(value):
+                if not isinstance(item, item_type):
+                    return f"{name}[{i}] must be {item_type.__name__}, got {type(item).__name__}"
+    return None
+
+
+def extract_batch(records: list) -> list[list]:
+    """Compute every column over a batch of records; returns rows."""
+    shared: dict = {}
+    columns = [COLUMNS[name](records, shared) for name in COLUMN_NAMES]
+    return [list(row) for row in zip(*columns)]
+
+
+def extract_rows(records: list) -> list:
+    """
+    extract_batch, isolating failures: if the batch raises, each record is
+    extracted on its own and a record that still fails gets (None, error)
+    instead of a row. Returns (row, error) per record.
+    """
+    try:
+        return [(row, None) for row in extract_batch(records)]
+    except Exception:
+        pass
+    out = []
+    for record in records:
+        try:
+            out.append((extract_batch([record])[0], None))
+        except Exception as e:
+            out.append((None, f"{type(e).__name__}: {e}"))
+    return out
+
+
+# -----------------------------
+# Outputs
+# -----------------------------
+
+def output_paths(prefix: Path) -> dict:
+    return {
+        "csv": prefix.with_name(prefix.name + ".csv"),
+        "columnar": prefix.with_name(prefix.name + ".columns.jsonl.gz"),
+        "manifest": prefix.with_name(prefix.name + ".manifest.json"),
+    }
+
+
+def load_manifest(path: Path) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if manifest.get("version") != EXTRACT_VERSION or manifest.get("columns") != COLUMN_NAMES:
+        return {}
+    return manifest
+
+
+def write_manifest(path: Path, manifest: dict) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def write_csv(path: Path, rows: list, append: bool) -> None:
+    with path.open("a" if append else "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        if not append:
+            writer.writerow(COLUMN_NAMES)
+        writer.writerows(rows)
+
+
+def write_columnar(path: Path, rows: list, append: bool, group_size: int) -> None:
+    """Write rows as column-oriented row groups; appending adds a new gzip member."""
+    with gzip.open(path, "at" if append else "wt", encoding="utf-8") as f:
+        for start in range(0, len(rows), group_size):
+            group = rows[start:start + group_size]
+            columns = {name: [row[i] for row in group] for i, name in enumerate(COLUMN_NAMES)}
+            f.write(json.dumps({"columns": columns}, separators=(",", ":")) + "\n")
+
+
+def read_columnar(path: Path) -> dict:
+    """Read a column store back into {column: [values]} (all row groups concatenated)."""
+    out: dict = {name: [] for name in COLUMN_NAMES}
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            for name, values in json.loads(line)["columns"].items():
+                out.setdefault(name, []).extend(values)
+    return out
+
+
+# -----------------------------
+# Entry point
+# -----------------------------
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="build_decision_gate_extract.py",
+        description="Build the Decision Gate Extract (CSV + compressed column store) from RGDS decision logs.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("paths", nargs="*", help="Directories, files, or glob patterns. Default: examples/")
+    p.add_argument(
+        "--output",
+        type=str,
+        default=str(DEFAULT_OUTPUT),
+        help="Output path prefix (.csv / .columns.jsonl.gz / .manifest.json are appended).\nDefault: build/decision-gate-extract",
+    )
+    p.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=f"Records per batch. Default: {DEFAULT_BATCH_SIZE}")
+    p.add_argument("--full", action="store_true", help="Ignore the manifest and re-extract every record.")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.batch_size < 1:
+        print("[ERROR] --batch-size must be at least 1")
+        sys.exit(2)
+
+    outputs = output_paths(Path(args.output).resolve())
+    outputs["csv"].parent.mkdir(parents=True, exist_ok=True)
+
+    inputs = collect_inputs(args.paths)
+    if not inputs:
+        print("[ERROR] No decision log JSON files found.")
+        sys.exit(2)
+
+    manifest = {} if args.full else load_manifest(outputs["manifest"])
+    if not (outputs["csv"].exists() and outputs["columnar"].exists()):
+        manifest = {}
+    old_files: dict = manifest.get("files", {})
+    old_order: list = manifest.get("order", [])
+
+    files: dict = {}
+    changed: list = []
+    skipped = 0
+    for _, path in inputs:
+        key = str(path)
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError as e:
+            print(f"[WARN] Skipped unreadable file: {path}\n  {e}")
+            skipped += 1
+            continue
+        prior = old_files.get(key)
+        if prior and prior["hash"] == digest:
+            files[key] = prior
+        else:
+            changed.append((key, digest, path))
+
+    extracted = 0
+    for start in range(0, len(changed), args.batch_size):
+        batch, keys = [], []
+        for key, digest, path in changed[start:start + args.batch_size]:
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+            except Exception as e:
+                print(f"[WARN] Skipped unreadable JSON: {path}\n  {e}")
+                skipped += 1
+                continue
+            if not isinstance(record, dict):
+                print(f"[WARN] Skipped non-object JSON: {path}")
+                skipped += 1
+                continue
+            problem = shape_problem(record)
+            if problem:
+                print(f"[WARN] Skipped malformed record: {path}\n  {problem}")
+                skipped += 1
+                continue
+            batch.append(record)
+            keys.append((key, digest, path))
+        for (key, digest, path), (row, error) in zip(keys, extract_rows(batch)):
+            if error:
+                print(f"[WARN] Skipped malformed record: {path}\n  {error}")
+                skipped += 1
+                continue
+            files[key] = {"hash": digest, "row": row}
+            extracted += 1
+
+    # Append only when every previously extracted file is still present and unchanged.
+    unchanged_prefix = all(k in files and files[k]["hash"] == old_files[k]["hash"] for k in old_order)
+    new_keys = [k for k in sorted(files) if k not in old_files]
+    append = bool(old_order) and unchanged_prefix and len(old_order) + len(new_keys) == len(files)
+
+    if append:
+        order = old_order + new_keys
+        rows = [files[k]["row"] for k in new_keys]
+    else:
+        order = sorted(files)
+        rows = [files[k]["row"] for k in order]
+
+    if rows or not append:
+        write_csv(outputs["csv"], rows, append)
+        write_columnar(outputs["columnar"], rows, append, args.batch_size)
+    write_manifest(outputs["manifest"], {"version": EXTRACT_VERSION, "columns": COLUMN_NAMES, "order": order, "files": files})
+
+    mode = "appended" if append else "written"
+    print(
+        f"[PASS] Decision Gate Extract {mode}: {len(rows)} row(s) {mode}, {len(order)} total "
+        f"({extracted} extracted, {len(files) - extracted} reused)"
+    )
+    print(f"  CSV:      {outputs['csv']}")
+    print(f"  Columnar: {outputs['columnar']}")
+    sys.exit(1 if skipped else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+RGDS Traceability Script — build_traceability_matrix.py
+
+Purpose
+-------
+Generates the requirement -> gap -> backlog -> decision matrix from the
+sources it is maintained from by hand today, and flags every broken link:
+
+    evaluation/ind-requirements-gap-log.md       IND-GAP rows: requirement, linked backlog items
+    backlog/ind-aligned-backlog.md               backlog items: status, requirement(s), files
+    evaluation/requirements-traceability-matrix.md
+                                                 requirement descriptions and artifacts
+                                                 (the hand-maintained RTM, checked for drift)
+    evaluation/scorecard-template.csv            per-decision gap_ids / backlog_ids
+    decision log corpus (default: examples/)     IND-GAP / backlog IDs cited in each record
+
+The generated matrix is derived, read-only output. The gap log, backlog and
+decision logs remain authoritative.
+
+How it works
+------------
+- Each Markdown / CSV source is parsed into a structured table once and
+  cached in the manifest under its content hash; an unchanged source is not
+  re-parsed. Decision records are likewise cached per file hash (only the
+  decision_id, outcome, status and cited IDs are kept).
+- The tables are joined on dictionaries keyed by gap, backlog and
+  requirement ID (hash joins; no source is scanned twice).
+- Every matrix row stores a signature of its inputs; a row is recomputed
+  only when one of its gaps, backlog items, RTM row or decision links
+  changed, and reused from the manifest otherwise.
+
+Broken links
+------------
+gap_without_backlog   a gap links no backlog item (gap log traceability rule)
+unknown_backlog       a gap, decision or scorecard row cites a backlog ID the backlog does not define
+unknown_gap           a decision or scorecard row cites a gap ID the gap log does not define
+bad_anchor            a gap's backlog link points at an anchor no backlog heading produces
+unknown_requirement   a backlog item lists a requirement no gap or RTM row defines
+missing_file          a backlog item or RTM artifact names a file that does not exist
+unknown_decision      a scorecard row names a decision_id that is not in the corpus
+rtm_drift             the hand-maintained RTM lists other gaps / backlog items than the gap log implies
+
+Outputs
+-------
+    <prefix>.md              Markdown matrix + broken-link list
+    <prefix>.json            rows and issues
+    <prefix>.manifest.json   parsed sources, per-file decision rows, row signatures
+
+Typical usage
+-------------
+    python3 scripts/build_traceability_matrix.py
+    python3 scripts/build_traceability_matrix.py path/to/corpus --output build/traceability/rtm
+    python3 scripts/build_traceability_matrix.py --full   # ignore the manifest
+
+Exit codes
+----------
+0 — Matrix written, no broken links
+1 — Matrix written, broken links found (or some decision files were unreadable)
+2 — Script/configuration error
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from build_decision_gate_extract import BACKLOG_ID_RE, GAP_ID_RE
+from corpus_inputs import collect_inputs
+
+TRACE_VERSION = "2"  # bump when parsing or row derivation changes (invalidates manifests)
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUTPUT = ROOT / "build" / "traceability" / "requirements-traceability-matrix"
+DEFAULT_GAP_LOG = ROOT / "evaluation" / "ind-requirements-gap-log.md"
+DEFAULT_BACKLOG = ROOT / "backlog" / "ind-aligned-backlog.md"
+DEFAULT_RTM = ROOT / "evaluation" / "requirements-traceability-matrix.md"
+DEFAULT_SCORECARD = ROOT / "evaluation" / "scorecard-template.csv"
+
+REQUIREMENT_ID_RE = re.compile(r"\bIND-[A-Z]+(?:-[A-Z]+)*-\d+\b")
+LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+BACKLOG_HEADING_RE = re.compile(r"^##\s+(P\d-BL-\d+)\b(.*)$")
+
+
+# -----------------------------
+# Markdown / CSV parsing
+# -----------------------------
+
+def _cells(line: str) -> list[str]:
+    return [c.strip() for c in line.strip().strip("|").split("|")]
+
+
+def markdown_tables(text: str) -> list[tuple[list[str], list[list[str]]]]:
+    """Every pipe table in `text` as (header cells, body rows)."""
+    tables, lines = [], text.splitlines()
+    i = 0
+    while i < len(lines) - 1:
+        if lines[i].lstrip().startswith("|") and re.match(r"^\s*\|[\s:|-]+\|\s*$", lines[i + 1]):
+            header, body = _cells(lines[i]), []
+            i += 2
+            while i < len(lines) and lines[i].lstrip().startswith("|"):
+                body.append(_cells(lines[i]))
+                i += 1
+            tables.append((header, body))
+        else:
+            i += 1
+    return tables
+
+
+def _table_with(text: str, column: str) -> tuple[list[str], list[list[str]]]:
+    for header, body in markdown_tables(text):
+        if column in header:
+            return header, body
+    raise ValueError(f"no table with a '{column}' column")
+
+
+def github_anchor(heading: str) -> str:
+    """The anchor GitHub generates for a Markdown heading."""
+    text = heading.strip().lower()
+    text = re.sub(r"[^\w\- ]", "", text)
+    return text.replace(" ", "-")
+
+
+def parse_gap_log(text: str) -> dict:
+    """{gap_id: {requirement_id, gap, backlog: [{id, target}]}} from the gap table."""
+    header, body = _table_with(text, "Gap ID")
+    gaps = {}
+    for cells in body:
+        row = dict(zip(header, cells))
+        gap_id = row.get("Gap ID", "")
+        if not gap_id:
+            continue
+        links = LINK_RE.findall(row.get("Linked Backlog Item", ""))
+        backlog = [{"id": label.strip(), "target": target} for label, target in links]
+        # Bare IDs without a link still count as a (link-less) reference.
+        linked = {b["id"] for b in backlog}
+        backlog += [{"id": b, "target": None} for b in BACKLOG_ID_RE.findall(row.get("Linked Backlog Item", "")) if b not in linked]
+        gaps[gap_id] = {
+            "requirement_id": row.get("Requirement ID", ""),
+            "gap": row.get("Observed Gap", ""),
+            "backlog": backlog,
+        }
+    return gaps
+
+
+def parse_backlog(text: str) -> dict:
+    """{backlog_id: {title, anchor, status, requirements, files}} from '## P0-BL-001 — ...' sections."""
+    items: dict = {}
+    current = None
+    in_files = False
+    for line in text.splitlines():
+        m = BACKLOG_HEADING_RE.match(line)
+        if m:
+            heading = line[2:].strip()
+            current = items[m.group(1)] = {
+                "title": m.group(2).strip(" —-"),
+                "anchor": github_anchor(heading),
+                "status": "",
+                "requirements": [],
+                "files": [],
+            }
+            in_files = False
+            continue
+        if current is None:
+            continue
+        if line.startswith("#"):
+            current, in_files = None, False
+            continue
+        stripped = line.strip()
+        if stripped.startswith("- Status:"):
+            current["status"] = stripped.partition(":")[2].strip()
+        elif stripped.startswith("- Requirement"):
+            current["requirements"] = REQUIREMENT_ID_RE.findall(stripped)
+        elif stripped == "- Files:":
+            in_files = True
+            continue
+        elif in_files and line.startswith("  ") and stripped.startswith("- "):
+            current["files"].append(stripped[2:].strip().strip("`"))
+            continue
+        in_files = False
+    return items
+
+
+def parse_rtm(text: str) -> dict:
+    """{requirement_id: {description, gap_ids, backlog_ids, artifacts, status}} from the hand-maintained RTM."""
+    header, body = _table_with(text, "Requirement ID")
+    rows = {}
+    for cells in body:
+        row = dict(zip(header, cells))
+        ids = REQUIREMENT_ID_RE.findall(row.get("Requirement ID", ""))
+        if not ids:
+            continue
+        rows[ids[0]] = {
+            "description": row.get("Requirement Description", ""),
+            "gap_ids": GAP_ID_RE.findall(row.get("Gap ID(s)", "")),
+            "backlog_ids": BACKLOG_ID_RE.findall(row.get("Backlog Item ID(s)", "")),
+            "artifacts": [target for _, target in LINK_RE.findall(row.get("RGDS Artifact(s)", ""))],
+            "status": row.get("Status", ""),
+        }
+    return rows
+
+
+def parse_scorecard(text: str) -> dict:
+    """{decision_id: {gap_ids, backlog_ids}} from the scorecard CSV."""
+    out = {}
+    for row in csv.DictReader(io.StringIO(text)):
+        decision_id = (row.get("decision_id") or "").strip()
+        if decision_id:
+            out[decision_id] = {
+                "gap_ids": GAP_ID_RE.findall(row.get("gap_ids") or ""),
+                "backlog_ids": BACKLOG_ID_RE.findall(row.get("backlog_ids") or ""),
+            }
+    return out
+
+
+SOURCES = {
+    "gap_log": parse_gap_log,
+    "backlog": parse_backlog,
+    "rtm": parse_rtm,
+    "scorecard": parse_scorecard,
+}
+
+
+def _get(d, *keys):
+    for k in keys:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(k)
+    return d
+
+
+def _str(value):
+    return value if isinstance(value, str) else None
+
+
+def decision_row(record: dict) -> dict:
+    """What the matrix needs from one decision record."""
+    text = json.dumps(record, ensure_ascii=False)
+    return {
+        "decision_id": _str(record.get("decision_id")),
+        "outcome": _str(_get(record, "decision_outcome", "outcome")),
+        "status": _str(record.get("status")),
+        "gap_ids": list(dict.fromkeys(GAP_ID_RE.findall(text))),
+        "backlog_ids": list(dict.fromkeys(BACKLOG_ID_RE.findall(text))),
+    }
+
+
+# -----------------------------
+# Join
+# -----------------------------
+
+def _issue(issues: list, kind: str, where: str, detail: str, requirement: str | None = None) -> None:
+    issues.append({"kind": kind, "where": where, "detail": detail, "requirement_id": requirement})
+
+
+def join(tables: dict, paths: dict, decisions: dict) -> tuple[dict, list]:
+    """
+    Join the parsed sources and decision rows into per-requirement inputs.
+
+    Returns ({requirement_id: inputs}, issues). `inputs` holds everything a
+    matrix row is derived from, so its signature changes exactly when the row can.
+    """
+    gaps, backlog = tables["gap_log"], tables["backlog"]
+    rtm, scorecard = tables.get("rtm") or {}, tables.get("scorecard") or {}
+    issues: list = []
+
+    backlog_href = os.path.relpath(paths["backlog"], paths["gap_log"].parent).replace(os.sep, "/")
+    backlog_reqs: dict = {}  # backlog_id -> requirements it serves (its own list + linking gaps)
+    for backlog_id, item in backlog.items():
+        backlog_reqs.setdefault(backlog_id, set()).update(item["requirements"])
+        for f in item["files"]:
+            if not (ROOT / f.rstrip("/")).exists():
+                _issue(issues, "missing_file", backlog_id, f"lists {f}, which does not exist")
+    for gap_id, gap in gaps.items():
+        if not gap["backlog"]:
+            _issue(issues, "gap_without_backlog", gap_id, "links no backlog item", gap["requirement_id"])
+        for link in gap["backlog"]:
+            item = backlog.get(link["id"])
+            if item is None:
+                _issue(issues, "unknown_backlog", gap_id, f"links {link['id']}, which the backlog does not define", gap["requirement_id"])
+                continue
+            backlog_reqs[link["id"]].add(gap["requirement_id"])
+            if link["target"]:
+                href, _, anchor = link["target"].partition("#")
+                if href and href != backlog_href or anchor and anchor != item["anchor"]:
+                    _issue(
+                        issues,
+                        "bad_anchor",
+                        gap_id,
+                        f"links {link['target']}; expected {backlog_href}#{item['anchor']}",
+                        gap["requirement_id"],
+                    )
+
+    known_reqs = {g["requirement_id"] for g in gaps.values() if g["requirement_id"]} | set(rtm)
+    for backlog_id, item in backlog.items():
+        for req in item["requirements"]:
+            if req not in known_reqs:
+                _issue(issues, "unknown_requirement", backlog_id, f"lists {req}, which no gap or RTM row defines", req)
+    for req, row in rtm.items():
+        for target in row["artifacts"]:
+            if "://" not in target and not (paths["rtm"].parent / target.split("#")[0]).exists():
+                _issue(issues, "missing_file", req, f"RTM artifact {target} does not exist", req)
+
+    # Decision links: (decision_id, via, source) per gap / backlog ID.
+    links: dict = {}
+    summaries = {
+        row["decision_id"]: {"outcome": row["outcome"], "status": row["status"]} for row in decisions.values() if row["decision_id"]
+    }
+
+    def cite(decision_id: str, ids: list, source: str) -> None:
+        for ref in ids:
+            if ref.startswith("IND-GAP") and ref not in gaps:
+                _issue(issues, "unknown_gap", decision_id, f"{source} cites {ref}, which the gap log does not define")
+            elif not ref.startswith("IND-GAP") and ref not in backlog:
+                _issue(issues, "unknown_backlog", decision_id, f"{source} cites {ref}, which the backlog does not define")
+            else:
+                links.setdefault(ref, set()).add((decision_id, source))
+
+    for path in sorted(decisions):
+        row = decisions[path]
+        if row["decision_id"]:
+            cite(row["decision_id"], row["gap_ids"] + row["backlog_ids"], "record")
+    for decision_id in sorted(scorecard):
+        row = scorecard[decision_id]
+        if decision_id not in summaries:
+            _issue(issues, "unknown_decision", decision_id, "scorecard row is not in the decision corpus")
+        cite(decision_id, row["gap_ids"] + row["backlog_ids"], "scorecard")
+
+    requirements = sorted(known_reqs | {r for reqs in backlog_reqs.values() for r in reqs if r})
+    inputs: dict = {}
+    for req in requirements:
+        gap_ids = sorted(g for g, gap in gaps.items() if gap["requirement_id"] == req)
+        backlog_ids = sorted(b for b, reqs in backlog_reqs.items() if req in reqs)
+        cited = sorted({(d, ref, src) for ref in gap_ids + backlog_ids for d, src in links.get(ref, ())})
+        inputs[req] = {
+            "rtm": rtm.get(req),
+            "gaps": {g: gaps[g] for g in gap_ids},
+            "backlog": {b: backlog[b] for b in backlog_ids},
+            "decisions": [
+                {"decision_id": d, "via": ref, "source": src, **summaries.get(d, {"outcome": None, "status": None})}
+                for d, ref, src in cited
+            ],
+        }
+        if req in rtm:
+            implied_backlog = sorted({link["id"] for g in gap_ids for link in gaps[g]["backlog"]} | set(backlog_ids))
+            for what, listed, implied in (("gaps", rtm[req]["gap_ids"], gap_ids), ("backlog items", rtm[req]["backlog_ids"], implied_backlog)):
+                if sorted(set(listed)) != sorted(set(implied)):
+                    _issue(
+                        issues,
+                        "rtm_drift",
+                        req,
+                        f"RTM lists {what} {', '.join(listed) or '(none)'}; sources give {', '.join(implied) or '(none)'}",
+                        req,
+                    )
+    return inputs, issues
+
+
+def signature(inputs: dict) -> str:
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def matrix_row(req: str, inputs: dict) -> dict:
+    rtm = inputs["rtm"] or {}
+    artifacts = list(dict.fromkeys(rtm.get("artifacts", []) + [f for b in inputs["backlog"].values() for f in b["files"]]))
+    return {
+        "requirement_id": req,
+        "description": rtm.get("description", ""),
+        "gap_ids": list(inputs["gaps"]),
+        "backlog": [{"id": b, "status": item["status"], "title": item["title"]} for b, item in inputs["backlog"].items()],
+        "decisions": sorted({d["decision_id"] for d in inputs["decisions"]}),
+        "decision_links": inputs["decisions"],
+        "artifacts": artifacts,
+        "rtm_status": rtm.get("status", ""),
+    }
+
+
+# -----------------------------
+# Outputs
+# -----------------------------
+
+def output_paths(prefix: Path) -> dict:
+    return {
+        "md": prefix.with_name(prefix.name + ".md"),
+        "json": prefix.with_name(prefix.name + ".json"),
+        "manifest": prefix.with_name(prefix.name + ".manifest.json"),
+    }
+
+
+def load_manifest(path: Path) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return manifest if manifest.get("version") == TRACE_VERSION else {}
+
+
+def write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def render_markdown(rows: list, issues: list) -> str:
+    def cell(values: list) -> str:
+        return "<br>".join(values) if values else "—"
+
+    lines = [
+        "# Requirements Traceability Matrix (generated)",
+        "",
+        "Generated by `scripts/build_traceability_matrix.py` from the gap log, backlog, RTM,",
+        "scorecard and decision logs. Do not edit; fix the sources and regenerate.",
+        "",
+        "| Requirement ID | Requirement Description | Gap ID(s) | Backlog Item(s) | Decision(s) | Issues |",
+        "|----------------|-------------------------|-----------|-----------------|-------------|--------|",
+    ]
+    by_req: dict = {}
+    for issue in issues:
+        if issue["requirement_id"]:
+            by_req[issue["requirement_id"]] = by_req.get(issue["requirement_id"], 0) + 1
+    for row in rows:
+        backlog = [f"{b['id']} ({b['status'] or '?'})" for b in row["backlog"]]
+        lines.append(
+            f"| **{row['requirement_id']}** | {row['description'] or '—'} | {cell(row['gap_ids'])} | {cell(backlog)} "
+            f"| {cell(row['decisions'])} | {by_req.get(row['requirement_id'], 0) or '—'} |"
+        )
+    lines += ["", "## Broken links", ""]
+    if not issues:
+        lines.append("None.")
+    for issue in issues:
+        lines.append(f"- `{issue['kind']}` **{issue['where']}**: {issue['detail']}")
+    return "\n".join(lines) + "\n"
+
+
+# -----------------------------
+# Entry point
+# -----------------------------
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="build_traceability_matrix.py",
+        description="Generate the requirement -> gap -> backlog -> decision traceability matrix and flag broken links.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("paths", nargs="*", help="Decision log directories, files, or glob patterns. Default: examples/")
+    p.add_argument("--gap-log", dest="gap_log", type=str, default=str(DEFAULT_GAP_LOG), help="Default: evaluation/ind-requirements-gap-log.md")
+    p.add_argument("--backlog", type=str, default=str(DEFAULT_BACKLOG), help="Default: backlog/ind-aligned-backlog.md")
+    p.add_argument("--rtm", type=str, default=str(DEFAULT_RTM), help="Hand-maintained RTM ('' to skip). Default: evaluation/requirements-traceability-matrix.md")
+    p.add_argument("--scorecard", type=str, default=str(DEFAULT_SCORECARD), help="Scorecard CSV ('' to skip). Default: evaluation/scorecard-template.csv")
+    p.add_argument(
+        "--output",
+        type=str,
+        default=str(DEFAULT_OUTPUT),
+        help="Output path prefix (.md / .json / .manifest.json are appended).\nDefault: build/traceability/requirements-traceability-matrix",
+    )
+    p.add_argument("--full", action="store_true", help="Ignore the manifest: re-parse every source and recompute every row.")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    outputs = output_paths(Path(args.output).resolve())
+    outputs["md"].parent.mkdir(parents=True, exist_ok=True)
+
+    manifest = {} if args.full else load_manifest(outputs["manifest"])
+    old_sources: dict = manifest.get("sources", {})
+    old_decisions: dict = manifest.get("decisions", {})
+    old_rows: dict = manifest.get("rows", {})
+
+    source_paths = {"gap_log": args.gap_log, "backlog": args.backlog, "rtm": args.rtm, "scorecard": args.scorecard}
+    paths, tables, sources, parsed = {}, {}, {}, 0
+    for name, value in source_paths.items():
+        if not value:
+            if name in ("gap_log", "backlog"):
+                print(f"[ERROR] --{name.replace('_', '-')} is required")
+                sys.exit(2)
+            continue
+        path = paths[name] = Path(value).resolve()
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            print(f"[ERROR] Cannot read {name.replace('_', ' ')}: {path}\n  {e}")
+            sys.exit(2)
+        digest = hashlib.sha256(data).hexdigest()
+        prior = old_sources.get(name)
+        if prior and prior["hash"] == digest and prior["path"] == str(path):
+            tables[name] = prior["table"]
+        else:
+            try:
+                tables[name] = SOURCES[name](data.decode("utf-8"))
+            except (UnicodeDecodeError, ValueError) as e:
+                print(f"[ERROR] Cannot parse {path}\n  {e}")
+                sys.exit(2)
+            parsed += 1
+        sources[name] = {"path": str(path), "hash": digest, "table": tables[name]}
+
+    inputs_found = collect_inputs(args.paths)
+    if not inputs_found:
+        print("[ERROR] No decision log JSON files found.")
+        sys.exit(2)
+    decisions, skipped, extracted = {}, 0, 0
+    for _, path in inputs_found:
+        key = str(path)
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            print(f"[WARN] Skipped unreadable file: {path}\n  {e}")
+            skipped += 1
+            continue
+        digest = hashlib.sha256(data).hexdigest()
+        prior = old_decisions.get(key)
+        if prior and prior["hash"] == digest:
+            decisions[key] = prior
+            continue
+        try:
+            record = json.loads(data.decode("utf-8"))
+        except Exception as e:
+            print(f"[WARN] Skipped unreadable JSON: {path}\n  {e}")
+            skipped += 1
+            continue
+        if not isinstance(record, dict):
+            print(f"[WARN] Skipped non-object JSON: {path}")
+            skipped += 1
+            continue
+        decisions[key] = {"hash": digest, "row": decision_row(record)}
+        extracted += 1
+
+    inputs, issues = join(tables, paths, {k: v["row"] for k, v in decisions.items()})
+    rows, kept, recomputed = {}, 0, 0
+    for req, req_inputs in inputs.items():
+        sig = signature(req_inputs)
+        prior = old_rows.get(req)
+        if prior and prior["sig"] == sig:
+            rows[req] = prior
+            kept += 1
+        else:
+            rows[req] = {"sig": sig, "row": matrix_row(req, req_inputs)}
+            recomputed += 1
+
+    ordered = [rows[req]["row"] for req in sorted(rows)]
+    write_atomic(outputs["md"], render_markdown(ordered, issues))
+    write_atomic(outputs["json"], json.dumps({"rows": ordered, "issues": issues}, indent=2) + "\n")
+    write_atomic(
+        outputs["manifest"],
+        json.dumps({"version": TRACE_VERSION, "sources": sources, "decisions": decisions, "rows": rows}, separators=(",", ":")),
+    )
+
+    print(
+        f"[{'FAIL' if issues else 'PASS'}] Traceability matrix written: {len(ordered)} requirement(s), "
+        f"{sum(len(r['decisions']) for r in ordered)} decision link(s), {len(issues)} broken link(s)"
+    )
+    print(
+        f"  Sources: {parsed} parsed, {len(sources) - parsed} cached; decisions: {extracted} parsed, "
+        f"{len(decisions) - extracted} cached; rows: {recomputed} recomputed, {kept} reused"
+    )
+    for issue in issues:
+        print(f"  [{issue['kind']}] {issue['where']}: {issue['detail']}")
+    print(f"  Matrix: {outputs['md']}")
+    sys.exit(1 if issues or skipped else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+RGDS corpus integrity checks — corpus_checks.py
+
+Purpose
+-------
+semantic_checks() sees one record at a time. The checks here need the whole
+corpus: they build one in-memory graph of decision IDs and audit
+supersession links and report what no single record can show.
+
+Codes (stable once published, same convention as semantic_rules.py)
+-------------------------------------------------------------------
+E-CORPUS-001  decision_id appears in more than one file
+E-CORPUS-002  audit.supersedes / audit.superseded_by names a decision not in the corpus
+E-CORPUS-003  supersession links form a cycle
+E-CORPUS-004  a decision is superseded by more than one decision (forked chain)
+W-CORPUS-001  one-sided link: A.superseded_by=B but B.supersedes is not A (or vice versa)
+
+Complexity
+----------
+Every check is a dict lookup per link plus one iterative walk over the
+supersession graph (each node visited once), so the pass is O(N) in the
+number of records; nothing compares records pairwise. Output is linear
+too: every copy of a duplicated decision_id points at the first
+declaration only, and the first lists the other copies up to
+DUPLICATE_LABELS_SHOWN.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+E_CORPUS_001 = "E-CORPUS-001"
+E_CORPUS_002 = "E-CORPUS-002"
+E_CORPUS_003 = "E-CORPUS-003"
+E_CORPUS_004 = "E-CORPUS-004"
+W_CORPUS_001 = "W-CORPUS-001"
+
+# E-CORPUS-001 on the first declaration names at most this many of the other copies.
+DUPLICATE_LABELS_SHOWN = 5
+
+
+class Links(NamedTuple):
+    """The per-record facts the corpus pass needs (small enough to cache per file)."""
+
+    decision_id: str | None
+    supersedes: str | None
+    superseded_by: str | None
+
+
+def record_links(instance) -> Links:
+    """Extract decision_id and audit supersession links from one record."""
+    if not isinstance(instance, dict):
+        return Links(None, None, None)
+    audit = instance.get("audit")
+    audit = audit if isinstance(audit, dict) else {}
+
+    def text(v):
+        return v if isinstance(v, str) and v else None
+
+    return Links(text(instance.get("decision_id")), text(audit.get("supersedes")), text(audit.get("superseded_by")))
+
+
+def corpus_checks(records: Iterable[Tuple[str, Links]]) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Run the corpus-level checks over (label, Links) pairs.
+
+    Returns:
+        (errors, warnings) as (label, "<CODE>: <text>") pairs, grouped by
+        code and in corpus order within each code.
+    """
+    owners: Dict[str, List[str]] = {}  # decision_id -> labels declaring it
+    links: Dict[str, Links] = {}  # decision_id -> links of its first declaration
+    order: List[Tuple[str, Links]] = []
+
+    for label, lk in records:
+        order.append((label, lk))
+        if lk.decision_id is None:
+            continue
+        owners.setdefault(lk.decision_id, []).append(label)
+        links.setdefault(lk.decision_id, lk)
+
+    errs: List[Tuple[str, str]] = []
+    warns: List[Tuple[str, str]] = []
+
+    # Duplicates: O(copies) messages, never every copy against every other.
+    for did, labels in owners.items():
+        if len(labels) > 1:
+            first, others = labels[0], labels[1:]
+            shown = ", ".join(others[:DUPLICATE_LABELS_SHOWN])
+            more = f" (+{len(others) - DUPLICATE_LABELS_SHOWN} more)" if len(others) > DUPLICATE_LABELS_SHOWN else ""
+            errs.append((first, f"{E_CORPUS_001}: decision_id {did} is also declared in {len(others)} other file(s): {shown}{more}"))
+            for label in others:
+                errs.append((label, f"{E_CORPUS_001}: decision_id {did} is already declared in {first}"))
+
+    # Dangling references and one-sided links; build successor edges (older -> newer).
+    successors: Dict[str, set] = {}
+    dangling: List[Tuple[str, str]] = []
+    one_sided: List[Tuple[str, str]] = []
+    for label, lk in order:
+        did = lk.decision_id
+        if did is None:
+            continue
+        if lk.supersedes is not None:
+            successors.setdefault(lk.supersedes, set()).add(did)
+            target = links.get(lk.supersedes)
+            if target is None:
+                dangling.append((label, f"{E_CORPUS_002}: {did} audit.supersedes={lk.supersedes} is not in the corpus"))
+            elif target.superseded_by != did:
+                one_sided.append(
+                    (label, f"{W_CORPUS_001}: {did} supersedes {lk.supersedes}, but {lk.supersedes} audit.superseded_by={target.superseded_by}")
+                )
+        if lk.superseded_by is not None:
+            successors.setdefault(did, set()).add(lk.superseded_by)
+            target = links.get(lk.superseded_by)
+            if target is None:
+                dangling.append((label, f"{E_CORPUS_002}: {did} audit.superseded_by={lk.superseded_by} is not in the corpus"))
+            elif target.supersedes != did:
+                one_sided.append(
+                    (label, f"{W_CORPUS_001}: {did} is superseded_by {lk.superseded_by}, but {lk.superseded_by} audit.supersedes={target.supersedes}")
+                )
+    errs.extend(dangling)
+
+    # Cycles: iterative DFS; each node and edge is visited once.
+    label_of = {did: labels[0] for did, labels in owners.items()}
+    state: Dict[str, int] = {}  # position on the current path, or DONE
+    DONE = -1
+    for start in successors:
+        if start in state:
+            continue
+        path: List[str] = [start]
+        stack = [iter(sorted(successors.get(start, ())))]
+        state[start] = 0
+        while stack:
+            nxt = next(stack[-1], None)
+            if nxt is None:
+                state[path.pop()] = DONE
+                stack.pop()
+                continue
+            pos = state.get(nxt)
+            if pos is None:
+                state[nxt] = len(path)
+                path.append(nxt)
+                stack.append(iter(sorted(successors.get(nxt, ()))))
+            elif pos != DONE:
+                cycle = path[pos:] + [nxt]
+                errs.append((label_of.get(nxt, nxt), f"{E_CORPUS_003}: supersession cycle {' -> '.join(cycle)}"))
+
+    # Forks
+    for did, nexts in successors.items():
+        if len(nexts) > 1:
+            errs.append((label_of.get(did, did), f"{E_CORPUS_004}: {did} is superseded by more than one decision: {', '.join(sorted(nexts))}"))
+
+    warns.extend(one_sided)
+    return errs, warns
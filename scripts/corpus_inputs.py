@@ -0,0 +1,90 @@
+"""
+RGDS corpus input collection — corpus_inputs.py
+
+Shared by every script that walks a decision-log corpus (batch validation,
+extracts, indexes), so "which files are in the corpus" means the same thing
+everywhere.
+
+Targets may be:
+- a directory -> every *.json directly inside it (label relative to the directory)
+- a glob      -> every matching *.json file (label as matched; ** recurses)
+- a file      -> the file itself
+
+With archives=True (the validators), zip / tar archives are inputs too:
+
+- an archive            -> every *.json member (label "<archive>!<member>")
+- "archive!pattern"     -> members matching the glob after "!"
+- a glob matching archives -> their *.json members
+
+Members are read straight from the archive (see archive_inputs.py); the
+"path" of a member is an ArchiveMember, which supports the read_bytes() /
+read_text() calls the validators make on files.
+
+Results are (label, resolved path) pairs in deterministic sorted path order.
+"""
+
+import glob
+import sys
+from pathlib import Path
+
+from archive_inputs import DEFAULT_MEMBER_PATTERN, ArchiveMember, is_archive, iter_members, split_spec
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLES_DIR = ROOT / "examples"
+
+GLOB_CHARS = ("*", "?", "[")
+
+
+def _sort_key(item) -> tuple:
+    if isinstance(item, ArchiveMember):
+        return (item.archive, item.member)
+    return (item, "")
+
+
+def _add_archive(found: dict, archive: Path, pattern: str, label: str) -> None:
+    try:
+        for member in iter_members(archive, pattern):
+            found.setdefault(member, f"{label}!{member.member}")
+    except Exception as e:
+        print(f"[ERROR] Failed to read archive: {archive}\n  {e}")
+        sys.exit(2)
+
+
+def collect_inputs(targets: list[str], default_dir: Path = EXAMPLES_DIR, archives: bool = False) -> list[tuple[str, Path]]:
+    """
+    Expand CLI targets into (label, path) pairs in deterministic sorted order.
+
+    With no targets, falls back to `default_dir` (the canonical examples/ directory).
+    With archives=True, archive targets expand to ArchiveMember entries.
+    Exits with code 2 if a non-glob target does not exist (or an archive cannot be read).
+    """
+    if not targets:
+        targets = [str(default_dir)]
+
+    found: dict = {}
+    for target in targets:
+        spec = split_spec(target) if archives else None
+        if spec is not None:
+            _add_archive(found, spec[0], spec[1], target.partition("!")[0])
+            continue
+
+        if any(ch in target for ch in GLOB_CHARS):
+            for match in glob.glob(target, recursive=True):
+                p = Path(match)
+                if p.is_file() and p.suffix.lower() == ".json":
+                    found.setdefault(p.resolve(), match)
+                elif archives and p.is_file() and is_archive(p):
+                    _add_archive(found, p, DEFAULT_MEMBER_PATTERN, match)
+            continue
+
+        p = Path(target)
+        if p.is_dir():
+            for child in p.glob("*.json"):
+                found.setdefault(child.resolve(), child.relative_to(p).as_posix())
+        elif p.is_file():
+            found.setdefault(p.resolve(), target)
+        else:
+            print(f"[ERROR] Input not found: {target}")
+            sys.exit(2)
+
+    return [(found[p], p) for p in sorted(found, key=_sort_key)]
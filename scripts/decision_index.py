@@ -0,0 +1,869 @@
+#!/usr/bin/env python3
+"""
+RGDS Index Script — decision_index.py
+
+Purpose
+-------
+Maintains a persistent SQLite index over a decision-log corpus so cross-record
+questions are answered without opening and parsing every JSON file:
+
+- which decisions cite evidence E-001 (optionally from a given source_system)
+- what is the current head of a supersedes / superseded_by chain (audit)
+- all conditional_go decisions for program X (optionally by gate / status)
+- what is affected if an evidence item, a document (location_ref), a
+  dependency, a deliverable or a decision changes (impact_graph.py)
+- which conditions, actions and author-at-risk items are overdue, due
+  within N days, or owned by someone (re-entry tracking)
+- which decisions mention "audited draft", "stability" or a vendor name in
+  their title, question, options, conditions, evidence titles / quality
+  notes or change log, ranked (text_index.py)
+
+The index is derived, read-only tooling. The decision log JSON remains the
+authoritative record.
+
+Indexed fields
+--------------
+decision_id, program_context.program_id, gate.gate_name,
+decision_outcome.outcome, status, decision_category,
+evidence.evidence_items[].evidence_id / source_system / location_ref / title,
+audit.supersedes, audit.superseded_by, and the impact graph (impact_nodes /
+impact_edges: evidence, conditions, author_at_risk_items, actions,
+dependency_map, dependencies, propagation_required; see impact_graph.py),
+open obligations (below), and a full-text index (text_fields /
+text_postings; see text_index.py)
+
+Obligations
+-----------
+Every open dated commitment in a record, kept in due-date order on disk
+(a B-tree index on due_date), so overdue / due-soon / by-owner queries
+read only the index:
+
+- decision_outcome.conditions[]          (conditions have no status: open
+                                          for as long as the record lists them)
+- actions[]                              unless status is done / cancelled
+- author_at_risk_items[]                 unless status is done
+- evidence_completeness.expected_resolution_date   unless state is complete
+
+Records whose status is superseded or withdrawn contribute none. Because
+a changed file's rows are replaced, an item that is closed, re-dated or
+removed drops out (or moves) on the next build.
+
+Incremental updates
+-------------------
+Each indexed file is tracked by (mtime, size) and SHA-256. A build only
+re-reads files whose mtime/size changed, only re-parses files whose hash
+changed, and drops rows for files that disappeared from the corpus.
+Derived tables are registered in TABLES; every table is keyed by file_id so
+a changed file is replaced atomically across all of them.
+
+Typical usage
+-------------
+    python3 scripts/decision_index.py build [paths ...]
+    python3 scripts/decision_index.py query decisions --program PRG-241 --outcome conditional_go
+    python3 scripts/decision_index.py query evidence --evidence-id E-001 --source-system "Document Repository"
+    python3 scripts/decision_index.py query chain RGDS-DEC-0001
+    python3 scripts/decision_index.py query --format json impact --decision-id RGDS-DEC-0005 --evidence-id E-001
+    python3 scripts/decision_index.py query obligations --overdue --within 7
+    python3 scripts/decision_index.py query obligations --owner "CMC Lead" --as-of 2026-01-15
+    python3 scripts/decision_index.py query search '"audited draft" tox' --outcome conditional_go
+
+Exit codes
+----------
+0 — Success (query matched, or build completed)
+1 — Query matched nothing, or some files could not be indexed
+2 — Script/configuration error (missing index, bad arguments)
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import date, timedelta
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+from corpus_inputs import collect_inputs
+from impact_graph import graph, impact, normalize_dependency
+from text_index import search, text_rows
+
+INDEX_VERSION = "6"  # bump when TABLES change; an index with another version is rebuilt
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_DB = ROOT / ".rgds_cache" / "decision-index.sqlite"
+
+
+def _get(d: Any, *keys: str) -> Any:
+    for k in keys:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(k)
+    return d
+
+
+# -----------------------------
+# Derived tables
+# -----------------------------
+
+class Table(NamedTuple):
+    """
+    A derived table: DDL, column names, and rows(record) -> row tuples
+    (file_id is prepended).
+
+    Tables filled from one derivation (the impact graph's nodes and edges,
+    the text index's fields and postings) name it as `source`: _insert_file_rows computes source(record) once per
+    record and passes the result to each such table's rows() instead of
+    the record.
+    """
+
+    ddl: Tuple[str, ...]
+    columns: Tuple[str, ...]
+    rows: Callable[[Any], Iterable[tuple]]
+    source: Callable[[dict], Any] | None = None
+
+
+def _decision_rows(record: dict) -> Iterable[tuple]:
+    yield (
+        record.get("decision_id"),
+        record.get("decision_title"),
+        _get(record, "program_context", "program_id"),
+        _get(record, "gate", "gate_name"),
+        _get(record, "decision_outcome", "outcome"),
+        record.get("status"),
+        record.get("decision_category"),
+        _get(record, "audit", "supersedes"),
+        _get(record, "audit", "superseded_by"),
+    )
+
+
+def _evidence_rows(record: dict) -> Iterable[tuple]:
+    items = _get(record, "evidence", "evidence_items")
+    for item in items if isinstance(items, list) else ():
+        if isinstance(item, dict):
+            yield (
+                record.get("decision_id"),
+                item.get("evidence_id"),
+                item.get("source_system"),
+                item.get("location_ref"),
+                item.get("title"),
+            )
+
+
+CLOSED_DECISION_STATUSES = ("superseded", "withdrawn")
+CLOSED_ITEM_STATUSES = ("done", "cancelled")
+
+
+def _str(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _due_date(value: Any) -> str | None:
+    """An ISO date string, or None: anything else (a list, "next week") is indexed as undated."""
+    try:
+        date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return value
+
+
+def _owner(item: dict) -> Tuple[str | None, str | None]:
+    owner = item.get("owner")
+    if not isinstance(owner, dict):
+        return None, None
+    return _str(owner.get("name")), _str(owner.get("role"))
+
+
+def _obligation_rows(record: dict) -> Iterable[tuple]:
+    """(decision_id, program_id, outcome, kind, field, item_id, description, owner, owner_role, due_date, status)."""
+    if record.get("status") in CLOSED_DECISION_STATUSES:
+        return
+    head = (
+        _str(record.get("decision_id")),
+        _str(_get(record, "program_context", "program_id")),
+        _str(_get(record, "decision_outcome", "outcome")),
+    )
+
+    def items(path: Tuple[str, ...]) -> Iterable[Tuple[int, dict]]:
+        value = _get(record, *path)
+        return ((i, v) for i, v in enumerate(value) if isinstance(v, dict)) if isinstance(value, list) else ()
+
+    for i, c in items(("decision_outcome", "conditions")):
+        yield (*head, "condition", f"decision_outcome.conditions[{i}]", None, _str(c.get("condition")),
+               *_owner(c), _due_date(c.get("due_date")), None)
+    for i, a in items(("actions",)):
+        if a.get("status") not in CLOSED_ITEM_STATUSES:
+            yield (*head, "action", f"actions[{i}]", _str(a.get("action_id")), _str(a.get("description")),
+                   *_owner(a), _due_date(a.get("due_date")), _str(a.get("status")))
+    for i, a in items(("author_at_risk_items",)):
+        if a.get("status") not in CLOSED_ITEM_STATUSES:
+            yield (*head, "author_at_risk_item", f"author_at_risk_items[{i}]", _str(a.get("item_id")), _str(a.get("description")),
+                   *_owner(a), _due_date(a.get("due_date")), _str(a.get("status")))
+    completeness = record.get("evidence_completeness")
+    due = _due_date(completeness.get("expected_resolution_date")) if isinstance(completeness, dict) else None
+    if due and completeness.get("state") != "complete":
+        yield (*head, "evidence_completeness", "evidence_completeness.expected_resolution_date", None, _str(completeness.get("notes")),
+               None, None, due, _str(completeness.get("state")))
+
+
+TABLES: Dict[str, Table] = {
+    "decisions": Table(
+        ddl=(
+            "CREATE TABLE decisions (file_id INTEGER NOT NULL, decision_id TEXT, decision_title TEXT,"
+            " program_id TEXT, gate_name TEXT, outcome TEXT, status TEXT, decision_category TEXT,"
+            " supersedes TEXT, superseded_by TEXT)",
+            "CREATE INDEX decisions_file ON decisions(file_id)",
+            "CREATE INDEX decisions_id ON decisions(decision_id)",
+            "CREATE INDEX decisions_program ON decisions(program_id, outcome)",
+            "CREATE INDEX decisions_gate ON decisions(gate_name)",
+            "CREATE INDEX decisions_outcome ON decisions(outcome, status)",
+            "CREATE INDEX decisions_supersedes ON decisions(supersedes)",
+            "CREATE INDEX decisions_superseded_by ON decisions(superseded_by)",
+        ),
+        columns=(
+            "decision_id",
+            "decision_title",
+            "program_id",
+            "gate_name",
+            "outcome",
+            "status",
+            "decision_category",
+            "supersedes",
+            "superseded_by",
+        ),
+        rows=_decision_rows,
+    ),
+    "evidence": Table(
+        ddl=(
+            "CREATE TABLE evidence (file_id INTEGER NOT NULL, decision_id TEXT, evidence_id TEXT,"
+            " source_system TEXT, location_ref TEXT, title TEXT)",
+            "CREATE INDEX evidence_file ON evidence(file_id)",
+            "CREATE INDEX evidence_id ON evidence(evidence_id, source_system)",
+            "CREATE INDEX evidence_location ON evidence(location_ref)",
+        ),
+        columns=("decision_id", "evidence_id", "source_system", "location_ref", "title"),
+        rows=_evidence_rows,
+    ),
+    "obligations": Table(
+        ddl=(
+            "CREATE TABLE obligations (file_id INTEGER NOT NULL, decision_id TEXT, program_id TEXT, outcome TEXT,"
+            " kind TEXT, field TEXT, item_id TEXT, description TEXT, owner TEXT, owner_role TEXT, due_date TEXT, status TEXT)",
+            "CREATE INDEX obligations_file ON obligations(file_id)",
+            "CREATE INDEX obligations_due ON obligations(due_date)",
+            "CREATE INDEX obligations_owner ON obligations(owner COLLATE NOCASE, due_date)",
+        ),
+        columns=(
+            "decision_id",
+            "program_id",
+            "outcome",
+            "kind",
+            "field",
+            "item_id",
+            "description",
+            "owner",
+            "owner_role",
+            "due_date",
+            "status",
+        ),
+        rows=_obligation_rows,
+    ),
+    "impact_nodes": Table(
+        ddl=(
+            "CREATE TABLE impact_nodes (file_id INTEGER NOT NULL, node TEXT, kind TEXT, decision_id TEXT,"
+            " field TEXT, item_id TEXT, label TEXT)",
+            "CREATE INDEX impact_nodes_file ON impact_nodes(file_id)",
+            "CREATE INDEX impact_nodes_node ON impact_nodes(node)",
+        ),
+        columns=("node", "kind", "decision_id", "field", "item_id", "label"),
+        rows=itemgetter(0),
+        source=graph,
+    ),
+    "impact_edges": Table(
+        ddl=(
+            "CREATE TABLE impact_edges (file_id INTEGER NOT NULL, src TEXT, dst TEXT, kind TEXT, detail TEXT)",
+            "CREATE INDEX impact_edges_file ON impact_edges(file_id)",
+            "CREATE INDEX impact_edges_src ON impact_edges(src)",
+        ),
+        columns=("src", "dst", "kind", "detail"),
+        rows=itemgetter(1),
+        source=graph,
+    ),
+    "text_fields": Table(
+        ddl=(
+            "CREATE TABLE text_fields (file_id INTEGER NOT NULL, decision_id TEXT, field TEXT, path TEXT, length INTEGER, text TEXT)",
+            "CREATE INDEX text_fields_file ON text_fields(file_id, path)",
+        ),
+        columns=("decision_id", "field", "path", "length", "text"),
+        rows=itemgetter(0),
+        source=text_rows,
+    ),
+    "text_postings": Table(
+        ddl=(
+            "CREATE TABLE text_postings (file_id INTEGER NOT NULL, term TEXT, path TEXT, tf INTEGER)",
+            "CREATE INDEX text_postings_file ON text_postings(file_id)",
+            "CREATE INDEX text_postings_term ON text_postings(term)",
+        ),
+        columns=("term", "path", "tf"),
+        rows=itemgetter(1),
+        source=text_rows,
+    ),
+}
+
+BASE_DDL = (
+    "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)",
+    "CREATE TABLE files (file_id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL,"
+    " mtime_ns INTEGER, size INTEGER, hash TEXT)",
+)
+
+
+# -----------------------------
+# Build
+# -----------------------------
+
+def open_index(db_path: Path, create: bool) -> sqlite3.Connection:
+    """
+    Open (and if needed create or rebuild) the index database.
+
+    An index written by a different INDEX_VERSION is dropped and recreated.
+    """
+    if not create and not db_path.exists():
+        print(f"[ERROR] Index not found: {db_path} (run: decision_index.py build)")
+        sys.exit(2)
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    try:
+        version = conn.execute("SELECT value FROM meta WHERE key='index_version'").fetchone()
+    except sqlite3.DatabaseError:
+        version = None
+
+    if version is None or version[0] != INDEX_VERSION:
+        if not create:
+            print(f"[ERROR] Index {db_path} was built by another version; rebuild it.")
+            sys.exit(2)
+        existing = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+        with conn:
+            for name in existing:
+                conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+            for stmt in BASE_DDL:
+                conn.execute(stmt)
+            for table in TABLES.values():
+                for stmt in table.ddl:
+                    conn.execute(stmt)
+            conn.execute("INSERT INTO meta VALUES ('index_version', ?)", (INDEX_VERSION,))
+    return conn
+
+
+def _delete_file_rows(conn: sqlite3.Connection, file_id: int) -> None:
+    for name in TABLES:
+        conn.execute(f"DELETE FROM {name} WHERE file_id = ?", (file_id,))
+
+
+def _scalar(value: Any) -> Any:
+    """A value SQLite can store; records are not validated, so anything else (lists, objects) is stored as NULL."""
+    return value if value is None or isinstance(value, (str, int, float)) else None
+
+
+def _insert_file_rows(conn: sqlite3.Connection, file_id: int, record: dict) -> None:
+    derived: Dict[Callable, Any] = {}  # Table.source -> its result for this record
+    for name, table in TABLES.items():
+        if table.source is None:
+            rows = table.rows(record)
+        else:
+            if table.source not in derived:
+                derived[table.source] = table.source(record)
+            rows = table.rows(derived[table.source])
+        placeholders = ", ".join("?" for _ in range(len(table.columns) + 1))
+        conn.executemany(
+            f"INSERT INTO {name} (file_id, {', '.join(table.columns)}) VALUES ({placeholders})",
+            ((file_id, *map(_scalar, row)) for row in rows),
+        )
+
+
+def _index_file(conn: sqlite3.Connection, key: str, st: os.stat_result, digest: str, record: dict, prior) -> str:
+    """(Re)index one file; returns "updated" or "added"."""
+    if prior:
+        file_id = prior[0]
+        _delete_file_rows(conn, file_id)
+        conn.execute(
+            "UPDATE files SET mtime_ns = ?, size = ?, hash = ? WHERE file_id = ?",
+            (st.st_mtime_ns, st.st_size, digest, file_id),
+        )
+    else:
+        cur = conn.execute(
+            "INSERT INTO files (path, mtime_ns, size, hash) VALUES (?, ?, ?, ?)",
+            (key, st.st_mtime_ns, st.st_size, digest),
+        )
+        file_id = cur.lastrowid
+    _insert_file_rows(conn, file_id, record)
+    return "updated" if prior else "added"
+
+
+def build_index(conn: sqlite3.Connection, paths: List[Path]) -> Dict[str, int]:
+    """
+    Bring the index up to date with `paths` (the whole corpus).
+
+    Returns counts: unchanged, updated, added, removed, failed.
+    """
+    stats = {"unchanged": 0, "updated": 0, "added": 0, "removed": 0, "failed": 0}
+    known = {row[1]: row for row in conn.execute("SELECT file_id, path, mtime_ns, size, hash FROM files")}
+    seen = set()
+
+    with conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN")  # one transaction; each file is a savepoint within it
+        for path in paths:
+            key = str(path)
+            seen.add(key)
+            try:
+                st = path.stat()
+            except OSError as e:
+                print(f"[WARN] Skipped unreadable file: {path}\n  {e}")
+                stats["failed"] += 1
+                continue
+
+            prior = known.get(key)
+            if prior and prior[2] == st.st_mtime_ns and prior[3] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+
+            try:
+                data = path.read_bytes()
+            except OSError as e:
+                print(f"[WARN] Skipped unreadable file: {path}\n  {e}")
+                stats["failed"] += 1
+                continue
+            digest = hashlib.sha256(data).hexdigest()
+
+            if prior and prior[4] == digest:
+                # Touched but not changed: refresh the stat fingerprint only.
+                conn.execute("UPDATE files SET mtime_ns = ?, size = ? WHERE file_id = ?", (st.st_mtime_ns, st.st_size, prior[0]))
+                stats["unchanged"] += 1
+                continue
+
+            try:
+                record = json.loads(data.decode("utf-8"))
+            except Exception as e:
+                print(f"[WARN] Skipped unreadable JSON: {path}\n  {e}")
+                stats["failed"] += 1
+                if prior:
+                    _delete_file_rows(conn, prior[0])
+                    conn.execute("DELETE FROM files WHERE file_id = ?", (prior[0],))
+                continue
+            if not isinstance(record, dict):
+                print(f"[WARN] Skipped non-object JSON: {path}")
+                stats["failed"] += 1
+                if prior:
+                    _delete_file_rows(conn, prior[0])
+                    conn.execute("DELETE FROM files WHERE file_id = ?", (prior[0],))
+                continue
+
+            # A record the row builders cannot handle is rolled back on its own and
+            # counted as failed; it must not abort (and roll back) the whole build.
+            conn.execute("SAVEPOINT file_rows")
+            try:
+                stats[_index_file(conn, key, st, digest, record, prior)] += 1
+            except Exception as e:
+                conn.execute("ROLLBACK TO file_rows")
+                print(f"[WARN] Skipped record that could not be indexed: {path}\n  {type(e).__name__}: {e}")
+                stats["failed"] += 1
+                if prior:
+                    _delete_file_rows(conn, prior[0])
+                    conn.execute("DELETE FROM files WHERE file_id = ?", (prior[0],))
+            conn.execute("RELEASE file_rows")
+
+        for key, prior in known.items():
+            if key not in seen:
+                _delete_file_rows(conn, prior[0])
+                conn.execute("DELETE FROM files WHERE file_id = ?", (prior[0],))
+                stats["removed"] += 1
+
+    return stats
+
+
+# -----------------------------
+# Queries
+# -----------------------------
+
+DECISION_COLUMNS = "d.decision_id, d.program_id, d.gate_name, d.outcome, d.status, f.path"
+
+
+def query_decisions(conn, program=None, gate=None, outcome=None, status=None, category=None) -> List[dict]:
+    clauses, params = [], []
+    for column, value in (
+        ("d.program_id", program),
+        ("d.gate_name", gate),
+        ("d.outcome", outcome),
+        ("d.status", status),
+        ("d.decision_category", category),
+    ):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    sql = f"SELECT {DECISION_COLUMNS} FROM decisions d JOIN files f USING (file_id) {where} ORDER BY d.decision_id, f.path"
+    return _dicts(conn.execute(sql, params))
+
+
+def query_evidence(conn, evidence_id=None, source_system=None, location_ref=None) -> List[dict]:
+    clauses, params = [], []
+    for column, value in (("e.evidence_id", evidence_id), ("e.source_system", source_system), ("e.location_ref", location_ref)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    sql = (
+        "SELECT e.decision_id, e.evidence_id, e.source_system, e.location_ref, e.title, f.path"
+        f" FROM evidence e JOIN files f USING (file_id) {where} ORDER BY e.decision_id, e.evidence_id, f.path"
+    )
+    return _dicts(conn.execute(sql, params))
+
+
+def query_chain(conn, decision_id: str) -> dict:
+    """
+    Walk the supersession chain through `decision_id` in both directions.
+
+    A link is taken from either side: a record's audit.superseded_by, or
+    another record whose audit.supersedes names it. Cycles stop the walk.
+
+    Returns {"chain": [oldest ... newest], "head": newest, "cycle": bool}.
+    """
+    def successor(did: str) -> str | None:
+        row = conn.execute(
+            "SELECT superseded_by FROM decisions WHERE decision_id = ? AND superseded_by IS NOT NULL LIMIT 1", (did,)
+        ).fetchone()
+        if row:
+            return row[0]
+        row = conn.execute("SELECT decision_id FROM decisions WHERE supersedes = ? LIMIT 1", (did,)).fetchone()
+        return row[0] if row else None
+
+    def predecessor(did: str) -> str | None:
+        row = conn.execute(
+            "SELECT supersedes FROM decisions WHERE decision_id = ? AND supersedes IS NOT NULL LIMIT 1", (did,)
+        ).fetchone()
+        if row:
+            return row[0]
+        row = conn.execute("SELECT decision_id FROM decisions WHERE superseded_by = ? LIMIT 1", (did,)).fetchone()
+        return row[0] if row else None
+
+    seen = {decision_id}
+    cycle = False
+    forward: List[str] = []
+    cur = successor(decision_id)
+    while cur is not None:
+        if cur in seen:
+            cycle = True
+            break
+        seen.add(cur)
+        forward.append(cur)
+        cur = successor(cur)
+
+    backward: List[str] = []
+    cur = predecessor(decision_id)
+    while cur is not None:
+        if cur in seen:
+            cycle = True
+            break
+        seen.add(cur)
+        backward.append(cur)
+        cur = predecessor(cur)
+
+    chain = list(reversed(backward)) + [decision_id] + forward
+    return {"chain": chain, "head": chain[-1], "cycle": cycle}
+
+
+def query_obligations(
+    conn,
+    as_of: date,
+    overdue: bool = False,
+    within: int | None = None,
+    owner: str | None = None,
+    program: str | None = None,
+    outcome: str | None = None,
+    kind: str | None = None,
+    undated: bool = False,
+) -> List[dict]:
+    """
+    Open obligations in due-date order, with days_left relative to `as_of`
+    (negative = overdue).
+
+    overdue -> due before as_of; within N -> due from as_of to as_of + N days;
+    both -> everything due by as_of + N. Neither -> every dated obligation.
+    undated -> obligations without a due date (e.g. author_at_risk_items
+    with due_date null) instead.
+    """
+    clauses, params = [], []
+    if undated:
+        clauses.append("o.due_date IS NULL")
+    else:
+        clauses.append("o.due_date IS NOT NULL")
+        if overdue and within is None:
+            clauses.append("o.due_date < ?")
+            params.append(as_of.isoformat())
+        elif within is not None:
+            clauses.append("o.due_date <= ?")
+            params.append((as_of + timedelta(days=within)).isoformat())
+            if not overdue:
+                clauses.append("o.due_date >= ?")
+                params.append(as_of.isoformat())
+    for column, value in (("o.program_id", program), ("o.outcome", outcome), ("o.kind", kind)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if owner is not None:
+        clauses.append("o.owner = ? COLLATE NOCASE")
+        params.append(owner)
+    sql = (
+        "SELECT o.due_date, o.decision_id, o.kind, o.item_id, o.field, o.owner, o.owner_role, o.status, o.outcome,"
+        " o.program_id, o.description, f.path"
+        f" FROM obligations o JOIN files f USING (file_id) WHERE {' AND '.join(clauses)}"
+        " ORDER BY o.due_date, o.decision_id, o.field"
+    )
+    rows = _dicts(conn.execute(sql, params))
+    for row in rows:
+        try:
+            row["days_left"] = (date.fromisoformat(row["due_date"]) - as_of).days if row["due_date"] else None
+        except ValueError:  # not a valid date; the validators report it
+            row["days_left"] = None
+    return rows
+
+
+def impact_starts(conn, evidence_id=None, decision_id=None, location_ref=None, dependency=None, deliverable=None, program=None) -> List[str]:
+    """Impact-graph nodes for the changed item(s), limited to nodes present in the index."""
+    starts: List[str] = []
+    if evidence_id is not None:
+        sql = "SELECT DISTINCT decision_id FROM evidence WHERE evidence_id = ?"
+        params: List[Any] = [evidence_id]
+        if decision_id is not None:
+            sql += " AND decision_id = ?"
+            params.append(decision_id)
+        starts += [f"evidence:{row[0]}/{evidence_id}" for row in conn.execute(sql + " ORDER BY decision_id", params)]
+    elif decision_id is not None:
+        starts.append(f"decision:{decision_id}")
+    if location_ref is not None:
+        starts.append(f"artifact:{location_ref}")
+    if dependency is not None:
+        starts.append(f"dependency:{normalize_dependency(dependency)}")
+    if deliverable is not None:
+        starts.append(f"deliverable:{program}/{deliverable}")
+    return [n for n in starts if conn.execute("SELECT 1 FROM impact_nodes WHERE node = ? LIMIT 1", (n,)).fetchone()]
+
+
+def _dicts(cursor) -> List[dict]:
+    names = [d[0] for d in cursor.description]
+    return [dict(zip(names, row)) for row in cursor]
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="decision_index.py",
+        description="Build and query a persistent cross-record index over RGDS decision logs.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("--db", type=str, default=None, help="Index database path. Default: .rgds_cache/decision-index.sqlite")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    b = sub.add_parser("build", help="Create or incrementally update the index.")
+    b.add_argument("paths", nargs="*", help="Directories, files, or glob patterns. Default: examples/")
+
+    q = sub.add_parser("query", help="Query the index.")
+    q.add_argument("--format", dest="out_format", choices=("text", "json"), default="text", help="Output format. Default: text")
+    qsub = q.add_subparsers(dest="kind", required=True)
+
+    qd = qsub.add_parser("decisions", help="Decisions by program / gate / outcome / status / category.")
+    qd.add_argument("--program", default=None)
+    qd.add_argument("--gate", default=None)
+    qd.add_argument("--outcome", default=None)
+    qd.add_argument("--status", default=None)
+    qd.add_argument("--category", default=None)
+
+    qe = qsub.add_parser("evidence", help="Decisions citing an evidence item.")
+    qe.add_argument("--evidence-id", dest="evidence_id", default=None)
+    qe.add_argument("--source-system", dest="source_system", default=None)
+    qe.add_argument("--location-ref", dest="location_ref", default=None)
+
+    qi = qsub.add_parser("impact", help="Everything affected if an evidence item / document / dependency / decision changes.")
+    qi.add_argument("--evidence-id", dest="evidence_id", default=None, help="Changed evidence item (in every decision citing it, unless --decision-id).")
+    qi.add_argument("--decision-id", dest="decision_id", default=None, help="Changed decision, or the decision owning --evidence-id.")
+    qi.add_argument("--location-ref", dest="location_ref", default=None, help="Changed document, as cited in evidence location_ref.")
+    qi.add_argument("--dependency", default=None, help="Changed dependency, as listed in dependencies / dependency_map.")
+    qi.add_argument("--deliverable", default=None, help="Changed propagation target (IB, M2.6, ...); needs --program.")
+    qi.add_argument("--program", default=None)
+    qi.add_argument("--max-depth", dest="max_depth", type=int, default=6, help="Edges to follow from the change. Default: 6")
+    qi.add_argument("--limit", type=int, default=5000, help="Stop after this many affected nodes. Default: 5000")
+
+    qo = qsub.add_parser("obligations", help="Open conditions / actions / author-at-risk items by due date.")
+    qo.add_argument("--overdue", action="store_true", help="Due before --as-of (combine with --within for 'overdue or due soon').")
+    qo.add_argument("--within", metavar="DAYS", type=int, default=None, help="Due within DAYS days of --as-of.")
+    qo.add_argument("--owner", default=None, help="Owner name (case-insensitive).")
+    qo.add_argument("--program", default=None)
+    qo.add_argument("--outcome", default=None, help="e.g. conditional_go, defer_with_required_evidence")
+    qo.add_argument("--kind", dest="obligation_kind", default=None, choices=("condition", "action", "author_at_risk_item", "evidence_completeness"))
+    qo.add_argument("--undated", action="store_true", help="List open obligations that have no due date instead.")
+    qo.add_argument("--as-of", dest="as_of", default=None, help="Reference date (YYYY-MM-DD). Default: today")
+
+    qs = qsub.add_parser("search", help="Ranked full-text search over decision prose (see text_index.py).")
+    qs.add_argument("text", help='Terms, "quoted phrases" and prefix* terms; all must match.')
+    qs.add_argument("--program", default=None)
+    qs.add_argument("--gate", default=None)
+    qs.add_argument("--outcome", default=None)
+    qs.add_argument("--limit", type=int, default=20, help="Decisions to return. Default: 20")
+    qs.add_argument("--hits", type=int, default=5, help="Hits shown per decision. Default: 5")
+
+    qc = qsub.add_parser("chain", help="Supersession chain and current head for a decision_id.")
+    qc.add_argument("decision_id")
+
+    return p.parse_args(argv)
+
+
+def print_rows(rows: List[dict]) -> None:
+    if not rows:
+        print("(no matches)")
+        return
+    names = list(rows[0])
+    widths = [max(len(n), *(len(str(r[n] if r[n] is not None else "")) for r in rows)) for n in names]
+    print("  ".join(n.ljust(w) for n, w in zip(names, widths)).rstrip())
+    for r in rows:
+        print("  ".join(str(r[n] if r[n] is not None else "").ljust(w) for n, w in zip(names, widths)).rstrip())
+
+
+def run_query(conn, args: argparse.Namespace) -> Tuple[Any, bool]:
+    """Dispatch a query subcommand. Returns (result, matched)."""
+    if args.kind == "decisions":
+        rows = query_decisions(conn, args.program, args.gate, args.outcome, args.status, args.category)
+        return rows, bool(rows)
+    if args.kind == "evidence":
+        if not (args.evidence_id or args.source_system or args.location_ref):
+            print("[ERROR] evidence query needs --evidence-id, --source-system and/or --location-ref")
+            sys.exit(2)
+        rows = query_evidence(conn, args.evidence_id, args.source_system, args.location_ref)
+        return rows, bool(rows)
+    if args.kind == "obligations":
+        try:
+            as_of = date.fromisoformat(args.as_of) if args.as_of else date.today()
+        except ValueError:
+            print(f"[ERROR] --as-of must be a date (YYYY-MM-DD): {args.as_of}")
+            sys.exit(2)
+        if args.within is not None and args.within < 0:
+            print("[ERROR] --within must be >= 0")
+            sys.exit(2)
+        rows = query_obligations(
+            conn, as_of, args.overdue, args.within, args.owner, args.program, args.outcome, args.obligation_kind, args.undated
+        )
+        return rows, bool(rows)
+    if args.kind == "search":
+        if args.limit < 1 or args.hits < 1:
+            print("[ERROR] --limit and --hits must be at least 1")
+            sys.exit(2)
+        try:
+            result = search(conn, args.text, args.program, args.gate, args.outcome, args.limit, args.hits)
+        except ValueError as e:
+            print(f"[ERROR] Bad search query: {e}")
+            sys.exit(2)
+        return result, bool(result["results"])
+    if args.kind == "impact":
+        if not (args.evidence_id or args.decision_id or args.location_ref or args.dependency or args.deliverable):
+            print("[ERROR] impact query needs --evidence-id, --decision-id, --location-ref, --dependency or --deliverable")
+            sys.exit(2)
+        if args.deliverable and not args.program:
+            print("[ERROR] --deliverable needs --program")
+            sys.exit(2)
+        if args.max_depth < 1 or args.limit < 1:
+            print("[ERROR] --max-depth and --limit must be at least 1")
+            sys.exit(2)
+        starts = impact_starts(conn, args.evidence_id, args.decision_id, args.location_ref, args.dependency, args.deliverable, args.program)
+        return impact(conn, starts, args.max_depth, args.limit), bool(starts)
+    # chain
+    known = conn.execute("SELECT 1 FROM decisions WHERE decision_id = ? LIMIT 1", (args.decision_id,)).fetchone()
+    return query_chain(conn, args.decision_id), known is not None
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    db_path = Path(args.db).resolve() if args.db else DEFAULT_DB
+
+    if args.command == "build":
+        conn = open_index(db_path, create=True)
+        inputs = collect_inputs(args.paths)
+        stats = build_index(conn, [path for _, path in inputs])
+        conn.close()
+        total = stats["unchanged"] + stats["updated"] + stats["added"]
+        print(
+            f"[PASS] Index up to date: {total} file(s) "
+            f"({stats['added']} added, {stats['updated']} updated, {stats['unchanged']} unchanged, "
+            f"{stats['removed']} removed, {stats['failed']} failed)"
+        )
+        print(f"  Index: {db_path}")
+        return 1 if stats["failed"] else 0
+
+    conn = open_index(db_path, create=False)
+    result, matched = run_query(conn, args)
+    conn.close()
+
+    if args.out_format == "json":
+        print(json.dumps(result, indent=2))
+    elif args.kind == "chain":
+        print(" -> ".join(result["chain"]))
+        print(f"head: {result['head']}{' (cycle detected)' if result['cycle'] else ''}")
+    elif args.kind == "impact":
+        print(f"changed: {', '.join(result['changed']) or '(not in the index)'}")
+        print(f"affected decisions: {', '.join(result['affected_decisions']) or '(none)'}")
+        print()
+        print_rows(
+            [
+                {
+                    "depth": a["depth"],
+                    "decision_id": a["decision_id"],
+                    "kind": a["kind"],
+                    # corpus-wide nodes (documents, dependencies, deliverables) are shown by name
+                    "field": a["field"] or (a["node"].split(":", 1)[1] if a["decision_id"] is None else None),
+                    "item_id": a["item_id"],
+                    "edge": a["edge"] + (" (heuristic)" if a["heuristic"] else ""),
+                    "reason": a["reason"],
+                }
+                for a in result["affected"]
+            ]
+        )
+        if result["truncated"]:
+            print("(truncated by --max-depth / --limit)")
+    elif args.kind == "obligations":
+        print_rows(
+            [
+                {
+                    "due_date": r["due_date"],
+                    "days": r["days_left"],
+                    "decision_id": r["decision_id"],
+                    "kind": r["kind"],
+                    "item": r["item_id"] or r["field"],
+                    "owner": r["owner"],
+                    "status": r["status"],
+                    "description": (r["description"] or "")[:60],
+                }
+                for r in result
+            ]
+        )
+    elif args.kind == "search":
+        shown = len(result["results"])
+        print(f"{result['matched']} decision(s) match {' + '.join(result['clauses'])}" + (f"; top {shown}" if shown < result["matched"] else ""))
+        for r in result["results"]:
+            print(f"\n{r['score']:>8.3f}  {r['decision_id']}  {r['path']}")
+            for h in r["hits"]:
+                text = " ".join(h["text"].split())
+                print(f"          {h['json_path']}: {text[:100]}{'...' if len(text) > 100 else ''}")
+    else:
+        print_rows(result)
+    return 0 if matched else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
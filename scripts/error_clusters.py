@@ -0,0 +1,182 @@
+"""
+RGDS error clustering — error_clusters.py
+
+Purpose
+-------
+Backs --aggregate in validate_all_examples.py (and validate_distributed.py
+merge): when a schema change breaks thousands of records, print which
+*kinds* of failure there are, ranked, instead of every error of every file.
+
+Clusters
+--------
+Every failure is keyed by (normalized path, keyword, code):
+
+    schema error      ($.evidence.evidence_items[*].confidence, "enum", "")
+    semantic error    ($, "semantic", "E-COND-001")
+    semantic warning  ($, "warning", "W-COND-001")   (only with --strict, where warnings fail)
+    unreadable file   ($, "load", "")
+
+Array indices are normalized to [*], so the same defect in every evidence
+item of every record is one cluster.
+
+Bounded memory
+--------------
+Each cluster keeps an error count, a file count, the first message seen
+and the first --samples file labels. At most `capacity` clusters are kept
+(Space-Saving): when a new key arrives and the table is full, the cluster
+with the smallest error count is replaced and the newcomer inherits that
+count as an upper bound (reported as "~N", with `error` = the possible
+overcount). Any cluster with more errors than the evicted minimum is
+guaranteed to be in the table, so the top-k is exact whenever the table
+never filled, and the heavy hitters are always found.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, NamedTuple
+
+DEFAULT_CAPACITY = 4096
+
+
+class ClusterKey(NamedTuple):
+    path: str
+    keyword: str
+    code: str
+
+
+class Cluster:
+    """Streaming counters and samples for one ClusterKey."""
+
+    __slots__ = ("key", "errors", "files", "error", "message", "samples")
+
+    def __init__(self, key: ClusterKey, message: str, floor: int = 0):
+        self.key = key
+        self.errors = floor  # inherited count on eviction (Space-Saving)
+        self.files = floor
+        self.error = floor
+        self.message = message
+        self.samples: List[str] = []
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.key.path,
+            "keyword": self.key.keyword,
+            "code": self.key.code,
+            "errors": self.errors,
+            "files": self.files,
+            "overcount": self.error,
+            "example": self.message,
+            "samples": self.samples,
+        }
+
+
+def normalize_path(err_path: Iterable) -> str:
+    """JSONPath-like string with array indices collapsed to [*] (format_path with wildcards)."""
+    out = "$"
+    for p in err_path:
+        out += "[*]" if isinstance(p, int) else f".{p}"
+    return out
+
+
+def _split_code(message: str) -> tuple:
+    code, sep, text = message.partition(": ")
+    return (code, text) if sep else ("", message)
+
+
+class ErrorAggregator:
+    """Ranked failure clusters over a stream of validate_one() results."""
+
+    def __init__(self, samples: int = 3, capacity: int = DEFAULT_CAPACITY):
+        self.samples = samples
+        self.capacity = capacity
+        self.clusters: Dict[ClusterKey, Cluster] = {}
+        self.files = 0
+        self.failing_files = 0
+        self.errors = 0
+        self.omitted = 0
+        self.evicted = 0
+
+    def _hit(self, key: ClusterKey, message: str, count: int, label: str) -> None:
+        cluster = self.clusters.get(key)
+        if cluster is None:
+            floor = 0
+            if len(self.clusters) >= self.capacity:
+                victim = min(self.clusters.values(), key=lambda c: c.errors)
+                del self.clusters[victim.key]
+                floor = victim.errors
+                self.evicted += 1
+            cluster = self.clusters[key] = Cluster(key, message, floor)
+        cluster.errors += count
+        cluster.files += 1
+        if len(cluster.samples) < self.samples:
+            cluster.samples.append(label)
+
+    def add(self, label: str, result: dict, strict: bool) -> None:
+        """Fold one file's result in (each cluster counts a file at most once)."""
+        self.files += 1
+        hits: Dict[ClusterKey, List] = {}
+
+        def hit(key: ClusterKey, message: str) -> None:
+            slot = hits.get(key)
+            if slot is None:
+                hits[key] = [message, 1]
+            else:
+                slot[1] += 1
+
+        if result["error"]:
+            hit(ClusterKey("$", "load", ""), result["error"].splitlines()[-1].strip())
+        kinds = result.get("schema_error_kinds") or []
+        for line, kind in zip(result["schema_errors"], kinds):
+            hit(ClusterKey(kind[0], kind[1], ""), line.partition(": ")[2])
+        for line in result["schema_errors"][len(kinds):]:  # stored without kinds: path as printed
+            hit(ClusterKey(line.partition(": ")[0], "", ""), line.partition(": ")[2])
+        for message in result["semantic_errors"]:
+            code, text = _split_code(message)
+            hit(ClusterKey("$", "semantic", code), text)
+        if strict:
+            for message in result["semantic_warnings"]:
+                code, text = _split_code(message)
+                hit(ClusterKey("$", "warning", code), text)
+
+        self.omitted += result.get("schema_errors_omitted") or 0
+        if hits:
+            self.failing_files += 1
+        for key, (message, count) in hits.items():
+            self.errors += count
+            self._hit(key, message, count, label)
+
+    def top(self, k: int) -> List[Cluster]:
+        """The k largest clusters by error count (then file count, then key, for a stable order)."""
+        return sorted(self.clusters.values(), key=lambda c: (-c.errors, -c.files, c.key))[:k]
+
+    def summary_lines(self, k: int) -> List[str]:
+        if not self.clusters:
+            return [f"[PASS] No failures in {self.files} file(s)"]
+        top = self.top(k)
+        lines = [
+            f"[FAIL] {self.failing_files} of {self.files} file(s) failed with {self.errors} error(s) "
+            f"in {len(self.clusters)} cluster(s); top {len(top)}:"
+        ]
+        for rank, c in enumerate(top, 1):
+            approx = "~" if c.error else ""
+            what = c.key.code if c.key.code else c.key.keyword or "?"
+            lines.append(f"\n  {rank:>3}. {approx}{c.errors} error(s) in {approx}{c.files} file(s)  [{what}]  {c.key.path}")
+            lines.append(f"       e.g. {c.message}")
+            more = f" (+{c.files - len(c.samples)} more)" if c.files > len(c.samples) else ""
+            lines.append(f"       files: {', '.join(c.samples)}{more}")
+        if self.omitted:
+            lines.append(f"\n  ({self.omitted} further schema error(s) were dropped by --max-errors and are not clustered)")
+        if self.evicted:
+            lines.append(f"  ({self.evicted} small cluster(s) were evicted to bound memory; '~' counts are upper bounds)")
+        return lines
+
+    def to_dict(self, k: int) -> dict:
+        return {
+            "files": self.files,
+            "failing_files": self.failing_files,
+            "errors": self.errors,
+            "omitted": self.omitted,
+            "clusters": len(self.clusters),
+            "evicted": self.evicted,
+            "top": [c.to_dict() for c in self.top(k)],
+        }
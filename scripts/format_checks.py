@@ -0,0 +1,96 @@
+"""
+RGDS format checks — format_checks.py
+
+Purpose
+-------
+One FormatChecker for every entry point (validate_decision_log.py,
+validate_all_examples.py, the daemon, benchmarks), so "is this a valid
+created_at / gate_date / as_of / changed_at" has a single answer.
+
+The schema only uses two formats, "date" and "date-time", on fields that
+repeat a lot (every evidence as_of, every audit.change_log[].changed_at),
+so those two get dedicated checkers:
+
+- fast parsers: one anchored regex plus a month-length table, instead of
+  the stock date.fromisoformat / calendar.monthrange round trips
+- memoized per process (bounded LRU), so a timestamp that recurs across
+  a change log or a corpus is checked once
+
+Parity
+------
+They accept exactly what the stock jsonschema checkers accept (date:
+jsonschema's YYYY-MM-DD regex + date.fromisoformat; date-time:
+rfc3339-validator on the upper-cased string, so "t"/"z" are allowed and
+leap seconds are not), so error output is unchanged. The date-time check
+no longer depends on rfc3339-validator being installed. Every other format
+keeps the stock jsonschema implementation.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+MEMO_SIZE = 1 << 16  # distinct strings remembered per format
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+# Same grammar as rfc3339-validator, including its "$" (a single trailing
+# newline is tolerated there, so it is here).
+_DATE_TIME = re.compile(
+    r"(\d{4})-(0[1-9]|1[0-2])-(\d{2})T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d+)?(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)$",
+    re.ASCII,
+)
+
+
+def _valid_day(year: int, month: int, day: int) -> bool:
+    if year < 1 or not 1 <= month <= 12:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 1 <= day <= 29
+    return 1 <= day <= _DAYS_IN_MONTH[month]
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _date_ok(value: str) -> bool:
+    m = _DATE.fullmatch(value)
+    return m is not None and _valid_day(int(m[1]), int(m[2]), int(m[3]))
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _date_time_ok(value: str) -> bool:
+    m = _DATE_TIME.match(value.upper())
+    return m is not None and _valid_day(int(m[1]), int(m[2]), int(m[3]))
+
+
+def is_date(instance: object) -> bool:
+    """RFC 3339 full-date (YYYY-MM-DD); non-strings pass, as in jsonschema."""
+    return _date_ok(instance) if isinstance(instance, str) else True
+
+
+def is_date_time(instance: object) -> bool:
+    """RFC 3339 date-time; non-strings pass, as in jsonschema."""
+    return _date_time_ok(instance) if isinstance(instance, str) else True
+
+
+FAST_CHECKERS = {"date": is_date, "date-time": is_date_time}
+
+
+def format_checker():
+    """A jsonschema FormatChecker with the fast "date" / "date-time" checkers installed."""
+    from jsonschema import FormatChecker  # deferred: dominates CLI startup
+
+    checker = FormatChecker()
+    checker.checkers = {**checker.checkers, **{name: (func, ()) for name, func in FAST_CHECKERS.items()}}
+    return checker
+
+
+def memo_info() -> dict:
+    """Memo hit/miss counters per format (benchmarks)."""
+    return {name: fn.cache_info()._asdict() for name, fn in (("date", _date_ok), ("date-time", _date_time_ok))}
+
+
+def clear_memo() -> None:
+    _date_ok.cache_clear()
+    _date_time_ok.cache_clear()
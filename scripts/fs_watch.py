@@ -0,0 +1,199 @@
+"""
+RGDS filesystem watching — fs_watch.py
+
+Purpose
+-------
+Backs --watch in validate_all_examples.py: tell the validator which files
+changed so only those are revalidated.
+
+Backends
+--------
+- inotify (Linux), through ctypes; no third-party dependency. Reacts to
+  in-place saves (IN_CLOSE_WRITE), atomic rename-over saves (IN_MOVED_TO),
+  and removals (IN_DELETE / IN_MOVED_FROM).
+- polling everywhere else (or if inotify cannot be initialised, e.g. the
+  per-user watch limit is exhausted): compares (mtime_ns, size) of the
+  *.json files in the watched directories every --poll-interval seconds.
+
+Both expose add_directory() and read(timeout) -> set of changed paths.
+wait_for_changes() adds the debounce: editors and `git checkout` produce
+bursts of events, so it keeps collecting until the directories have been
+quiet for `debounce` seconds and returns the whole burst as one batch.
+
+Only the standard library is used.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Set, Tuple
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class InotifyWatcher:
+    """Directory watches on one inotify descriptor."""
+
+    backend = "inotify"
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+        self._dirs: Dict[int, Path] = {}
+        self._watched: Set[Path] = set()
+        self.overflowed = False
+
+    def add_directory(self, directory: Path) -> None:
+        directory = directory.resolve()
+        if directory in self._watched:
+            return
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch failed: {os.strerror(err)}", str(directory))
+        self._dirs[wd] = directory
+        self._watched.add(directory)
+
+    def read(self, timeout: float | None) -> Set[Path]:
+        """Changed paths seen within `timeout` seconds (None = block until something happens)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: Set[Path] = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped; the caller has to rescan everything.
+                    self.overflowed = True
+                    continue
+                if mask & IN_IGNORED:
+                    directory = self._dirs.pop(wd, None)
+                    self._watched.discard(directory)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is not None and name:
+                    changed.add(directory / os.fsdecode(name))
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback: periodic (mtime_ns, size) snapshots of *.json files."""
+
+    backend = "polling"
+
+    def __init__(self, interval: float = 0.5, extra_files: Iterable[Path] = ()):
+        self.interval = interval
+        self.overflowed = False
+        self._dirs: Set[Path] = set()
+        self._extra = {p.resolve() for p in extra_files}
+        self._state: Dict[Path, Tuple[int, int]] = self._stat(self._extra)
+
+    def add_directory(self, directory: Path) -> None:
+        directory = directory.resolve()
+        if directory not in self._dirs:
+            self._dirs.add(directory)
+            self._state.update(self._stat(directory.glob("*.json")))
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        candidates = set(self._extra)
+        for directory in self._dirs:
+            candidates.update(directory.glob("*.json"))
+        return self._stat(candidates)
+
+    @staticmethod
+    def _stat(paths: Iterable[Path]) -> Dict[Path, Tuple[int, int]]:
+        state: Dict[Path, Tuple[int, int]] = {}
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def read(self, timeout: float | None) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic())))
+            current = self._snapshot()
+            changed = {p for p in current.keys() | self._state.keys() if current.get(p) != self._state.get(p)}
+            self._state = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(directories: Iterable[Path], extra_files: Iterable[Path] = (), poll_interval: float = 0.5, polling: bool = False):
+    """
+    Watch `directories` with inotify where possible, else by polling.
+
+    `extra_files` are files outside those directories that must also be
+    noticed by the polling backend (inotify sees them via their directory).
+    """
+    directories, extra_files = list(directories), list(extra_files)
+    watcher = None
+    if not polling:
+        try:
+            watcher = InotifyWatcher()
+            for directory in directories + [p.parent for p in extra_files]:
+                watcher.add_directory(directory)
+            return watcher
+        except (OSError, AttributeError):
+            if watcher is not None:
+                watcher.close()
+    watcher = PollingWatcher(poll_interval, extra_files)
+    for directory in directories:
+        watcher.add_directory(directory)
+    return watcher
+
+
+def wait_for_changes(watcher, debounce: float) -> Set[Path]:
+    """Block until something changes, then collect until `debounce` seconds pass without events."""
+    changed: Set[Path] = set()
+    while not changed and not watcher.overflowed:
+        changed = watcher.read(None)
+    while True:
+        more = watcher.read(debounce)
+        if not more:
+            return changed
+        changed |= more
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+RGDS Benchmark Script — generate_synthetic_corpus.py
+
+Purpose
+-------
+Generates schema-valid synthetic decision logs at configurable scale and
+shape, so validator throughput can be measured beyond the six canonical
+examples.
+
+Records are derived from the canonical examples/ (so every generated record
+stays inside the schema and passes the semantic invariants), then reshaped:
+
+- --options N        pad options_considered up to N options
+- --evidence N       pad evidence.evidence_items up to N items
+- --change-log N     audit.change_log with N entries
+- --ai-ratio F       fraction of records with ai_assistance.used=true
+
+Generation is deterministic for a given --seed. Synthetic records are
+benchmark fixtures only; they are not decision records.
+
+Typical usage
+-------------
+    python3 scripts/generate_synthetic_corpus.py --count 10000
+    python3 scripts/generate_synthetic_corpus.py --count 1000 --evidence 300 --change-log 200 --output build/wide
+    python3 scripts/generate_synthetic_corpus.py --count 100000 --ndjson build/synthetic.ndjson
+
+Exit codes
+----------
+0 — Corpus written
+2 — Script/configuration error (bad arguments, unreadable templates)
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Iterator, List, NamedTuple
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLES_DIR = ROOT / "examples"
+DEFAULT_OUTPUT = ROOT / "build" / "synthetic-corpus"
+
+PROGRAMS = ("PRG-241", "PRG-IND-042", "IND-EXAMPLE-ALPHA-001", "PROGRAM-IND-READINESS-001", "PRG-SYN-001", "PRG-SYN-002")
+SOURCE_SYSTEMS = ("Document Repository", "Power BI", "LIMS", "CRO vendor package", "Veeva Vault", "SharePoint")
+EVIDENCE_TYPES = ("dataset", "analysis", "report", "protocol", "memo", "dashboard", "validation_artifact", "other")
+
+
+class Shape(NamedTuple):
+    """Generated record shape (0 keeps the template's own size)."""
+
+    options: int = 0
+    evidence: int = 0
+    change_log: int = 0
+    ai_ratio: float = 0.5
+
+
+def load_templates(directory: Path = EXAMPLES_DIR) -> List[dict]:
+    """Load the canonical examples used as generation templates."""
+    templates = [json.loads(p.read_text(encoding="utf-8")) for p in sorted(directory.glob("*.json"))]
+    if not templates:
+        raise ValueError(f"no template JSON files in {directory}")
+    return templates
+
+
+def _option(n: int) -> dict:
+    return {
+        "option_id": f"SYN-OPT-{n:03d}",
+        "description": f"Synthetic alternative {n} considered for benchmarking.",
+        "pros": ["Keeps the timeline", "Limits rework"],
+        "cons": ["Adds residual risk"],
+        "estimated_impact": "Synthetic impact statement used for validator benchmarking only.",
+    }
+
+
+def _evidence(rng: random.Random, n: int) -> dict:
+    return {
+        "evidence_id": f"E-SYN-{n:04d}",
+        "type": rng.choice(EVIDENCE_TYPES),
+        "title": f"Synthetic evidence item {n}",
+        "source_system": rng.choice(SOURCE_SYSTEMS),
+        "location_ref": f"SYN-LOC-{rng.randrange(100000):05d}",
+        "owner": {"name": "Synthetic Owner", "role": "Benchmark"},
+        "as_of": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T09:00:00Z",
+        "relevance": rng.choice(("primary", "supporting", "contextual")),
+        "quality_notes": "Synthetic record generated for validator benchmarking.",
+        "confidence": rng.choice(("low", "medium", "high")),
+        "completeness_state": "complete",
+    }
+
+
+def _change(n: int) -> dict:
+    return {
+        "version": n,
+        "changed_by": {"name": "Synthetic Editor", "role": "Benchmark"},
+        "changed_at": f"2026-01-{(n % 28) + 1:02d}T10:{n % 60:02d}:00Z",
+        "summary": f"Synthetic revision {n}.",
+    }
+
+
+def synthesize(templates: List[dict], count: int, shape: Shape = Shape(), seed: int = 0, start: int = 100000) -> Iterator[dict]:
+    """
+    Yield `count` synthetic records derived from `templates`.
+
+    decision_ids are RGDS-DEC-<start + i>, so they are unique and never
+    collide with the canonical examples.
+    """
+    rng = random.Random(seed)
+    ai_on = [t["ai_assistance"] for t in templates if t.get("ai_assistance", {}).get("used")]
+    ai_off = [t["ai_assistance"] for t in templates if not t.get("ai_assistance", {}).get("used")]
+
+    for i in range(count):
+        record = copy.deepcopy(rng.choice(templates))
+        record["decision_id"] = f"RGDS-DEC-{start + i}"
+        record["program_context"]["program_id"] = rng.choice(PROGRAMS)
+
+        options = record["options_considered"]
+        while len(options) < shape.options:
+            options.append(_option(len(options) + 1))
+
+        items = record["evidence"]["evidence_items"]
+        while len(items) < shape.evidence:
+            items.append(_evidence(rng, len(items) + 1))
+
+        if shape.change_log:
+            record["audit"]["change_log"] = [_change(n) for n in range(1, shape.change_log + 1)]
+            record["audit"]["record_version"] = shape.change_log
+
+        pool = ai_on if rng.random() < shape.ai_ratio else ai_off
+        if pool:
+            record["ai_assistance"] = copy.deepcopy(rng.choice(pool))
+
+        yield record
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="generate_synthetic_corpus.py",
+        description="Generate schema-valid synthetic RGDS decision logs for benchmarking.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("--count", type=int, default=1000, help="Number of records. Default: 1000")
+    p.add_argument("--seed", type=int, default=0, help="Random seed (output is deterministic per seed). Default: 0")
+    p.add_argument("--options", type=int, default=0, help="Pad options_considered up to N options.")
+    p.add_argument("--evidence", type=int, default=0, help="Pad evidence_items up to N items.")
+    p.add_argument("--change-log", dest="change_log", type=int, default=0, help="Write N audit.change_log entries.")
+    p.add_argument("--ai-ratio", dest="ai_ratio", type=float, default=0.5, help="Fraction of records with AI used. Default: 0.5")
+    p.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Directory for one <decision_id>.json file per record. Default: build/synthetic-corpus",
+    )
+    p.add_argument("--ndjson", type=str, default=None, help="Write a single NDJSON file instead of a directory.")
+    return p.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.count < 1 or min(args.options, args.evidence, args.change_log) < 0 or not 0.0 <= args.ai_ratio <= 1.0:
+        print("[ERROR] --count must be >= 1, sizes >= 0, and --ai-ratio within [0, 1]")
+        return 2
+
+    try:
+        templates = load_templates()
+    except Exception as e:
+        print(f"[ERROR] Failed to load templates from {EXAMPLES_DIR}\n  {e}")
+        return 2
+
+    shape = Shape(args.options, args.evidence, args.change_log, args.ai_ratio)
+    records = synthesize(templates, args.count, shape, args.seed)
+
+    if args.ndjson:
+        out = Path(args.ndjson)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with out.open("w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    else:
+        out = Path(args.output) if args.output else DEFAULT_OUTPUT
+        out.mkdir(parents=True, exist_ok=True)
+        for record in records:
+            (out / f"{record['decision_id'].lower()}.json").write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+
+    print(f"[PASS] Wrote {args.count} synthetic record(s) to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""
+RGDS impact graph — impact_graph.py
+
+Purpose
+-------
+Answers "what is affected if X changes" (an evidence item, a document at a
+location_ref, a dependency, a deliverable, or a whole decision) across the
+corpus. decision_index.py stores the graph as two derived tables
+(impact_nodes, impact_edges), so it is built once and updated
+incrementally with the rest of the index, and `decision_index.py query
+impact` answers with a bounded breadth-first traversal instead of a rescan.
+
+Nodes
+-----
+decision:<decision_id>
+evidence:<decision_id>/<evidence_id>
+field:<decision_id>:<path>               a condition, author_at_risk_item,
+                                         action, dependency_map entry, or
+                                         dependencies entry
+artifact:<location_ref>                  shared by every record citing it
+dependency:<normalized text>             shared by every record listing it
+deliverable:<program_id>/<target>        propagation_required targets (IB, M2.6, ...)
+
+Edges ("if source changes, target may be affected")
+----------------------------------------------------
+artifact    <-> evidence     evidence.evidence_items[].location_ref
+evidence     -> decision     the decision relies on its evidence
+evidence     -> field        the field's text mentions the evidence (below)
+field        -> decision     the field belongs to the decision
+field       <-> dependency   dependencies[] / dependency_map[].dependency
+decision     -> deliverable  propagation_required
+deliverable  -> evidence / field   their text names a deliverable that the
+                                   same record lists in propagation_required
+                                   ("Module 2.6", "IB", ...)
+decision     -> decision     audit supersession (predecessor -> successor)
+
+Mentions
+--------
+Decision logs link evidence to conditions and actions in prose, so a field
+mentions an evidence item if its text contains the evidence_id (as a
+token) or the location_ref, or shares at least MIN_SHARED_TERMS
+distinctive terms with the evidence title and file name (generic words such
+as "report" or "draft" do not count). Every edge records why it exists
+(e.g. "terms: audited, glp, tox"), and the query returns it, so a reviewer
+can judge each inferred link.
+
+Deliverable edges are inferred the same way (a field saying "protocol"
+is linked to the Protocol deliverable), but only for targets the record
+itself declares in propagation_required. Both kinds of text-inferred edge
+are listed in HEURISTIC_EDGES, and the query marks them "heuristic".
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+MIN_SHARED_TERMS = 2
+
+# Decision-log fields that carry dependent work: (kind, path, id key, text keys).
+FIELD_KINDS = (
+    ("condition", ("decision_outcome", "conditions"), None, ("condition", "evidence_to_close")),
+    ("author_at_risk_item", ("author_at_risk_items",), "item_id", ("description", "verification", "fallback")),
+    ("action", ("actions",), "action_id", ("description", "success_criteria")),
+    ("dependency_map", ("dependency_map",), None, ("dependency", "why_it_matters")),
+)
+
+# Edge kinds inferred from free text rather than declared by a field.
+HEURISTIC_EDGES = frozenset({"mentions", "deliverable"})
+
+# How documents refer to each propagation_required target.
+DELIVERABLE_PATTERNS = {
+    "IB": re.compile(r"\bIB\b|investigator'?s? brochure", re.IGNORECASE),
+    "M2.4": re.compile(r"\bM\s?2\.4\b|module\s+2\.4\b", re.IGNORECASE),
+    "M2.5": re.compile(r"\bM\s?2\.5\b|module\s+2\.5\b", re.IGNORECASE),
+    "M2.6": re.compile(r"\bM\s?2\.6\b|module\s+2\.6\b", re.IGNORECASE),
+    "M2.7": re.compile(r"\bM\s?2\.7\b|module\s+2\.7\b", re.IGNORECASE),
+    "Protocol": re.compile(r"\bprotocol\b", re.IGNORECASE),
+    "CMC": re.compile(r"\bCMC\b|module\s+3\b", re.IGNORECASE),
+    "TPP": re.compile(r"\bTPP\b|target product profile", re.IGNORECASE),
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)*")
+
+# Words that appear in most evidence titles and say nothing about which evidence is meant.
+_GENERIC = frozenset(
+    """
+    a an and are as at be by for from in into is it its of on or per the to with without via
+    all any new current prior updated update final draft version document report dataset data
+    summary file files pdf docx xlsx csv md package source module section appendix view
+    """.split()
+)
+
+
+def _get(d, *keys):
+    for k in keys:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(k)
+    return d
+
+
+def terms(text: str) -> Set[str]:
+    """Distinctive lower-case terms of `text` (plural 's' folded; version numbers such as v0.9 / 2.6 kept)."""
+    out = set()
+    for token in _TOKEN.findall(text.lower()):
+        if token in _GENERIC or token.isdigit() or (len(token) < 3 and "." not in token):
+            continue
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        out.add(token)
+    return out
+
+
+def normalize_dependency(text: str) -> str:
+    return " ".join(text.lower().split()).rstrip(".;:,")
+
+
+def _text(item, keys: Iterable[str]) -> str:
+    if isinstance(item, str):
+        return item
+    return " ".join(v for v in (item.get(k) for k in keys) if isinstance(v, str))
+
+
+def _fields(record: dict) -> List[Tuple[str, str, str | None, str, str | None]]:
+    """(kind, path, item id, text, dependency) for every dependent-work field of `record`."""
+    out = []
+    for kind, path, id_key, text_keys in FIELD_KINDS:
+        items = _get(record, *path)
+        if not isinstance(items, list):
+            continue
+        for i, item in enumerate(items):
+            if isinstance(item, dict):
+                item_id = item.get(id_key) if id_key else None
+                dep = item.get("dependency") if kind == "dependency_map" else None
+                out.append(
+                    (
+                        kind,
+                        f"{'.'.join(path)}[{i}]",
+                        item_id if isinstance(item_id, str) else None,
+                        _text(item, text_keys),
+                        dep if isinstance(dep, str) else None,
+                    )
+                )
+    deps = record.get("dependencies")
+    if isinstance(deps, list):
+        for i, dep in enumerate(deps):
+            if isinstance(dep, str):
+                out.append(("dependency", f"dependencies[{i}]", None, dep, dep))
+    return out
+
+
+def _evidence(record: dict) -> List[dict]:
+    items = _get(record, "evidence", "evidence_items")
+    return [e for e in items if isinstance(e, dict) and isinstance(e.get("evidence_id"), str)] if isinstance(items, list) else []
+
+
+def _mention(evidence: dict, evidence_terms: Set[str], text: str) -> str | None:
+    """Why `text` refers to `evidence`, or None."""
+    evidence_id = evidence["evidence_id"]
+    if re.search(rf"(?<![\w-]){re.escape(evidence_id)}(?![\w-])", text):
+        return f"evidence_id {evidence_id}"
+    location = evidence.get("location_ref")
+    if isinstance(location, str) and len(location) >= 8 and location.lower() in text.lower():
+        return "location_ref"
+    shared = evidence_terms & terms(text)
+    if len(shared) >= MIN_SHARED_TERMS:
+        return "terms: " + ", ".join(sorted(shared))
+    return None
+
+
+def _str(value) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def graph(record: dict) -> Tuple[List[tuple], List[tuple]]:
+    """
+    (nodes, edges) contributed by one record; nodes are (node, kind,
+    decision_id, field, item_id, label), edges are (src, dst, kind, detail).
+    decision_index.py stores them as impact_nodes / impact_edges.
+    """
+    decision_id = record.get("decision_id")
+    if not isinstance(decision_id, str):
+        return [], []
+    program = _str(_get(record, "program_context", "program_id")) or "?"
+    me = f"decision:{decision_id}"
+    nodes = [(me, "decision", decision_id, None, None, record.get("decision_title"))]
+    edges: List[tuple] = []
+
+    fields = []
+    for kind, path, item_id, text, dep in _fields(record):
+        node = f"field:{decision_id}:{path}"
+        nodes.append((node, kind, decision_id, path, item_id, text[:200]))
+        edges.append((node, me, "field", path))
+        if dep and normalize_dependency(dep):
+            dep_node = f"dependency:{normalize_dependency(dep)}"
+            nodes.append((dep_node, "dependency", None, None, None, dep[:200]))
+            edges.append((node, dep_node, "dependency", None))
+            edges.append((dep_node, node, "dependency", None))
+        fields.append((node, text))
+
+    targets = record.get("propagation_required")
+    targets = [t for t in targets if isinstance(t, str)] if isinstance(targets, list) else []
+    for target in targets:
+        node = f"deliverable:{program}/{target}"
+        nodes.append((node, "deliverable", None, None, None, target))
+        edges.append((me, node, "propagation_required", target))
+
+    for evidence in _evidence(record):
+        node = f"evidence:{decision_id}/{evidence['evidence_id']}"
+        title = evidence.get("title") if isinstance(evidence.get("title"), str) else ""
+        location = evidence.get("location_ref") if isinstance(evidence.get("location_ref"), str) else ""
+        nodes.append((node, "evidence", decision_id, None, evidence["evidence_id"], title))
+        edges.append((node, me, "evidence", evidence["evidence_id"]))
+        if location:
+            artifact = f"artifact:{location}"
+            nodes.append((artifact, "artifact", None, None, None, location))
+            edges.append((artifact, node, "location_ref", location))
+            edges.append((node, artifact, "location_ref", location))
+        evidence_terms = terms(title) | terms(location.replace("/", " "))
+        for field_node, text in fields:
+            why = _mention(evidence, evidence_terms, text)
+            if why:
+                edges.append((node, field_node, "mentions", why))
+
+    # Text naming a deliverable is linked to it only if this record declares that target.
+    hits = [(f"evidence:{decision_id}/{e['evidence_id']}", f"{_str(e.get('title'))} {_str(e.get('location_ref'))}") for e in _evidence(record)]
+    hits += fields
+    for target in dict.fromkeys(targets):
+        pattern = DELIVERABLE_PATTERNS.get(target)
+        if pattern is None:
+            continue
+        deliverable = f"deliverable:{program}/{target}"
+        for node, text in hits:
+            m = pattern.search(text)
+            if m:
+                edges.append((deliverable, node, "deliverable", f"{target}: {m.group()!r}"))
+
+    superseded_by, supersedes = _get(record, "audit", "superseded_by"), _get(record, "audit", "supersedes")
+    if isinstance(superseded_by, str):
+        edges.append((me, f"decision:{superseded_by}", "superseded_by", None))
+    if isinstance(supersedes, str):
+        edges.append((f"decision:{supersedes}", me, "supersedes", None))
+    return nodes, edges
+
+
+# -----------------------------
+# Traversal
+# -----------------------------
+
+
+def impact(conn, starts: List[str], max_depth: int = 6, max_nodes: int = 5000) -> dict:
+    """
+    Breadth-first traversal of impact_edges from `starts`, at most
+    `max_depth` edges deep and `max_nodes` nodes wide.
+
+    Returns {"changed", "affected_decisions", "affected", "truncated"}, where
+    every affected node records its depth, the node it was reached from, the
+    edge kind and reason, and whether the edge was inferred from text
+    (heuristic; see HEURISTIC_EDGES).
+    """
+    reached: Dict[str, tuple] = {node: (0, None, None, None) for node in starts}
+    queue = deque(starts)
+    truncated = False
+    while queue and not truncated:
+        node = queue.popleft()
+        depth = reached[node][0]
+        if depth >= max_depth:
+            truncated = truncated or conn.execute("SELECT 1 FROM impact_edges WHERE src = ? LIMIT 1", (node,)).fetchone() is not None
+            continue
+        for dst, kind, detail in conn.execute(
+            "SELECT DISTINCT dst, kind, detail FROM impact_edges WHERE src = ? ORDER BY dst, kind", (node,)
+        ).fetchall():
+            if dst in reached:
+                continue
+            if len(reached) >= max_nodes:
+                truncated = True
+                break
+            reached[dst] = (depth + 1, node, kind, detail)
+            queue.append(dst)
+
+    affected = []
+    for node, (depth, parent, kind, detail) in reached.items():
+        if parent is None:
+            continue
+        info = conn.execute(
+            "SELECT kind, decision_id, field, item_id FROM impact_nodes WHERE node = ? LIMIT 1", (node,)
+        ).fetchone()
+        if info is None:  # e.g. a supersession link to a decision outside the corpus
+            kind_, _, rest = node.partition(":")
+            info = (kind_, rest if kind_ == "decision" else None, None, None)
+        affected.append(
+            {
+                "node": node,
+                "kind": info[0],
+                "decision_id": info[1],
+                "field": info[2],
+                "item_id": info[3],
+                "depth": depth,
+                "from": parent,
+                "edge": kind,
+                "reason": detail,
+                "heuristic": kind in HEURISTIC_EDGES,
+            }
+        )
+    affected.sort(key=lambda a: (a["depth"], a["decision_id"] or "", a["node"]))
+    decisions = sorted({a["decision_id"] for a in affected if a["kind"] == "decision" and a["decision_id"]})
+    return {"changed": starts, "affected_decisions": decisions, "affected": affected, "truncated": truncated}
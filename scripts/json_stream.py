@@ -0,0 +1,339 @@
+"""
+RGDS streaming JSON reader — json_stream.py
+
+Purpose
+-------
+Reads decision logs one record at a time from NDJSON or concatenated JSON
+(pretty-printed or not) so bulk exports can be validated without exploding
+them into individual files and without holding the whole input in memory.
+
+How it works
+------------
+Text is read in fixed-size chunks. A small scanner finds where each
+top-level value ends by tracking {} / [] depth and skipping string literals
+(regex-driven, so the per-character work happens in C); values that are
+already fully buffered skip the scan and are decoded in place. Consumed
+text is dropped as chunks arrive, so the buffer never holds more than the
+current record plus one chunk.
+
+Malformed input does not stop the stream: a record that fails to decode,
+or stray top-level text that is not an object/array, is yielded as an
+error and scanning resumes at the next value. An invalid scalar array
+element ("tru") is reported without reading further ahead and skipped up
+to the next "," or "]" of its array.
+
+Single-array exports
+--------------------
+iter_array_elements() walks one top-level JSON array ("[ {...}, {...} ]",
+as some upstream systems export) element by element on the same buffer,
+so a multi-GB array is validated with memory bounded by its largest
+element rather than by the file.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator, NamedTuple, TextIO
+
+CHUNK_SIZE = 1 << 16
+
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_ELEMENT_STRUCTURAL = re.compile(r'[{}\[\]",]')
+_STRING_TAIL = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+_NON_WS = re.compile(r"\S")
+_DECODER = json.JSONDecoder()
+_SCALAR_LOOKAHEAD = 32  # floor on scalar lookahead, for tiny chunk sizes
+
+
+class StreamRecord(NamedTuple):
+    """One top-level JSON value read from a stream."""
+
+    index: int  # 0-based record number
+    line: int  # 1-based line on which the record starts
+    value: Any  # decoded value (None if error is set)
+    error: str | None  # decode / framing error, if any
+
+
+class _Buffer:
+    """
+    Chunked text buffer. text[pos:] is unread; consumed text is only dropped
+    when the next chunk is appended, so consuming a record never copies the
+    rest of the buffer.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.line = 1  # line number at text[pos]
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append one chunk. Shifts offsets: callers re-derive them from self.pos."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def consume(self, end: int) -> str:
+        """Consume text[pos:end] and return it."""
+        taken = self.text[self.pos:end]
+        self.line += self.text.count("\n", self.pos, end)
+        self.pos = end
+        return taken
+
+    def skip_whitespace(self) -> bool:
+        """Advance to the next non-whitespace character; False at end of input."""
+        while True:
+            m = _NON_WS.search(self.text, self.pos)
+            if m is not None:
+                self.consume(m.start())
+                return True
+            self.consume(len(self.text))
+            if not self.fill():
+                return False
+
+    def peek(self) -> str:
+        return self.text[self.pos]
+
+    def line_end(self) -> int:
+        """Offset of the next newline (or end of input), reading more as needed."""
+        nl = self.text.find("\n", self.pos)
+        while nl < 0:
+            scanned = len(self.text) - self.pos
+            if not self.fill():
+                return len(self.text)
+            nl = self.text.find("\n", self.pos + scanned)
+        return nl
+
+    def string_end(self) -> int | None:
+        """
+        Offset just past the string literal starting at text[pos], reading
+        more input as needed. None if the input ends first.
+        """
+        tail = _STRING_TAIL.match(self.text, self.pos + 1)
+        while tail is None:
+            if not self.fill():
+                return None
+            tail = _STRING_TAIL.match(self.text, self.pos + 1)
+        return tail.end()
+
+    def skip_element(self) -> None:
+        """
+        Consume text up to the next "," or "]" outside any nested value or
+        string (the end of the current array element), or to end of input.
+        """
+        depth = 0
+        while True:
+            m = _ELEMENT_STRUCTURAL.search(self.text, self.pos)
+            if m is None:
+                self.consume(len(self.text))
+                if not self.fill():
+                    return
+                continue
+
+            ch = m.group()
+            if ch == '"':
+                self.consume(m.start())
+                end = self.string_end()
+                if end is None:
+                    self.consume(len(self.text))
+                    return
+                self.consume(end)
+                continue
+            if depth == 0 and ch in ",]":
+                self.consume(m.start())
+                return
+            self.consume(m.end())
+            if ch in "{[":
+                depth += 1
+            elif depth:
+                depth -= 1
+
+    def value_end(self) -> int | None:
+        """
+        Offset just past the object/array starting at text[pos], reading more
+        input as needed. None if the input ends first.
+        """
+        depth = 0
+        rel = 0  # scan position relative to self.pos (stable across fill())
+        while True:
+            m = _STRUCTURAL.search(self.text, self.pos + rel)
+            if m is None:
+                rel = len(self.text) - self.pos
+                if not self.fill():
+                    return None
+                continue
+
+            ch = m.group()
+            if ch == '"':
+                start = m.end() - self.pos
+                tail = _STRING_TAIL.match(self.text, self.pos + start)
+                while tail is None:
+                    if not self.fill():
+                        return None
+                    tail = _STRING_TAIL.match(self.text, self.pos + start)
+                rel = tail.end() - self.pos
+                continue
+
+            rel = m.end() - self.pos
+            depth += 1 if ch in "{[" else -1
+            if depth == 0:
+                return self.pos + rel
+
+
+def _read_value(buf: _Buffer) -> tuple[Any, str | None] | None:
+    """
+    Decode the value starting at buf.text[buf.pos] and consume it.
+
+    Returns (value, error), or None if the input ends inside the value.
+    """
+    # Fast path: keep at least one chunk of lookahead so any record
+    # smaller than a chunk is fully buffered and the C decoder finds its
+    # end directly. Larger records are scanned for their end (reading
+    # more input) and decoded once, keeping them linear too.
+    if len(buf.text) - buf.pos < buf.chunk_size:
+        buf.fill()
+
+    if buf.peek() not in "{[":
+        return _read_scalar(buf)
+
+    try:
+        value, end = _DECODER.raw_decode(buf.text, buf.pos)
+        error = None
+    except ValueError:
+        end = buf.value_end()
+        if end is None:
+            return None
+        try:
+            value, error = json.loads(buf.text[buf.pos:end]), None
+        except ValueError as e:
+            value, error = None, f"Invalid JSON: {e}"
+
+    buf.consume(end)
+    return value, error
+
+
+def _read_scalar(buf: _Buffer) -> tuple[Any, str | None] | None:
+    """
+    Decode the scalar at buf.text[buf.pos] (only legal as an array element)
+    and consume it; None if the input ends inside a string.
+
+    A string is scanned for its closing quote. A literal or number fits in
+    one chunk of lookahead; more input is read only while a number runs to
+    the end of the buffer ("1" + ".5"). Anything else is reported without
+    reading further, and skipped up to the next "," or "]" so the array
+    walk can resume.
+    """
+    if buf.peek() == '"':
+        end = buf.string_end()
+        if end is None:
+            return None
+        try:
+            value, error = json.loads(buf.text[buf.pos:end]), None
+        except ValueError as e:
+            value, error = None, f"Invalid JSON: {e}"
+        buf.consume(end)
+        return value, error
+
+    while len(buf.text) - buf.pos < _SCALAR_LOOKAHEAD and buf.fill():
+        pass
+    try:
+        value, end = _DECODER.raw_decode(buf.text, buf.pos)
+        while end == len(buf.text) and buf.fill():
+            value, end = _DECODER.raw_decode(buf.text, buf.pos)
+    except ValueError as e:
+        buf.skip_element()
+        return None, f"Invalid JSON: {e}"
+    buf.consume(end)
+    return value, None
+
+
+def iter_records(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[StreamRecord]:
+    """
+    Yield every top-level JSON value in `stream` (NDJSON or concatenated JSON).
+
+    Memory is bounded by the largest single record plus one chunk.
+    """
+    buf = _Buffer(stream, chunk_size)
+    index = 0
+
+    while buf.skip_whitespace():
+        line = buf.line
+
+        if buf.peek() not in "{[":
+            # Stray top-level text: report it and resynchronise at the next line.
+            junk = buf.consume(buf.line_end())
+            yield StreamRecord(index, line, None, f"Expected a JSON object or array, found: {junk[:40]!r}")
+            index += 1
+            continue
+
+        decoded = _read_value(buf)
+        if decoded is None:
+            yield StreamRecord(index, line, None, "Unexpected end of input inside a JSON value")
+            return
+        yield StreamRecord(index, line, *decoded)
+        index += 1
+
+
+def iter_array_elements(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[StreamRecord]:
+    """
+    Yield the elements of one top-level JSON array (a single-file export),
+    each as soon as it is complete; StreamRecord.index is the array index.
+
+    The array itself is never materialised: memory is bounded by the
+    largest single element plus one chunk. An element that fails to decode
+    is yielded as an error and walking continues with the next element;
+    broken framing (a missing "," or "]", or text after the array) ends the
+    walk with an error record.
+    """
+    buf = _Buffer(stream, chunk_size)
+
+    if not buf.skip_whitespace() or buf.peek() != "[":
+        found = "end of input" if buf.eof and buf.pos >= len(buf.text) else repr(buf.text[buf.pos : buf.pos + 40])
+        yield StreamRecord(0, buf.line, None, f"Expected a top-level JSON array, found: {found}")
+        return
+    buf.consume(buf.pos + 1)
+
+    index = 0
+    expect_value = None  # None: first element or "]"; True: after ","; False: after a value
+    while True:
+        if not buf.skip_whitespace():
+            yield StreamRecord(index, buf.line, None, "Unexpected end of input inside the top-level array")
+            return
+        line, ch = buf.line, buf.peek()
+
+        if expect_value is False:
+            if ch == ",":
+                buf.consume(buf.pos + 1)
+                expect_value = True
+                continue
+            if ch == "]":
+                break
+            yield StreamRecord(index, line, None, f"Expected ',' or ']' after array element {index - 1}, found: {ch!r}")
+            return
+
+        if ch == "]" and expect_value is None:
+            break  # empty array
+        if ch in ",]":
+            yield StreamRecord(index, line, None, f"Expected an array element, found: {ch!r}")
+            return
+
+        decoded = _read_value(buf)
+        if decoded is None:
+            yield StreamRecord(index, line, None, "Unexpected end of input inside a JSON value")
+            return
+        yield StreamRecord(index, line, *decoded)
+        index += 1
+        expect_value = False
+
+    buf.consume(buf.pos + 1)
+    if buf.skip_whitespace():
+        yield StreamRecord(index, buf.line, None, "Unexpected data after the top-level array")
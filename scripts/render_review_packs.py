@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""
+RGDS Render Script — render_review_packs.py
+
+Purpose
+-------
+Renders one reviewer / audit pack per decision log, Markdown and/or HTML,
+covering what docs/reviewer-audit-checklist.md asks a reviewer to find:
+
+    header        decision, program, gate, status, owner
+    question      decision_question
+    outcome       outcome, selected option, rationale, options considered
+    conditions    conditions (owner, due date, evidence to close) and actions
+    evidence      evidence_completeness, per-item completeness / confidence
+                  and quality notes, known gaps and assumptions
+    risk          residual risk statement and key risks
+    approvals     decision owner, approvals, final sign-off, authority scope
+    ai            AI disclosure (use cases, artifacts, human review) or "not used"
+    audit         propagation, supersession, retention, change log
+
+plus an index page linking every pack. Packs are derived, read-only
+output; the decision log JSON remains the authoritative record.
+
+How it works
+------------
+- Each pack is a fixed list of section builders producing neutral blocks
+  (headings, key/value lists, tables), emitted as Markdown or HTML into page
+  shells that are compiled once per process (string.Template); no template
+  is parsed per record.
+- Packs are rendered across a process pool (--jobs); each worker reads,
+  renders and writes its own packs, so only small summaries travel back.
+- Incremental: a manifest records each input's (mtime, size), SHA-256 and
+  outputs. Inputs whose stat is unchanged are skipped without being read;
+  inputs that were touched but hash the same are skipped without being
+  rendered. Editing this script (templates or sections; RENDER_VERSION
+  folds in its hash) or changing --format re-renders everything. Packs of
+  inputs that left the corpus are removed.
+
+Typical usage
+-------------
+    python3 scripts/render_review_packs.py
+    python3 scripts/render_review_packs.py path/to/archive --output build/packs/gate-3 --jobs 8
+    python3 scripts/render_review_packs.py --format html --full
+
+Exit codes
+----------
+0 — Packs up to date
+1 — Packs written, but some inputs could not be read (or rendered) and were skipped
+2 — Script/configuration error
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from string import Template
+
+from corpus_inputs import collect_inputs
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUTPUT = ROOT / "build" / "review-packs"
+MANIFEST_NAME = "packs.manifest.json"
+FORMATS = ("md", "html")
+
+MD_PAGE = Template("# Review pack — $decision_id\n\n$body\n---\n\n$footer\n")
+HTML_PAGE = Template(
+    "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n<title>Review pack — $decision_id</title>\n"
+    "<style>\n$style\n</style>\n</head>\n<body>\n<h1>Review pack — $decision_id</h1>\n$body\n<hr>\n<p class=\"footer\">$footer</p>\n"
+    "</body>\n</html>\n"
+)
+HTML_STYLE = (
+    "body{font-family:system-ui,sans-serif;max-width:72rem;margin:2rem auto;padding:0 1rem;color:#222}"
+    "table{border-collapse:collapse;margin:.5rem 0 1rem}th,td{border:1px solid #ccc;padding:.3rem .5rem;"
+    "text-align:left;vertical-align:top}th{background:#f3f3f3}dt{font-weight:600}dd{margin:0 0 .4rem 1rem}"
+    ".footer{color:#666;font-size:.85rem}"
+)
+
+# Packs depend on the templates and section builders in this file, so its own hash is part of the version.
+RENDER_VERSION = "1:" + hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+
+
+# -----------------------------
+# Sections
+# -----------------------------
+# A builder takes a record and returns blocks:
+#   ("h2", text)  ("p", text)  ("kv", [(label, value), ...])  ("table", headers, rows)
+
+def _get(d, *keys):
+    for k in keys:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(k)
+    return d
+
+
+def _list(value) -> list:
+    return value if isinstance(value, list) else []
+
+
+def _dict(value) -> dict:
+    return value if isinstance(value, dict) else {}
+
+
+def _person(p) -> str:
+    if not isinstance(p, dict):
+        return ""
+    name, role = _text(p.get("name")), _text(p.get("role"))
+    return f"{name} ({role})" if name and role else name or role
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, list):
+        return ", ".join(_text(v) for v in value)
+    if isinstance(value, dict):
+        return _person(value) if "name" in value else json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _join(sep: str, *values) -> str:
+    return sep.join(t for t in map(_text, values) if t)
+
+
+def _header(r: dict) -> list:
+    gate = _dict(r.get("gate"))
+    return [
+        ("kv", [
+            ("Title", r.get("decision_title")),
+            ("Program", _get(r, "program_context", "program_id")),
+            ("Gate", _join(" — ", gate.get("gate_name"), gate.get("gate_date"))),
+            ("Decision deadline", gate.get("decision_deadline")),
+            ("Status", r.get("status")),
+            ("Category", r.get("decision_category")),
+            ("Decision owner", _person(_get(r, "governance", "decision_owner"))),
+            ("Created", _join(" by ", r.get("created_at"), _person(r.get("created_by")))),
+        ]),
+        ("h2", "Decision question"),
+        ("p", r.get("decision_question")),
+    ]
+
+
+def _outcome(r: dict) -> list:
+    outcome = _dict(r.get("decision_outcome"))
+    selected = outcome.get("selected_option_id")
+    options = [
+        [o.get("option_id"), "✓" if o.get("option_id") == selected else "", o.get("description")]
+        for o in _list(r.get("options_considered"))
+        if isinstance(o, dict)
+    ]
+    return [
+        ("h2", "Outcome"),
+        ("kv", [("Outcome", outcome.get("outcome")), ("Selected option", selected), ("Rationale", outcome.get("rationale_summary"))]),
+        ("table", ["Option", "Selected", "Description"], options),
+    ]
+
+
+def _conditions(r: dict) -> list:
+    conditions = [
+        [c.get("condition"), _person(c.get("owner")), c.get("due_date"), c.get("evidence_to_close")]
+        for c in _list(_get(r, "decision_outcome", "conditions"))
+        if isinstance(c, dict)
+    ]
+    actions = [
+        [a.get("action_id"), a.get("description"), _person(a.get("owner")), a.get("due_date"), a.get("status")]
+        for a in _list(r.get("actions"))
+        if isinstance(a, dict)
+    ]
+    return [
+        ("h2", "Conditions and actions"),
+        ("table", ["Condition", "Owner", "Due", "Evidence to close"], conditions),
+        ("table", ["Action", "Description", "Owner", "Due", "Status"], actions),
+    ]
+
+
+def _evidence(r: dict) -> list:
+    completeness = _dict(r.get("evidence_completeness"))
+    items = [e for e in _list(_get(r, "evidence", "evidence_items")) if isinstance(e, dict)]
+    tally: dict = {}
+    for e in items:
+        for key in ("completeness_state", "confidence"):
+            if isinstance(e.get(key), str):
+                tally[e[key]] = tally.get(e[key], 0) + 1
+    posture = "; ".join(
+        ", ".join(f"{tally[k]} {k}" for k in keys if tally.get(k))
+        for keys in (("complete", "partial", "placeholder"), ("high", "medium", "low"))
+        if any(tally.get(k) for k in keys)
+    )
+    gaps = _dict(r.get("known_gaps_and_assumptions"))
+    return [
+        ("h2", "Evidence posture"),
+        ("kv", [
+            ("Completeness", completeness.get("state")),
+            ("Expected resolution", completeness.get("expected_resolution_date")),
+            ("Author at risk", completeness.get("author_at_risk")),
+            ("Notes", completeness.get("notes")),
+            ("Items", f"{len(items)} ({posture} confidence)" if posture else str(len(items))),
+        ]),
+        ("table", ["Evidence", "Title", "Source", "Completeness", "Confidence", "Quality notes"], [
+            [e.get("evidence_id"), e.get("title"), e.get("source_system"), e.get("completeness_state"), e.get("confidence"), e.get("quality_notes")]
+            for e in items
+        ]),
+        ("table", ["Known gap", "Impact", "Mitigation"], [
+            [g.get("gap"), g.get("impact"), g.get("mitigation_plan")] for g in _list(gaps.get("gaps")) if isinstance(g, dict)
+        ]),
+        ("table", ["Assumption", "Risk if wrong", "How to verify"], [
+            [a.get("assumption"), a.get("risk_if_wrong"), a.get("how_to_verify")] if isinstance(a, dict) else [a, None, None]
+            for a in _list(gaps.get("assumptions"))
+        ]),
+    ]
+
+
+def _risk(r: dict) -> list:
+    risk = _dict(r.get("risk_assessment"))
+    return [
+        ("h2", "Residual risk"),
+        ("kv", [("Residual risk", risk.get("residual_risk_statement")), ("Risk acceptance required", risk.get("risk_acceptance_required"))]),
+        ("table", ["Risk", "Severity", "Likelihood", "Mitigation", "Owner"], [
+            [k.get("risk"), k.get("severity"), k.get("likelihood"), k.get("mitigation"), _person(k.get("owner"))]
+            for k in _list(risk.get("key_risks"))
+            if isinstance(k, dict)
+        ]),
+    ]
+
+
+def _approvals(r: dict) -> list:
+    gov = _dict(r.get("governance"))
+    signoff = _dict(gov.get("final_signoff"))
+    return [
+        ("h2", "Approvals"),
+        ("kv", [
+            ("Approval method", gov.get("approval_method")),
+            ("Approvers", ", ".join(_person(p) for p in _list(gov.get("approvers")))),
+            ("Reviewers", ", ".join(_person(p) for p in _list(gov.get("reviewers")))),
+            ("Final sign-off", _join(" at ", _person(signoff.get("person")), signoff.get("timestamp"))),
+            ("Authority scope", _text(gov.get("authority_scope"))),
+            ("Escalation path", _text(gov.get("escalation_path"))),
+        ]),
+        ("table", ["Approver", "Decision", "Timestamp", "Comments"], [
+            [_person(a.get("person")), a.get("decision"), a.get("timestamp"), a.get("comments")]
+            for a in _list(gov.get("approvals"))
+            if isinstance(a, dict)
+        ]),
+    ]
+
+
+def _ai(r: dict) -> list:
+    ai = _dict(r.get("ai_assistance"))
+    if not ai.get("used"):
+        return [("h2", "AI disclosure"), ("p", "AI assistance: not used.")]
+    return [
+        ("h2", "AI disclosure"),
+        ("kv", [
+            ("Tool", ai.get("tool_name")),
+            ("Purpose", ai.get("tool_purpose")),
+            ("Use cases", _text(ai.get("use_cases"))),
+            ("Confidence band", ai.get("confidence_band")),
+            ("Disclosure notes", ai.get("disclosure_notes")),
+        ]),
+        ("table", ["Artifact", "Description", "Human reviewer", "Disposition"], [
+            [a.get("artifact_id"), a.get("description"), _person(a.get("human_reviewer")), a.get("disposition")]
+            for a in _list(ai.get("artifacts"))
+            if isinstance(a, dict)
+        ]),
+    ]
+
+
+def _audit(r: dict) -> list:
+    audit = _dict(r.get("audit"))
+    return [
+        ("h2", "Propagation and audit trail"),
+        ("kv", [
+            ("Propagation required", _text(r.get("propagation_required")) or "none declared"),
+            ("Record version", audit.get("record_version")),
+            ("Supersedes", audit.get("supersedes")),
+            ("Superseded by", audit.get("superseded_by")),
+            ("Retention class", audit.get("retention_class")),
+        ]),
+        ("table", ["Version", "Changed at", "Changed by", "Summary"], [
+            [c.get("version"), c.get("changed_at"), _person(c.get("changed_by")), c.get("summary")]
+            for c in _list(audit.get("change_log"))
+            if isinstance(c, dict)
+        ]),
+    ]
+
+
+SECTIONS = (_header, _outcome, _conditions, _evidence, _risk, _approvals, _ai, _audit)
+
+
+# -----------------------------
+# Emitters
+# -----------------------------
+
+def _md_cell(value) -> str:
+    return _text(value).replace("|", "\\|").replace("\n", "<br>")
+
+
+def emit_markdown(blocks: list) -> str:
+    out = []
+    for block in blocks:
+        kind = block[0]
+        if kind == "h2":
+            out.append(f"## {block[1]}\n")
+        elif kind == "p":
+            out.append(f"{_text(block[1]) or '—'}\n")
+        elif kind == "kv":
+            out.append("\n".join(f"- **{label}:** {_md_cell(value)}" for label, value in block[1] if _text(value)) + "\n")
+        elif kind == "table" and block[2]:
+            headers, rows = block[1], block[2]
+            lines = ["| " + " | ".join(headers) + " |", "|" + "|".join("---" for _ in headers) + "|"]
+            lines += ["| " + " | ".join(_md_cell(v) for v in row) + " |" for row in rows]
+            out.append("\n".join(lines) + "\n")
+    return "\n".join(out)
+
+
+def emit_html(blocks: list) -> str:
+    esc = html.escape
+    out = []
+    for block in blocks:
+        kind = block[0]
+        if kind == "h2":
+            out.append(f"<h2>{esc(block[1])}</h2>")
+        elif kind == "p":
+            out.append(f"<p>{esc(_text(block[1]) or '—')}</p>")
+        elif kind == "kv":
+            pairs = "".join(f"<dt>{esc(label)}</dt><dd>{esc(_text(value))}</dd>" for label, value in block[1] if _text(value))
+            out.append(f"<dl>{pairs}</dl>")
+        elif kind == "table" and block[2]:
+            head = "".join(f"<th>{esc(h)}</th>" for h in block[1])
+            body = "".join("<tr>" + "".join(f"<td>{esc(_text(v))}</td>" for v in row) + "</tr>" for row in block[2])
+            out.append(f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>")
+    return "\n".join(out)
+
+
+def render_pack(record: dict, source: str, digest: str, fmt: str) -> str:
+    blocks = [b for section in SECTIONS for b in section(record)]
+    decision_id = _text(record.get("decision_id")) or "(no decision_id)"
+    footer = f"Rendered from {source} (sha256 {digest[:12]}) by render_review_packs.py. The decision log JSON is authoritative."
+    if fmt == "md":
+        return MD_PAGE.substitute(decision_id=decision_id, body=emit_markdown(blocks), footer=footer)
+    return HTML_PAGE.substitute(decision_id=html.escape(decision_id), style=HTML_STYLE, body=emit_html(blocks), footer=html.escape(footer))
+
+
+def summary_row(record: dict) -> dict:
+    """What the index page shows for one pack."""
+    return {
+        "decision_id": record.get("decision_id"),
+        "title": record.get("decision_title"),
+        "gate": _get(record, "gate", "gate_name"),
+        "outcome": _get(record, "decision_outcome", "outcome"),
+        "status": record.get("status"),
+        "conditions": len(_list(_get(record, "decision_outcome", "conditions"))),
+    }
+
+
+# -----------------------------
+# Worker
+# -----------------------------
+
+def render_one(task: tuple) -> dict:
+    """
+    Render the packs for one input unless its content hash equals `prior_hash`.
+
+    task = (path, name, out_dir, formats, prior_hash). Returns {"path", "state"
+    ("rendered" / "unchanged" / "failed"), "hash", "mtime_ns", "size", "row", "error"}.
+    """
+    path, name, out_dir, formats, prior_hash = task
+    result = {"path": path, "state": "failed", "hash": None, "mtime_ns": None, "size": None, "row": None, "error": None}
+    try:
+        st = os.stat(path)
+        data = Path(path).read_bytes()
+    except OSError as e:
+        result["error"] = f"Skipped unreadable file: {path}\n  {e}"
+        return result
+    digest = hashlib.sha256(data).hexdigest()
+    result.update(hash=digest, mtime_ns=st.st_mtime_ns, size=st.st_size)
+    if digest == prior_hash:
+        result["state"] = "unchanged"
+        return result
+    try:
+        record = json.loads(data.decode("utf-8"))
+    except Exception as e:
+        result["error"] = f"Skipped unreadable JSON: {path}\n  {e}"
+        return result
+    if not isinstance(record, dict):
+        result["error"] = f"Skipped non-object JSON: {path}"
+        return result
+    try:
+        pages = {fmt: render_pack(record, path, digest, fmt) for fmt in formats}
+    except Exception as e:
+        # Section builders guard every field they read; this is a last resort so that a
+        # shape they still miss skips one record instead of ending the run.
+        result["error"] = f"Skipped record that could not be rendered: {path}\n  {type(e).__name__}: {e}"
+        return result
+    for fmt, page in pages.items():
+        target = Path(out_dir) / f"{name}.{fmt}"
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        tmp.write_text(page, encoding="utf-8")
+        os.replace(tmp, target)
+    result.update(state="rendered", row=summary_row(record))
+    return result
+
+
+def run_tasks(tasks: list, jobs: int):
+    """Yield render_one results; in-process for one job, else across a process pool."""
+    if jobs <= 1 or len(tasks) < 2:
+        yield from map(render_one, tasks)
+        return
+    jobs = min(jobs, len(tasks))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(render_one, tasks, chunksize=max(1, len(tasks) // (jobs * 4)))
+
+
+# -----------------------------
+# Index and manifest
+# -----------------------------
+
+def pack_names(paths: list) -> dict:
+    """Output stem per input: the file stem, disambiguated by a path hash when stems collide."""
+    stems: dict = {}
+    for p in paths:
+        stems.setdefault(p.stem, []).append(p)
+    names = {}
+    for stem, group in stems.items():
+        for p in group:
+            names[str(p)] = stem if len(group) == 1 else f"{stem}-{hashlib.sha256(str(p).encode('utf-8')).hexdigest()[:8]}"
+    return names
+
+
+def write_index(out_dir: Path, entries: list, formats: tuple) -> None:
+    """index.<fmt> linking every pack, ordered by decision_id."""
+    entries = sorted(entries, key=lambda e: (str(e["row"].get("decision_id") or ""), e["name"]))
+    headers = ["Decision", "Title", "Gate", "Outcome", "Status", "Conditions"]
+    for fmt in formats:
+        rows = [
+            [f"{e['name']}.{fmt}", e["row"].get("decision_id") or e["name"], e["row"].get("title"), e["row"].get("gate"),
+             e["row"].get("outcome"), e["row"].get("status"), e["row"].get("conditions")]
+            for e in entries
+        ]
+        if fmt == "md":
+            lines = [f"# Review packs ({len(rows)})", "", "| " + " | ".join(headers) + " |", "|" + "|".join("---" for _ in headers) + "|"]
+            lines += [f"| [{_md_cell(r[1])}]({r[0]}) | " + " | ".join(_md_cell(v) for v in r[2:]) + " |" for r in rows]
+            text = "\n".join(lines) + "\n"
+        else:
+            body = "".join(
+                f"<tr><td><a href=\"{html.escape(r[0])}\">{html.escape(_text(r[1]))}</a></td>"
+                + "".join(f"<td>{html.escape(_text(v))}</td>" for v in r[2:])
+                + "</tr>"
+                for r in rows
+            )
+            table = "<table><thead><tr>" + "".join(f"<th>{h}</th>" for h in headers) + f"</tr></thead><tbody>{body}</tbody></table>"
+            text = HTML_PAGE.substitute(decision_id="index", style=HTML_STYLE, body=table, footer=f"{len(rows)} pack(s)")
+        (out_dir / f"index.{fmt}").write_text(text, encoding="utf-8")
+
+
+def load_manifest(path: Path, formats: tuple) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if manifest.get("version") != RENDER_VERSION or manifest.get("formats") != list(formats):
+        return {}
+    return manifest.get("files", {})
+
+
+# -----------------------------
+# Entry point
+# -----------------------------
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="render_review_packs.py",
+        description="Render reviewer / audit packs (Markdown, HTML) from RGDS decision logs.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("paths", nargs="*", help="Directories, files, or glob patterns. Default: examples/")
+    p.add_argument("--output", type=str, default=str(DEFAULT_OUTPUT), help="Output directory. Default: build/review-packs")
+    p.add_argument("--format", dest="fmt", choices=("md", "html", "both"), default="both", help="Pack format(s). Default: both")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes. Default: CPU core count")
+    p.add_argument("--full", action="store_true", help="Ignore the manifest and re-render every pack.")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.jobs < 1:
+        print("[ERROR] --jobs must be at least 1")
+        sys.exit(2)
+    formats = FORMATS if args.fmt == "both" else (args.fmt,)
+    out_dir = Path(args.output).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+
+    inputs = collect_inputs(args.paths)
+    if not inputs:
+        print("[ERROR] No decision log JSON files found.")
+        sys.exit(2)
+    old = {} if args.full else load_manifest(manifest_path, formats)
+    names = pack_names([path for _, path in inputs])
+
+    files, tasks, skipped = {}, [], 0
+    for _, path in inputs:
+        key = str(path)
+        prior = old.get(key)
+        fresh = prior is not None and prior["name"] == names[key] and all((out_dir / f"{prior['name']}.{fmt}").exists() for fmt in formats)
+        try:
+            st = path.stat()
+        except OSError as e:
+            print(f"[WARN] Skipped unreadable file: {path}\n  {e}")
+            skipped += 1
+            continue
+        if fresh and prior["mtime_ns"] == st.st_mtime_ns and prior["size"] == st.st_size:
+            files[key] = prior
+            continue
+        tasks.append((key, names[key], str(out_dir), formats, prior["hash"] if fresh else None))
+
+    rendered = 0
+    for result in run_tasks(tasks, args.jobs):
+        key = result["path"]
+        if result["state"] == "failed":
+            print(f"[WARN] {result['error']}")
+            skipped += 1
+            continue
+        entry = old[key] if result["state"] == "unchanged" else {"name": names[key], "row": result["row"]}
+        files[key] = {**entry, "hash": result["hash"], "mtime_ns": result["mtime_ns"], "size": result["size"]}
+        if result["state"] == "rendered":
+            rendered += 1
+
+    removed = 0
+    for key, prior in old.items():
+        if key not in files and not any(e["name"] == prior["name"] for e in files.values()):
+            for fmt in formats:
+                (out_dir / f"{prior['name']}.{fmt}").unlink(missing_ok=True)
+            removed += 1
+
+    write_index(out_dir, list(files.values()), formats)
+    tmp = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"version": RENDER_VERSION, "formats": list(formats), "files": files}, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, manifest_path)
+
+    print(
+        f"[{'WARN' if skipped else 'PASS'}] Review packs up to date: {len(files)} decision(s) "
+        f"({rendered} rendered, {len(files) - rendered} unchanged, {removed} removed, {skipped} skipped)"
+    )
+    print(f"  Packs: {out_dir}")
+    sys.exit(1 if skipped else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+RGDS schema compilation cache — schema_cache.py
+
+Purpose
+-------
+Shared by validate_decision_log.py and validate_all_examples.py so both
+entry points build their validator the same way, from the same compiled
+schema, without redoing the work on every invocation.
+
+What "compiled" means here
+--------------------------
+decision-log.schema.json routes every nested structure (person_ref,
+evidence_item, action, ...) through a local "#/$defs/..." $ref. jsonschema
+resolves those references through its registry each time a validator
+descends into one. Compilation inlines every local $ref whose node carries
+no sibling keywords, once, producing an equivalent reference-free schema.
+
+- Error messages and instance paths are unchanged (the same subschemas are
+  evaluated in the same keyword order), so validator output is identical.
+- Recursive references (none today) are left as $ref, and $defs is kept
+  whenever any reference remains.
+
+Caching
+-------
+Compiled schemas are keyed by the SHA-256 of the schema file bytes plus
+COMPILER_VERSION and persisted as JSON under the cache directory:
+
+    $RGDS_CACHE_DIR            (if set)
+    <repo>/.rgds_cache         (default)
+
+The cache is best-effort: an unreadable or unwritable cache never fails
+validation, it only costs a recompile. Within one process, compiled schemas
+and validators are also memoized.
+
+jsonschema itself is only imported when a validator is built, so importing
+this module (e.g. for CACHE_DIR or content_hash) stays cheap.
+
+collect_schema_errors() is the one place both CLIs turn a validator's error
+stream into a sorted, optionally bounded, list.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+
+# Bump when compile_schema() output changes so stale cache entries are ignored.
+COMPILER_VERSION = "1"
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = Path(os.environ.get("RGDS_CACHE_DIR") or (ROOT / ".rgds_cache"))
+
+LOCAL_DEFS_PREFIX = "#/$defs/"
+
+_COMPILED: Dict[str, Dict[str, Any]] = {}
+_VALIDATORS: Dict[Tuple[str, bool], Draft202012Validator] = {}
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest of raw file bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+_SOURCE_HASHES: Dict[Tuple[str, ...], str] = {}
+
+
+def source_hash(*modules: str) -> str:
+    """
+    SHA-256 over the source of the named sibling modules (e.g. "semantic_rules").
+
+    Result caches put this in their keys so that any edit to the validation
+    logic invalidates stored results without a manual version bump.
+    """
+    if modules not in _SOURCE_HASHES:
+        h = hashlib.sha256()
+        for name in modules:
+            h.update(name.encode("utf-8") + b"\0")
+            try:
+                h.update((SCRIPTS_DIR / f"{name}.py").read_bytes())
+            except OSError:
+                h.update(b"<missing>")
+        _SOURCE_HASHES[modules] = h.hexdigest()
+    return _SOURCE_HASHES[modules]
+
+
+def compile_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of `schema` with local "#/$defs/<name>" references inlined.
+
+    Only pure {"$ref": ...} nodes are replaced; nodes with sibling keywords
+    and recursive references are kept as-is so semantics never change.
+    """
+    defs = schema.get("$defs") or {}
+    unresolved = False
+
+    def inline(node: Any, stack: Tuple[str, ...]) -> Any:
+        nonlocal unresolved
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if len(node) == 1 and isinstance(ref, str) and ref.startswith(LOCAL_DEFS_PREFIX):
+                name = ref[len(LOCAL_DEFS_PREFIX):]
+                if name in defs and name not in stack:
+                    return inline(defs[name], stack + (name,))
+                unresolved = True
+                return node
+            if "$ref" in node:
+                unresolved = True
+            return {k: (v if k == "$defs" else inline(v, stack)) for k, v in node.items()}
+        if isinstance(node, list):
+            return [inline(v, stack) for v in node]
+        return node
+
+    compiled = inline(schema, ())
+    if not unresolved:
+        compiled.pop("$defs", None)
+    return compiled
+
+
+def _cache_file(digest: str) -> Path:
+    return CACHE_DIR / "schema" / f"{digest}-c{COMPILER_VERSION}.json"
+
+
+def _read_cached(digest: str) -> Dict[str, Any] | None:
+    try:
+        compiled = json.loads(_cache_file(digest).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    return compiled if isinstance(compiled, dict) else None
+
+
+def _write_cached(digest: str, compiled: Dict[str, Any]) -> None:
+    target = _cache_file(digest)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(compiled, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError:
+        pass
+
+
+def load_compiled_schema(path: Path) -> Tuple[Dict[str, Any], str]:
+    """
+    Load the compiled form of the schema at `path`.
+
+    Returns:
+        (compiled_schema, schema_hash)
+
+    Raises whatever reading/decoding the schema file raises, so callers can
+    keep their existing "[ERROR] Failed to read JSON" reporting.
+    """
+    data = path.read_bytes()
+    digest = content_hash(data)
+
+    compiled = _COMPILED.get(digest)
+    if compiled is None:
+        compiled = _read_cached(digest)
+    if compiled is None:
+        schema = json.loads(data.decode("utf-8"))
+        compiled = compile_schema(schema) if isinstance(schema, dict) else schema
+        _write_cached(digest, compiled)
+
+    _COMPILED[digest] = compiled
+    return compiled, digest
+
+
+def build_validator(compiled: Dict[str, Any], format_check: bool, format_checker=None) -> Draft202012Validator:
+    """
+    Build a validator for an already-compiled schema.
+
+    With format_check, formats are checked by the shared checker from
+    format_checks.py unless `format_checker` overrides it (e.g. the timed
+    checker from validation_profile.Profile).
+    """
+    from jsonschema import Draft202012Validator  # deferred: dominates CLI startup
+
+    if format_check:
+        if format_checker is None:
+            from format_checks import format_checker as shared_format_checker
+
+            format_checker = shared_format_checker()
+        return Draft202012Validator(compiled, format_checker=format_checker)
+    return Draft202012Validator(compiled)
+
+
+def get_validator(path: Path, format_check: bool) -> Tuple[Draft202012Validator, Dict[str, Any], str]:
+    """
+    Return a (memoized) validator for the schema at `path`.
+
+    Returns:
+        (validator, compiled_schema, schema_hash)
+    """
+    compiled, digest = load_compiled_schema(path)
+    key = (digest, format_check)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        validator = build_validator(compiled, format_check)
+        _VALIDATORS[key] = validator
+    return validator, compiled, digest
+
+
+def _error_order(error) -> list:
+    return list(error.path)
+
+
+def collect_schema_errors(validator, instance: Any, max_errors: int | None = None, fail_fast: bool = False):
+    """
+    Schema errors for `instance`, sorted by instance path.
+
+    max_errors -> keep only the first N errors in path order, using a bounded
+                  heap: memory stays O(N) however many errors the record has
+    fail_fast  -> stop at the first error the validator yields
+
+    Returns:
+        (errors, omitted) where omitted is how many errors were dropped, or
+        None when iteration stopped early and the total is unknown.
+    """
+    errors = validator.iter_errors(instance)
+    if fail_fast:
+        first = next(errors, None)
+        return ([], 0) if first is None else ([first], None)
+    if max_errors is None:
+        return sorted(errors, key=_error_order), 0
+
+    total = 0
+
+    def counted():
+        nonlocal total
+        for error in errors:
+            total += 1
+            yield error
+
+    # nsmallest is stable, so ties keep the validator's order exactly as sorted() would.
+    kept = heapq.nsmallest(max_errors, counted(), key=_error_order)
+    return kept, total - len(kept)
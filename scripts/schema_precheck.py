@@ -0,0 +1,235 @@
+"""
+RGDS schema precheck — schema_precheck.py
+
+Purpose
+-------
+A sub-millisecond first tier for in-editor feedback. Full validation walks
+every $defs structure and allOf block of decision-log.schema.json; the
+precheck only looks at the handful of constraints that catch most broken
+drafts:
+
+- the top-level "required" list
+- the decision_id pattern
+- the status / decision_category / decision_outcome.outcome enums
+- the allOf if/then conditionals (AI disclosure, regulatory context)
+
+Derived, never hand-written
+---------------------------
+Every check is generated from the schema file at load time (see
+build_precheck), so the precheck cannot drift from the schema: change an
+enum or a required list there and the precheck follows. allOf blocks that
+do not fit the simple "if property const -> then required" shape are left
+to full validation.
+
+Passing the precheck does NOT mean the record is valid; full JSON Schema
+validation and semantic_checks() remain the authoritative pass. Messages
+use the same "<path>: <message>" wording as full validation so a record
+reads the same in both tiers.
+
+Only the standard library is used (no jsonschema import).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+# Leaf properties whose type / enum / const / pattern are prechecked.
+PRECHECK_PATHS: Tuple[Tuple[str, ...], ...] = (
+    ("decision_id",),
+    ("status",),
+    ("decision_category",),
+    ("decision_outcome", "outcome"),
+)
+
+LOCAL_DEFS_PREFIX = "#/$defs/"
+
+_JSON_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "object": (dict,),
+    "array": (list,),
+    "null": (type(None),),
+}
+
+
+class LeafCheck(NamedTuple):
+    path: Tuple[str, ...]
+    types: Tuple[str, ...]  # allowed JSON types (empty = unconstrained)
+    enum: Tuple[Any, ...] | None
+    pattern: "re.Pattern[str] | None"
+    pattern_text: str | None
+
+
+class Conditional(NamedTuple):
+    when_path: Tuple[str, ...]  # property path tested by "if"
+    when_value: Any  # the "const" it must equal
+    then_path: Tuple[str, ...]  # object that must carry the required keys
+    then_required: Tuple[str, ...]
+
+
+class Precheck(NamedTuple):
+    required: Tuple[str, ...]
+    leaves: Tuple[LeafCheck, ...]
+    conditionals: Tuple[Conditional, ...]
+
+
+def _resolve(schema: Dict[str, Any], node: Any) -> Any:
+    """Follow local "#/$defs/..." references."""
+    seen = set()
+    while isinstance(node, dict) and isinstance(node.get("$ref"), str) and node["$ref"].startswith(LOCAL_DEFS_PREFIX):
+        name = node["$ref"][len(LOCAL_DEFS_PREFIX):]
+        if name in seen:
+            break
+        seen.add(name)
+        node = (schema.get("$defs") or {}).get(name, {})
+    return node
+
+
+def _subschema(schema: Dict[str, Any], path: Tuple[str, ...]) -> Dict[str, Any] | None:
+    node: Any = schema
+    for key in path:
+        node = _resolve(schema, node)
+        node = (node.get("properties") or {}).get(key) if isinstance(node, dict) else None
+        if node is None:
+            return None
+    node = _resolve(schema, node)
+    return node if isinstance(node, dict) else None
+
+
+def _single_property(node: Any, path: Tuple[str, ...] = ()) -> Tuple[Tuple[str, ...], Dict[str, Any]] | None:
+    """Unwrap nested {"properties": {name: ...}} with exactly one name per level."""
+    while isinstance(node, dict) and set(node) == {"properties"} and len(node["properties"]) == 1:
+        (name, node), = node["properties"].items()
+        path += (name,)
+    return (path, node) if path and isinstance(node, dict) else None
+
+
+def _conditional(block: Any) -> Conditional | None:
+    """Compile an allOf item of the form if: {...: {const}} then: {...: {required}}; else None."""
+    if not isinstance(block, dict) or set(block) != {"if", "then"}:
+        return None
+    cond = _single_property(block["if"])
+    if cond is None or set(cond[1]) != {"const"}:
+        return None
+
+    then = block["then"]
+    if isinstance(then, dict) and set(then) == {"required"}:
+        then_path, then_node = (), then
+    else:
+        unwrapped = _single_property(then)
+        if unwrapped is None:
+            return None
+        then_path, then_node = unwrapped
+    if set(then_node) != {"required"}:
+        return None
+    return Conditional(cond[0], cond[1]["const"], then_path, tuple(then_node["required"]))
+
+
+def build_precheck(schema: Dict[str, Any]) -> Precheck:
+    """Derive the precheck from a (raw or compiled) decision-log schema."""
+    leaves = []
+    for path in PRECHECK_PATHS:
+        node = _subschema(schema, path)
+        if node is None:
+            continue
+        types = node.get("type", ())
+        types = (types,) if isinstance(types, str) else tuple(types)
+        enum = node.get("enum")
+        if "const" in node:
+            enum = [node["const"]]
+        pattern = node.get("pattern")
+        leaves.append(
+            LeafCheck(
+                path,
+                types,
+                tuple(enum) if enum is not None else None,
+                re.compile(pattern) if isinstance(pattern, str) else None,
+                pattern if isinstance(pattern, str) else None,
+            )
+        )
+
+    conditionals = tuple(c for c in (_conditional(b) for b in schema.get("allOf") or ()) if c is not None)
+    return Precheck(tuple(schema.get("required") or ()), tuple(leaves), conditionals)
+
+
+_PRECHECKS: Dict[Tuple[str, int, int], Precheck] = {}
+
+
+def load_precheck(path: Path) -> Precheck:
+    """Build (and memoize per schema file version) the precheck for the schema at `path`."""
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    precheck = _PRECHECKS.get(key)
+    if precheck is None:
+        precheck = build_precheck(json.loads(path.read_text(encoding="utf-8")))
+        _PRECHECKS[key] = precheck
+    return precheck
+
+
+def _format_path(path: Tuple[str, ...]) -> str:
+    return "$" + "".join(f".{p}" for p in path)
+
+
+def _type_ok(value: Any, types: Tuple[str, ...]) -> bool:
+    if not types:
+        return True
+    for t in types:
+        if isinstance(value, _JSON_TYPES.get(t, ())) and not (t in ("integer", "number") and isinstance(value, bool)):
+            return True
+    return False
+
+
+def _lookup(instance: Any, path: Tuple[str, ...]) -> Tuple[bool, Any]:
+    node = instance
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return False, None
+        node = node[key]
+    return True, node
+
+
+def run_precheck(precheck: Precheck, instance: Any) -> List[Dict[str, str]]:
+    """
+    Run the precheck. Returns [{"path", "message"}, ...] (empty = precheck passed),
+    ordered like full validation output (by instance path).
+    """
+    if not isinstance(instance, dict):
+        return [{"path": "$", "message": f"{instance!r} is not of type 'object'"}]
+
+    errors: List[Tuple[Tuple[str, ...], str]] = []
+    for name in precheck.required:
+        if name not in instance:
+            errors.append(((), f"{name!r} is a required property"))
+
+    for leaf in precheck.leaves:
+        present, value = _lookup(instance, leaf.path)
+        if not present:
+            continue
+        if not _type_ok(value, leaf.types):
+            expected = leaf.types[0] if len(leaf.types) == 1 else list(leaf.types)
+            errors.append((leaf.path, f"{value!r} is not of type {expected!r}"))
+        if leaf.enum is not None and value not in leaf.enum:
+            errors.append((leaf.path, f"{value!r} is not one of {list(leaf.enum)!r}"))
+        if leaf.pattern is not None and isinstance(value, str) and not leaf.pattern.search(value):
+            errors.append((leaf.path, f"{value!r} does not match {leaf.pattern_text!r}"))
+
+    for cond in precheck.conditionals:
+        # Same semantics as JSON Schema "if": an absent property (or a
+        # non-object on the way) satisfies "properties" vacuously.
+        present, value = _lookup(instance, cond.when_path)
+        if present and (value != cond.when_value or type(value) is not type(cond.when_value)):
+            continue
+        present, target = _lookup(instance, cond.then_path)
+        if not present or not isinstance(target, dict):
+            continue
+        for name in cond.then_required:
+            if name not in target:
+                errors.append((cond.then_path, f"{name!r} is a required property"))
+
+    errors.sort(key=lambda e: e[0])
+    return [{"path": _format_path(path), "message": message} for path, message in errors]
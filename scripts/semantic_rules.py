@@ -0,0 +1,453 @@
+"""
+RGDS semantic rule engine — semantic_rules.py
+
+Purpose
+-------
+Single source of truth for the semantic governance checks that JSON Schema
+cannot express. validate_decision_log.py and validate_all_examples.py both
+call semantic_checks() from here, so the two entry points can no longer
+drift apart.
+
+Design
+------
+- Every E-/W- code is a registered rule (see @rule) with a severity and the
+  record fields it reads.
+- Fields are registered extractors (see @field). For each record the engine
+  extracts every field the selected rules need exactly once, then evaluates
+  all rules in one pass over that shared context.
+- A RulePlan selects, disables or promotes rules by code. Adding a rule is a
+  matter of registering it here; neither CLI needs to change.
+
+Messages are always "<CODE>: <text>", in rule registration order within the
+errors and warnings lists.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+# -----------------------------
+# Warning / Error Code Catalog
+# -----------------------------
+# Keep these stable once published (including the underscore spellings).
+E_COND_001 = "E-COND-001"
+E_DEFERREQ_001 = "E-DEFERREQ-001"
+E_OPT_001 = "E_OPT_001"
+E_OPT_002 = "E-OPT-002"
+E_GOV_001 = "E-GOV-001"
+E_AI_001 = "E-AI-001"
+E_AI_002 = "E-AI-002"
+E_AI_004 = "E_AI_004"
+E_AI_005 = "E_AI_005"
+E_AI_006 = "E_AI_006"
+
+W_COND_001 = "W-COND-001"
+W_DEFER_001 = "W-DEFER-001"
+W_EVID_001 = "W-EVID-001"
+W_EVID_002 = "W-EVID-002"
+W_GOV_001 = "W-GOV-001"
+W_AI_001 = "W-AI-001"
+W_AI_002 = "W-AI-002"
+W_AI_002_RISK = "W_AI_002"  # published spelling; distinct from W-AI-002
+W_AI_003 = "W-AI-003"
+
+ERROR = "error"
+WARNING = "warning"
+
+
+class FieldSpec(NamedTuple):
+    name: str
+    deps: Tuple[str, ...]
+    extract: Callable[[dict, Dict[str, Any]], Any]
+
+
+class Rule(NamedTuple):
+    code: str
+    severity: str
+    fields: Tuple[str, ...]
+    check: Callable[[Dict[str, Any]], Iterable[str]]
+    summary: str
+
+
+FIELDS: Dict[str, FieldSpec] = {}
+RULES: Dict[str, Rule] = {}
+
+
+def field(name: str, deps: Sequence[str] = ()):
+    """Register a field extractor: fn(instance, ctx) -> value. `deps` must already be registered."""
+
+    def register(fn):
+        for dep in deps:
+            if dep not in FIELDS:
+                raise ValueError(f"field {name!r} depends on unregistered field {dep!r}")
+        FIELDS[name] = FieldSpec(name, tuple(deps), fn)
+        return fn
+
+    return register
+
+
+def rule(code: str, severity: str, fields: Sequence[str], summary: str):
+    """Register a rule: fn(ctx) -> iterable of message texts (without the code prefix)."""
+
+    def register(fn):
+        if code in RULES:
+            raise ValueError(f"duplicate rule code {code!r}")
+        for name in fields:
+            if name not in FIELDS:
+                raise ValueError(f"rule {code} reads unregistered field {name!r}")
+        RULES[code] = Rule(code, severity, tuple(fields), fn, summary)
+        return fn
+
+    return register
+
+
+# ---------------------------------------------------------------------
+# Fields (extracted once per record)
+# ---------------------------------------------------------------------
+
+@field("decision_outcome")
+def _decision_outcome(instance, ctx):
+    return instance.get("decision_outcome", {}) or {}
+
+
+@field("outcome", deps=("decision_outcome",))
+def _outcome(instance, ctx):
+    return ctx["decision_outcome"].get("outcome")
+
+
+@field("conditions", deps=("decision_outcome",))
+def _conditions(instance, ctx):
+    return ctx["decision_outcome"].get("conditions") or []
+
+
+@field("actions")
+def _actions(instance, ctx):
+    return instance.get("actions") or []
+
+
+@field("gaps")
+def _gaps(instance, ctx):
+    return (instance.get("known_gaps_and_assumptions", {}) or {}).get("gaps") or []
+
+
+@field("options")
+def _options(instance, ctx):
+    return instance.get("options_considered") or []
+
+
+@field("evidence_completeness")
+def _evidence_completeness(instance, ctx):
+    ec = instance.get("evidence_completeness")
+    return ec if isinstance(ec, dict) else None
+
+
+@field("author_at_risk_items")
+def _author_at_risk_items(instance, ctx):
+    return instance.get("author_at_risk_items") or []
+
+
+@field("governance")
+def _governance(instance, ctx):
+    return instance.get("governance", {}) or {}
+
+
+@field("ai_assistance")
+def _ai_assistance(instance, ctx):
+    return instance.get("ai_assistance", {}) or {}
+
+
+@field("ai_used", deps=("ai_assistance",))
+def _ai_used(instance, ctx):
+    return bool(ctx["ai_assistance"].get("used", False))
+
+
+# ---------------------------------------------------------------------
+# Outcome invariants
+# ---------------------------------------------------------------------
+
+# v1.0+ (core RGDS): conditional_go must have explicit conditions.
+@rule(E_COND_001, ERROR, ("outcome", "conditions"), "conditional_go requires at least one condition")
+def _cond_requires_conditions(ctx):
+    if ctx["outcome"] == "conditional_go" and len(ctx["conditions"]) == 0:
+        yield "conditional_go requires decision_outcome.conditions (at least 1)"
+
+
+# v1.0+ (recommended): conditions should be operationalized via actions.
+@rule(W_COND_001, WARNING, ("outcome", "actions"), "conditional_go should have actions")
+def _cond_recommends_actions(ctx):
+    if ctx["outcome"] == "conditional_go" and len(ctx["actions"]) == 0:
+        yield "conditional_go has no actions; consider adding actions to operationalize conditions"
+
+
+# v1.1+ (introduced defer_with_required_evidence): must include explicit gaps + re-entry mechanics.
+@rule(
+    E_DEFERREQ_001,
+    ERROR,
+    ("outcome", "gaps", "conditions", "actions"),
+    "defer_with_required_evidence requires gaps, conditions and actions",
+)
+def _deferreq_requires_reentry(ctx):
+    if ctx["outcome"] != "defer_with_required_evidence":
+        return
+    if len(ctx["gaps"]) == 0:
+        yield "defer_with_required_evidence requires known_gaps_and_assumptions.gaps (at least 1)"
+    if len(ctx["conditions"]) == 0:
+        yield "defer_with_required_evidence requires decision_outcome.conditions (at least 1)"
+    if len(ctx["actions"]) == 0:
+        yield "defer_with_required_evidence requires actions (at least 1)"
+
+
+# v1.0+ (recommended): defer should not be a content-free pause.
+@rule(W_DEFER_001, WARNING, ("outcome", "gaps", "actions"), "defer should record gaps or actions")
+def _defer_not_empty(ctx):
+    if ctx["outcome"] == "defer" and len(ctx["gaps"]) == 0 and len(ctx["actions"]) == 0:
+        yield "defer has no gaps or actions; consider recording re-entry criteria or follow-up actions"
+
+
+# ---------------------------------------------------------------------
+# Options completeness
+# ---------------------------------------------------------------------
+
+# v2.0.0: options_considered must enumerate real alternatives.
+@rule(E_OPT_001, ERROR, ("options",), "at least two options considered")
+def _options_minimum(ctx):
+    if len(ctx["options"]) < 2:
+        yield "options_considered must include at least two options"
+
+
+# v2.0.0: the selected option must be one of the options considered.
+@rule(E_OPT_002, ERROR, ("decision_outcome", "options"), "selected_option_id must match an option_id")
+def _selected_option_known(ctx):
+    selected = ctx["decision_outcome"].get("selected_option_id")
+    if selected is None:
+        return
+    known = {o.get("option_id") for o in ctx["options"] if isinstance(o, dict)}
+    if selected not in known:
+        yield f"decision_outcome.selected_option_id={selected!r} matches no options_considered[].option_id"
+
+
+# ---------------------------------------------------------------------
+# Evidence completeness coherence
+# ---------------------------------------------------------------------
+
+# v1.4.0 (recommended): if evidence is incomplete, record gaps and/or author-at-risk items.
+@rule(
+    W_EVID_001,
+    WARNING,
+    ("evidence_completeness", "gaps", "author_at_risk_items"),
+    "incomplete evidence should be backed by gaps or author-at-risk items",
+)
+def _incomplete_evidence_supported(ctx):
+    ec = ctx["evidence_completeness"]
+    if ec is None or ec.get("state") not in ("partial", "placeholder"):
+        return
+    if len(ctx["gaps"]) == 0 and len(ctx["author_at_risk_items"]) == 0:
+        yield "evidence_completeness is partial/placeholder, but no known gaps or author_at_risk_items recorded"
+
+
+# v1.4.0 (recommended): placeholders benefit from an expected resolution date.
+@rule(W_EVID_002, WARNING, ("evidence_completeness",), "placeholder evidence should have a resolution date")
+def _placeholder_resolution_date(ctx):
+    ec = ctx["evidence_completeness"]
+    if ec is not None and ec.get("state") == "placeholder" and not ec.get("expected_resolution_date"):
+        yield "evidence_completeness.state=placeholder; consider setting expected_resolution_date"
+
+
+# ---------------------------------------------------------------------
+# Governance coherence (authority / escalation)
+# ---------------------------------------------------------------------
+
+# v1.4.0+: if authority_scope is present, a decision_owner must exist (auditable authority).
+@rule(E_GOV_001, ERROR, ("governance",), "authority_scope requires a decision_owner")
+def _authority_requires_owner(ctx):
+    gov = ctx["governance"]
+    if gov.get("authority_scope") in ("recommend", "decide", "veto") and not gov.get("decision_owner"):
+        yield "governance.authority_scope is present but governance.decision_owner is missing"
+
+
+# v1.4.0 (recommended): if escalation_path key exists, prefer at least one resolver.
+@rule(W_GOV_001, WARNING, ("governance",), "escalation_path should name a resolver")
+def _escalation_path_not_empty(ctx):
+    gov = ctx["governance"]
+    escalation_path = gov.get("escalation_path") or []
+    if "escalation_path" in gov and isinstance(escalation_path, list) and len(escalation_path) == 0:
+        yield "governance.escalation_path is present but empty; consider specifying deadlock resolver(s)"
+
+
+# ---------------------------------------------------------------------
+# AI assistance disclosure integrity
+# ---------------------------------------------------------------------
+
+# v1.0+ (AI policy): AI use must be explicit and reviewable when used=true.
+@rule(E_AI_001, ERROR, ("ai_assistance", "ai_used"), "AI use requires use_cases")
+def _ai_use_cases(ctx):
+    if ctx["ai_used"] and len(ctx["ai_assistance"].get("use_cases") or []) == 0:
+        yield "ai_assistance.used=true requires ai_assistance.use_cases (at least 1)"
+
+
+# v2.0+ (whitepaper-aligned): require tool_name/tool_purpose and human_review when used=true
+@rule(E_AI_004, ERROR, ("ai_assistance", "ai_used"), "AI use requires tool_name")
+def _ai_tool_name(ctx):
+    if ctx["ai_used"] and (ctx["ai_assistance"].get("tool_name") or "").strip() == "":
+        yield "ai_assistance.used=true requires ai_assistance.tool_name"
+
+
+@rule(E_AI_005, ERROR, ("ai_assistance", "ai_used"), "AI use requires tool_purpose")
+def _ai_tool_purpose(ctx):
+    if ctx["ai_used"] and (ctx["ai_assistance"].get("tool_purpose") or "").strip() == "":
+        yield "ai_assistance.used=true requires ai_assistance.tool_purpose"
+
+
+@rule(E_AI_006, ERROR, ("ai_assistance", "ai_used"), "AI use requires human_review")
+def _ai_human_review(ctx):
+    if ctx["ai_used"] and len(ctx["ai_assistance"].get("human_review") or []) == 0:
+        yield "ai_assistance.used=true requires at least one human_review record"
+
+
+@rule(W_AI_002_RISK, WARNING, ("ai_assistance", "ai_used"), "AI use should record a risk confidence_band")
+def _ai_risk_confidence_band(ctx):
+    if not ctx["ai_used"]:
+        return
+    ai_risk = ctx["ai_assistance"].get("ai_risk_assessment") or {}
+    if not isinstance(ai_risk, dict) or (ai_risk.get("confidence_band") in (None, "")):
+        yield "ai_assistance.used=true should include ai_risk_assessment.confidence_band"
+
+
+@rule(E_AI_002, ERROR, ("ai_assistance", "ai_used"), "AI use requires artifacts")
+def _ai_artifacts(ctx):
+    if ctx["ai_used"] and len(ctx["ai_assistance"].get("artifacts") or []) == 0:
+        yield "ai_assistance.used=true requires ai_assistance.artifacts (at least 1)"
+
+
+# v1.0+ (recommended): controls fields should not be empty strings.
+@rule(W_AI_001, WARNING, ("ai_assistance", "ai_used"), "AI controls should be concrete references")
+def _ai_controls(ctx):
+    if not ctx["ai_used"]:
+        return
+    controls = ctx["ai_assistance"].get("controls") or {}
+    for k in ("prompt_or_instruction_ref", "schema_or_format_constraints", "versioning", "safety_notes"):
+        v = controls.get(k)
+        if not isinstance(v, str) or not v.strip():
+            yield f"ai_assistance.controls.{k} is empty; consider adding a concrete reference"
+
+
+# v1.4.0 (optional trust signals): if confidence_band is set, consider recording override status.
+@rule(W_AI_002, WARNING, ("ai_assistance", "ai_used"), "confidence_band should come with human_override")
+def _ai_override_status(ctx):
+    ai = ctx["ai_assistance"]
+    if ctx["ai_used"] and ai.get("confidence_band") is not None and ai.get("human_override") is None:
+        yield "ai_assistance.confidence_band is set but human_override is null; consider recording override status"
+
+
+# v1.0+ (recommended): avoid ambiguous disclosure where used=false but content exists.
+@rule(W_AI_003, WARNING, ("ai_assistance", "ai_used"), "used=false should not carry AI content")
+def _ai_ambiguous_disclosure(ctx):
+    ai = ctx["ai_assistance"]
+    if not ctx["ai_used"] and (ai.get("use_cases") or ai.get("artifacts")):
+        yield "ai_assistance.used=false but use_cases/artifacts are present; consider setting used=true or clearing fields"
+
+
+# ---------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------
+
+class RulePlan(NamedTuple):
+    """Resolved rule selection: which rules run, at which severity, reading which fields."""
+
+    rules: Tuple[Tuple[Rule, str], ...]  # (rule, effective severity), registration order
+    fields: Tuple[FieldSpec, ...]  # extraction order (dependencies first)
+    fingerprint: str  # stable description of the selection, for result caching
+
+
+def parse_codes(value: str | None) -> Tuple[str, ...]:
+    """Split a comma-separated CLI code list ("E-AI-001,W-GOV-001")."""
+    if not value:
+        return ()
+    return tuple(c.strip() for c in value.split(",") if c.strip())
+
+
+def build_plan(
+    select: Sequence[str] = (),
+    disable: Sequence[str] = (),
+    promote: Sequence[str] = (),
+) -> RulePlan:
+    """
+    Resolve a rule selection.
+
+    select  -> run only these codes (default: all registered rules)
+    disable -> skip these codes
+    promote -> treat these warning codes as errors
+
+    Raises ValueError for unknown codes.
+    """
+    unknown = sorted({c for c in (*select, *disable, *promote) if c not in RULES})
+    if unknown:
+        raise ValueError(f"Unknown rule code(s): {', '.join(unknown)}")
+
+    chosen = [r for r in RULES.values() if (not select or r.code in select) and r.code not in disable]
+    rules = tuple((r, ERROR if r.code in promote else r.severity) for r in chosen)
+
+    needed: set = set()
+    pending = [name for r in chosen for name in r.fields]
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(FIELDS[name].deps)
+    fields = tuple(spec for spec in FIELDS.values() if spec.name in needed)
+
+    fingerprint = ";".join(f"{r.code}={sev}" for r, sev in rules)
+    return RulePlan(rules, fields, fingerprint)
+
+
+DEFAULT_PLAN = build_plan()
+
+
+def semantic_checks(
+    instance: dict,
+    plan: RulePlan | None = None,
+    timings: Dict[str, List[float]] | None = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Semantic governance checks that JSON Schema cannot express.
+
+    If `timings` is given, each rule's wall time and call count are added to
+    timings[code] = [seconds, calls] (see validation_profile.py).
+
+    Returns:
+        (errors, warnings)
+        - errors: semantic invariants (fail validation / fail CI)
+        - warnings: strong recommendations (non-fatal unless strict)
+    """
+    plan = plan or DEFAULT_PLAN
+
+    ctx: Dict[str, Any] = {}
+    for spec in plan.fields:
+        ctx[spec.name] = spec.extract(instance, ctx)
+
+    errs: List[str] = []
+    warns: List[str] = []
+    if timings is None:
+        for r, severity in plan.rules:
+            out = errs if severity == ERROR else warns
+            for text in r.check(ctx):
+                out.append(f"{r.code}: {text}")
+        return errs, warns
+
+    clock = time.perf_counter
+    for r, severity in plan.rules:
+        out = errs if severity == ERROR else warns
+        t0 = clock()
+        for text in r.check(ctx):
+            out.append(f"{r.code}: {text}")
+        slot = timings.setdefault(r.code, [0.0, 0])
+        slot[0] += clock() - t0
+        slot[1] += 1
+    return errs, warns
+
+
+def rule_catalog() -> List[str]:
+    """One line per registered rule, for --list-rules."""
+    width = max(len(code) for code in RULES)
+    return [f"{r.code:<{width}}  {r.severity:<7}  {r.summary}" for r in RULES.values()]
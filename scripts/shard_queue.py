@@ -0,0 +1,256 @@
+"""
+RGDS shard queue — shard_queue.py
+
+Purpose
+-------
+The work queue behind validate_distributed.py: one SQLite file, on a
+filesystem every node can reach, through which a coordinator hands out
+shards of a corpus and any number of workers return their results.
+
+Layout
+------
+meta     key/value run configuration (compiled schema, rule selection,
+         --strict, lease length, ...), written once by the coordinator
+inputs   every input: seq (report order), shard, label, target
+shards   one row per shard: state, owner, lease expiry, attempts
+results  one row per finished shard: the worker and its results as JSON
+
+Shard states: pending -> leased -> done, or failed once a shard has been
+leased --max-attempts times without finishing (e.g. it crashes every
+worker that takes it).
+
+Leases
+------
+claim() leases one shard inside a BEGIN IMMEDIATE transaction, so two
+workers never get the same shard. A worker renews its lease while it
+works; a shard whose lease expired (the worker crashed, hung, or lost its
+node) is handed to the next worker that asks. A result is only accepted
+from the worker that currently holds the lease, so a late worker whose
+shard was reclaimed cannot overwrite anything.
+
+Lease expiry compares wall-clock time across nodes; clocks must agree to
+well within --lease-seconds (NTP is enough).
+
+Concurrency
+-----------
+The database uses SQLite's default rollback journal rather than WAL, which
+needs shared memory and is not safe on network filesystems. Writes are one
+short transaction per claim / renewal / result, so many workers can share
+the file.
+
+Only the standard library is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+QUEUE_VERSION = "1"  # bump when the tables change; workers refuse other versions
+
+DDL = (
+    "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE inputs (seq INTEGER PRIMARY KEY, shard_id INTEGER NOT NULL, label TEXT NOT NULL, target TEXT NOT NULL)",
+    "CREATE INDEX inputs_shard ON inputs(shard_id)",
+    "CREATE TABLE shards (shard_id INTEGER PRIMARY KEY, state TEXT NOT NULL, owner TEXT, lease_expires REAL,"
+    " attempts INTEGER NOT NULL DEFAULT 0, files INTEGER NOT NULL, finished_at REAL, error TEXT)",
+    "CREATE INDEX shards_state ON shards(state)",
+    "CREATE TABLE results (shard_id INTEGER PRIMARY KEY, worker TEXT NOT NULL, payload TEXT NOT NULL)",
+)
+
+STATES = ("pending", "leased", "done", "failed")
+
+
+class Lease(NamedTuple):
+    """A shard leased to one worker: its inputs as (seq, label, target) rows."""
+
+    shard_id: int
+    owner: str
+    attempt: int
+    items: List[Tuple[int, str, str]]
+
+
+def shard_of(key: str, shards: int) -> int:
+    """Stable shard for `key`: the same file lands in the same shard on every run."""
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big") % shards
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    # isolation_level=None: transactions are explicit (BEGIN IMMEDIATE) below.
+    return sqlite3.connect(str(db_path), timeout=60, isolation_level=None)
+
+
+def create_queue(db_path: Path, inputs: List[Tuple[str, str, str]], shards: int, config: Dict[str, Any]) -> Dict[int, int]:
+    """
+    Write a new queue for `inputs` ((label, target, partition key) in report
+    order) split into `shards` hash partitions, replacing any queue at `db_path`.
+
+    The database is built under a temporary name and renamed into place, so
+    workers never see a half-written queue. Empty partitions get no shard.
+
+    Returns {shard_id: file count}.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = db_path.with_name(f"{db_path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+
+    rows = [(seq, shard_of(key, shards), label, target) for seq, (label, target, key) in enumerate(inputs)]
+    sizes: Dict[int, int] = {}
+    for _, shard_id, _, _ in rows:
+        sizes[shard_id] = sizes.get(shard_id, 0) + 1
+
+    conn = _connect(tmp)
+    try:
+        conn.execute("BEGIN")
+        for stmt in DDL:
+            conn.execute(stmt)
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [("queue_version", QUEUE_VERSION), ("created_at", repr(time.time()))]
+            + [(key, json.dumps(value)) for key, value in config.items()],
+        )
+        conn.executemany("INSERT INTO inputs VALUES (?, ?, ?, ?)", rows)
+        conn.executemany(
+            "INSERT INTO shards (shard_id, state, files) VALUES (?, 'pending', ?)",
+            sorted(sizes.items()),
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    os.replace(tmp, db_path)
+    return sizes
+
+
+def open_queue(db_path: Path) -> sqlite3.Connection:
+    """Open an existing queue; raises ValueError if it is missing or from another QUEUE_VERSION."""
+    if not db_path.is_file():
+        raise ValueError(f"Queue not found: {db_path} (run: validate_distributed.py plan)")
+    conn = _connect(db_path)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'queue_version'").fetchone()
+    except sqlite3.DatabaseError:
+        row = None
+    if row is None or row[0] != QUEUE_VERSION:
+        conn.close()
+        raise ValueError(f"Queue {db_path} was written by another version; re-run plan.")
+    return conn
+
+
+def read_config(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """The coordinator's run configuration (meta rows other than the bookkeeping ones)."""
+    return {
+        key: json.loads(value)
+        for key, value in conn.execute("SELECT key, value FROM meta WHERE key NOT IN ('queue_version', 'created_at')")
+    }
+
+
+def claim(conn: sqlite3.Connection, owner: str, lease_seconds: float, max_attempts: int) -> Lease | None:
+    """
+    Lease the next pending shard (or one whose lease expired) to `owner`.
+
+    Shards whose lease expired after max_attempts leases are marked failed
+    instead of being handed out again. Returns None when nothing is claimable
+    right now (other shards may still be leased; see unfinished()).
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(
+            "UPDATE shards SET state = 'failed', finished_at = ?,"
+            " error = 'lease expired ' || attempts || ' time(s); last owner ' || owner"
+            " WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+            (now, now, max_attempts),
+        )
+        row = conn.execute(
+            "SELECT shard_id, attempts FROM shards"
+            " WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?)"
+            " ORDER BY state = 'leased', shard_id LIMIT 1",
+            (now,),
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        shard_id, attempts = row
+        conn.execute(
+            "UPDATE shards SET state = 'leased', owner = ?, lease_expires = ?, attempts = ? WHERE shard_id = ?",
+            (owner, now + lease_seconds, attempts + 1, shard_id),
+        )
+        items = conn.execute("SELECT seq, label, target FROM inputs WHERE shard_id = ? ORDER BY seq", (shard_id,)).fetchall()
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return Lease(shard_id, owner, attempts + 1, items)
+
+
+def renew(conn: sqlite3.Connection, lease: Lease, lease_seconds: float) -> bool:
+    """Extend `lease`; False if the shard was reclaimed by another worker meanwhile."""
+    cur = conn.execute(
+        "UPDATE shards SET lease_expires = ? WHERE shard_id = ? AND owner = ? AND state = 'leased'",
+        (time.time() + lease_seconds, lease.shard_id, lease.owner),
+    )
+    return cur.rowcount == 1
+
+
+def complete(conn: sqlite3.Connection, lease: Lease, results: List[Tuple[int, dict]]) -> bool:
+    """
+    Store the shard's results ((seq, result) pairs) and mark it done.
+
+    Accepted only while `lease` still holds the shard; returns False (and
+    stores nothing) if it was reclaimed.
+    """
+    payload = json.dumps(results, separators=(",", ":"))
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        cur = conn.execute(
+            "UPDATE shards SET state = 'done', finished_at = ?, lease_expires = NULL"
+            " WHERE shard_id = ? AND owner = ? AND state = 'leased'",
+            (time.time(), lease.shard_id, lease.owner),
+        )
+        accepted = cur.rowcount == 1
+        if accepted:
+            conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (lease.shard_id, lease.owner, payload))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return accepted
+
+
+def unfinished(conn: sqlite3.Connection) -> int:
+    """Shards still pending or leased."""
+    return conn.execute("SELECT COUNT(*) FROM shards WHERE state IN ('pending', 'leased')").fetchone()[0]
+
+
+def state_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    counts = {state: 0 for state in STATES}
+    for state, n in conn.execute("SELECT state, COUNT(*) FROM shards GROUP BY state"):
+        counts[state] = n
+    return counts
+
+
+def shard_rows(conn: sqlite3.Connection) -> List[dict]:
+    """Every shard with its state, owner, attempts and (for failed shards) the reason."""
+    cur = conn.execute(
+        "SELECT s.shard_id, s.state, s.files, s.attempts, COALESCE(r.worker, s.owner), s.lease_expires, s.error"
+        " FROM shards s LEFT JOIN results r ON r.shard_id = s.shard_id ORDER BY s.shard_id"
+    )
+    names = ("shard", "state", "files", "attempts", "worker", "lease_expires", "error")
+    return [dict(zip(names, row)) for row in cur]
+
+
+def stored_results(conn: sqlite3.Connection) -> Iterator[Tuple[int, str, str, dict | None]]:
+    """
+    Yield (seq, label, target, result) for every input in report order;
+    result is None for inputs whose shard has no stored result.
+    """
+    stored: Dict[int, dict] = {}
+    for (payload,) in conn.execute("SELECT payload FROM results"):
+        stored.update((seq, result) for seq, result in json.loads(payload))
+    for seq, label, target in conn.execute("SELECT seq, label, target FROM inputs ORDER BY seq"):
+        yield seq, label, target, stored.get(seq)
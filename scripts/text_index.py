@@ -0,0 +1,263 @@
+"""
+RGDS full-text index — text_index.py
+
+Purpose
+-------
+Backs `decision_index.py query search`: ranked phrase / keyword search over
+the prose of a decision-log corpus ("audited draft", "stability", a vendor
+name) without grepping every JSON file. decision_index.py stores the index
+as two derived tables, so it is built once and updated incrementally (by
+file hash) with the rest of the index.
+
+Searched fields
+---------------
+field          JSON path                                       weight
+title          decision_title                                  3.0
+question       decision_question                               2.5
+evidence       evidence.evidence_items[].title                 2.0
+option         options_considered[].description                1.5
+condition      decision_outcome.conditions[].condition         1.5
+quality        evidence.evidence_items[].quality_notes         1.0
+change_log     audit.change_log[].summary                      1.0
+
+Tables
+------
+text_fields    one row per searched string: decision_id, field, JSON path,
+               length in tokens, and the text itself (for phrase checks
+               and snippets)
+text_postings  (term, path, tf) for every distinct term of every string,
+               indexed on term
+
+Ranking
+-------
+Each matching string scores BM25 (k1 = 1.2, b = 0.75, over all indexed
+strings) times its field weight; a decision scores the sum of its hits.
+A decision matches when every query term and phrase occurs somewhere in
+it; a phrase must occur, in order, within one string.
+
+Query syntax
+------------
+    stability                 term (case-insensitive; letters and digits)
+    "audited draft"           phrase
+    stab*                     prefix (at least 2 characters before *)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# (field, weight, path to a list or string, key within list items)
+FIELDS = (
+    ("title", 3.0, ("decision_title",), None),
+    ("question", 2.5, ("decision_question",), None),
+    ("evidence", 2.0, ("evidence", "evidence_items"), "title"),
+    ("option", 1.5, ("options_considered",), "description"),
+    ("condition", 1.5, ("decision_outcome", "conditions"), "condition"),
+    ("quality", 1.0, ("evidence", "evidence_items"), "quality_notes"),
+    ("change_log", 1.0, ("audit", "change_log"), "summary"),
+)
+WEIGHTS = {name: weight for name, weight, _, _ in FIELDS}
+
+_TOKEN = re.compile(r"[0-9a-z]+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokens(text: str) -> List[str]:
+    """Lower-case letter/digit runs of `text`, in order."""
+    return _TOKEN.findall(text.lower())
+
+
+def _get(d, *keys):
+    for k in keys:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(k)
+    return d
+
+
+def _strings(record: dict) -> Iterable[Tuple[str, str, str]]:
+    """(field, JSON path, text) for every searched string of `record`."""
+    for name, _, path, key in FIELDS:
+        value = _get(record, *path)
+        if key is None:
+            if isinstance(value, str) and value.strip():
+                yield name, ".".join(path), value
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                text = item.get(key) if isinstance(item, dict) else None
+                if isinstance(text, str) and text.strip():
+                    yield name, f"{'.'.join(path)}[{i}].{key}", text
+
+
+def text_rows(record: dict) -> Tuple[List[tuple], List[tuple]]:
+    """(text_fields rows, text_postings rows) for one record; decision_index.py stores them."""
+    decision_id = record.get("decision_id")
+    fields, postings = [], []
+    for name, path, text in _strings(record):
+        counts = Counter(tokens(text))
+        fields.append((decision_id, name, path, sum(counts.values()), text))
+        postings.extend((term, path, tf) for term, tf in counts.items())
+    return fields, postings
+
+
+# -----------------------------
+# Search
+# -----------------------------
+
+
+class Clause(NamedTuple):
+    """One query element: a term, a prefix (term*), or a phrase (several terms, in order)."""
+
+    terms: Tuple[str, ...]
+    prefix: bool = False
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.terms) + ("*" if self.prefix else "")
+
+
+def parse_query(query: str) -> List[Clause]:
+    """Split a query into clauses; raises ValueError for an empty query or a too-short prefix."""
+    clauses = []
+    for phrase, word in _QUERY.findall(query):
+        if phrase:
+            terms = tuple(tokens(phrase))
+            if terms:
+                clauses.append(Clause(terms))
+        elif word.endswith("*"):
+            stem = "".join(tokens(word))
+            if len(stem) < 2:
+                raise ValueError(f"prefix too short: {word}")
+            clauses.append(Clause((stem,), prefix=True))
+        else:
+            clauses.extend(Clause((t,)) for t in tokens(word))
+    if not clauses:
+        raise ValueError("empty query")
+    return clauses
+
+
+def _contains(haystack: List[str], needle: Tuple[str, ...]) -> bool:
+    n = len(needle)
+    return any(tuple(haystack[i : i + n]) == needle for i in range(len(haystack) - n + 1))
+
+
+def _postings(conn, clause: Clause, filters: str, params: list) -> List[tuple]:
+    """(file_id, path, term, tf) rows for the terms of a clause, restricted by `filters`."""
+    if clause.prefix:
+        stem = clause.terms[0]
+        cond, args = "p.term >= ? AND p.term < ?", [stem, stem[:-1] + chr(ord(stem[-1]) + 1)]
+    else:
+        cond, args = f"p.term IN ({', '.join('?' for _ in clause.terms)})", list(clause.terms)
+    sql = (
+        "SELECT p.file_id, p.path, p.term, p.tf FROM text_postings p"
+        f" JOIN decisions d ON d.file_id = p.file_id WHERE {cond}{filters}"
+    )
+    return conn.execute(sql, args + params).fetchall()
+
+
+def search(
+    conn,
+    query: str,
+    program: str | None = None,
+    gate: str | None = None,
+    outcome: str | None = None,
+    limit: int = 20,
+    hits_per_decision: int = 5,
+) -> dict:
+    """
+    Ranked decisions matching every clause of `query`.
+
+    Returns {"query", "clauses", "matched", "results"}; each result has
+    decision_id, score, path (the file) and up to `hits_per_decision` hits
+    (field, JSON path, score, text), best first.
+    """
+    clauses = parse_query(query)
+    filters, params = "", []
+    for column, value in (("d.program_id", program), ("d.gate_name", gate), ("d.outcome", outcome)):
+        if value is not None:
+            filters += f" AND {column} = ?"
+            params.append(value)
+
+    total, avg_len = conn.execute("SELECT COUNT(*), AVG(length) FROM text_fields").fetchone()
+    if not total:
+        return {"query": query, "clauses": [c.text for c in clauses], "matched": 0, "results": []}
+    avg_len = avg_len or 1.0
+
+    def idf(term: str) -> float:
+        df = conn.execute("SELECT COUNT(*) FROM text_postings WHERE term = ?", (term,)).fetchone()[0]
+        return math.log(1 + (total - df + 0.5) / (df + 0.5))
+
+    # Per clause: {(file_id, path): {term: tf}}; a decision must appear under every clause.
+    per_clause: List[Dict[tuple, Dict[str, int]]] = []
+    for clause in clauses:
+        hits: Dict[tuple, Dict[str, int]] = {}
+        for file_id, path, term, tf in _postings(conn, clause, filters, params):
+            hits.setdefault((file_id, path), {})[term] = tf
+        if not clause.prefix and len(clause.terms) > 1:
+            hits = {k: v for k, v in hits.items() if len(v) == len(set(clause.terms))}
+        per_clause.append(hits)
+        if not hits:
+            break
+    files = set.intersection(*({file_id for file_id, _ in hits} for hits in per_clause)) if per_clause else set()
+    if len(per_clause) < len(clauses) or not files:
+        return {"query": query, "clauses": [c.text for c in clauses], "matched": 0, "results": []}
+
+    # Load the candidate strings: phrases are checked against the text, and BM25 needs lengths.
+    texts: Dict[tuple, tuple] = {}
+    for hits in per_clause:
+        for key in hits:
+            if key[0] in files and key not in texts:
+                texts[key] = conn.execute(
+                    "SELECT decision_id, field, length, text FROM text_fields WHERE file_id = ? AND path = ?", key
+                ).fetchone()
+
+    idfs: Dict[str, float] = {}
+    scores: Dict[int, Dict[str, float]] = {}
+    matched_files = set(files)
+    for clause, hits in zip(clauses, per_clause):
+        found = set()
+        for key, tfs in hits.items():
+            if key[0] not in files:
+                continue
+            _, field, length, text = texts[key]
+            if len(clause.terms) > 1 and not _contains(tokens(text), clause.terms):
+                continue
+            found.add(key[0])
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_len)
+            score = 0.0
+            for term, tf in tfs.items():
+                if term not in idfs:
+                    idfs[term] = idf(term)
+                score += idfs[term] * tf * (BM25_K1 + 1) / (tf + norm)
+            slot = scores.setdefault(key[0], {})
+            slot[key[1]] = slot.get(key[1], 0.0) + score * WEIGHTS.get(field, 1.0)
+        matched_files &= found
+
+    ranked = sorted(
+        ((sum(scores[file_id].values()), file_id) for file_id in matched_files),
+        key=lambda s: (-s[0], s[1]),
+    )
+    results = []
+    for score, file_id in ranked[:limit]:
+        decision_id, path = conn.execute(
+            "SELECT d.decision_id, f.path FROM decisions d JOIN files f USING (file_id) WHERE d.file_id = ?", (file_id,)
+        ).fetchone()
+        hits = sorted(scores[file_id].items(), key=lambda h: (-h[1], h[0]))[:hits_per_decision]
+        results.append(
+            {
+                "decision_id": decision_id,
+                "score": round(score, 3),
+                "path": path,
+                "hits": [
+                    {"field": texts[(file_id, p)][1], "json_path": p, "score": round(s, 3), "text": texts[(file_id, p)][3]}
+                    for p, s in hits
+                ],
+            }
+        )
+    return {"query": query, "clauses": [c.text for c in clauses], "matched": len(matched_files), "results": results}
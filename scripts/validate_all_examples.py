@@ -14,10 +14,15 @@ It blocks changes that would weaken decision defensibility.
 What this script enforces
 -------------------------
 HARD FAILS (block CI):
-- JSON Schema violations
+- JSON Schema violations (including date / date-time formats, checked by the
+  shared format_checks.py, as in validate_decision_log.py)
 - Missing required governance elements for certain decision outcomes
 - Inconsistent AI disclosure when AI is marked as used
 
+Semantic rules live in semantic_rules.py (shared with validate_decision_log.py).
+Use --list-rules to see every code; --select / --disable / --promote adjust
+which rules run and which warnings count as errors.
+
 WARNINGS (do NOT block CI by default):
 - Weak but allowed governance patterns
 - Missing strongly recommended fields
@@ -39,6 +44,87 @@ Strict usage (program policy)
 -----------------------------
     python3 scripts/validate_all_examples.py --strict
 
+Corpus usage (directories, files, or globs; parallel workers)
+-------------------------------------------------------------
+    python3 scripts/validate_all_examples.py path/to/corpus "archive/**/*.json" --parallel
+    python3 scripts/validate_all_examples.py path/to/corpus --jobs 8
+
+Results are always reported in sorted path order, whatever the worker count.
+
+Submission archives
+-------------------
+zip and tar (.tar, .tar.gz, .tgz, .tar.bz2, .tar.xz) archives are inputs
+too: their *.json members are validated straight from the archive, with no
+extraction step (archive_inputs.py). "archive!glob" selects members;
+results are labelled "<archive>!<member>".
+
+    python3 scripts/validate_all_examples.py submissions/pkg-0042.zip "submissions/pkg-0043.tar.gz!decision-logs/*.json"
+
+Incremental runs
+----------------
+Results are cached under .rgds_cache/results.json, keyed by (instance file
+hash, schema hash, a hash of the validation code — this script,
+semantic_rules.py, format_checks.py, corpus_checks.py, schema_cache.py —
+strict flag), so editing a check invalidates stored results by itself. Unchanged records reuse
+their stored schema errors, semantic errors and warnings; only changed
+records are revalidated. A summary line reports cache hits vs. misses.
+
+    python3 scripts/validate_all_examples.py --full   # ignore the cache, revalidate everything
+
+Corpus integrity
+----------------
+--corpus adds one pass over the whole corpus (corpus_checks.py): duplicate
+decision_ids, audit.supersedes / superseded_by links to decisions that are
+not in the corpus, supersession cycles and forks (E-CORPUS-*), plus
+one-sided links (W-CORPUS-001). Only each record's IDs and links are kept,
+and they are cached with its results, so the pass stays O(N).
+
+    python3 scripts/validate_all_examples.py path/to/corpus --corpus
+
+Pathological records
+--------------------
+--max-errors N keeps only the first N schema errors per file (bounded heap,
+so memory does not grow with the number of errors) and reports how many
+were omitted. --fail-fast stops the whole run at the first failing file.
+
+    python3 scripts/validate_all_examples.py path/to/export --max-errors 20 --fail-fast
+
+Error aggregation
+-----------------
+--aggregate replaces the per-file report with a ranked summary of failure
+clusters (error_clusters.py): errors are grouped by (path with array
+indices as [*], schema keyword, semantic rule code), with error and file
+counts, an example message and a few sample files per cluster, in bounded
+memory. --top-k sets how many clusters are printed; the full per-file
+report is written only with --per-file-report PATH, and the clusters as
+JSON only with --aggregate-out PATH. Unreadable files become a "load"
+cluster instead of stopping the run (the exit code is still 2).
+
+    python3 scripts/validate_all_examples.py path/to/export --aggregate --top-k 10 --per-file-report build/report.txt
+
+Profiling
+---------
+--profile records wall time and call counts per phase (load, schema,
+format_check, semantic, output) and per semantic rule code, plus the
+slowest files, and writes them as JSON and as a Prometheus textfile
+(validation_profile.py). Profiling always revalidates (implies --full).
+
+    python3 scripts/validate_all_examples.py path/to/corpus --profile --profile-out build/profile/nightly
+
+Watch mode
+----------
+--watch keeps running after the initial report: edits to the inputs (and
+new or removed files in watched directories) are picked up through inotify
+(fs_watch.py; polling with --poll or where inotify is unavailable), bursts
+of saves are debounced (--debounce), and only files whose content changed
+are revalidated, with the validator kept warm. Only outcome changes are
+printed ("[watch] x.json: PASS -> FAIL" followed by the usual report),
+then a one-line tally. Editing decision-log.schema.json revalidates every
+file across the process pool. Ctrl-C stops; the exit code reflects the
+final state.
+
+    python3 scripts/validate_all_examples.py path/to/drafts --watch
+
 Exit codes
 ----------
 0 — All examples pass (warnings allowed unless strict)
@@ -46,23 +132,50 @@ Exit codes
 2 — Script/configuration error (missing files, unreadable JSON)
 """
 
+import argparse
 import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
 from pathlib import Path
-from jsonschema import Draft202012Validator, FormatChecker
+from corpus_checks import Links, corpus_checks, record_links
+from error_clusters import ErrorAggregator, normalize_path
+from semantic_rules import build_plan, parse_codes, rule_catalog, semantic_checks
+from archive_inputs import source_file
+from corpus_inputs import collect_inputs as _collect_inputs
+from validation_profile import Profile, profile_prefix
+from schema_cache import CACHE_DIR, build_validator, collect_schema_errors, content_hash, load_compiled_schema, source_hash
+
+SCRIPT_VERSION = "1.7.0"  # script version (not RGDS schema version)
+# Modules whose code decides a file's result; their source hash is part of the result cache key.
+LOGIC_MODULES = ("validate_all_examples", "semantic_rules", "format_checks", "corpus_checks", "schema_cache")
 
 ROOT = Path(__file__).resolve().parents[1]
 SCHEMA_PATH = ROOT / "decision-log" / "decision-log.schema.json"
 EXAMPLES_DIR = ROOT / "examples"
+RESULT_CACHE_PATH = CACHE_DIR / "results.json"
+
+
+def collect_inputs(targets: list[str]) -> list[tuple[str, Path]]:
+    """Expand CLI targets, including zip/tar archives (see corpus_inputs.py); defaults to examples/."""
+    return _collect_inputs(targets, default_dir=EXAMPLES_DIR, archives=True)
+
 
+def load_schema(path: Path):
+    """
+    Load the compiled schema (see schema_cache.py) or exit with a clear error.
 
-def load_json(path: Path):
-    """Load JSON from disk or exit with a clear error."""
+    Returns:
+        (compiled_schema, schema_hash)
+    """
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        compiled, digest = load_compiled_schema(path)
     except Exception as e:
         print(f"[ERROR] Failed to read JSON: {path}\n  {e}")
         sys.exit(2)
+    return compiled, digest
 
 
 def format_path(err_path) -> str:
@@ -76,139 +189,632 @@ def format_path(err_path) -> str:
     return out
 
 
-def semantic_checks(instance: dict) -> tuple[list[str], list[str]]:
+def read_json(path: Path):
+    """Load JSON from disk, raising on failure (callers decide how to report)."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def validate_one(path: Path, validator, plan=None, max_errors: int | None = None, profile: Profile | None = None) -> dict:
+    """
+    Validate a single decision log with an already-built validator.
+
+    With a `profile`, the file's phase and rule timings are returned under
+    result["profile"] (Profile.snapshot()) for the parent to merge.
+
+    Returns a plain dict so results can cross process boundaries:
+        error             -> load failure message (None if the file parsed)
+        schema_errors     -> formatted "<path>: <message>" lines (at most max_errors)
+        schema_errors_omitted -> schema errors dropped by max_errors
+        schema_error_kinds -> [normalized path, keyword] per schema error (--aggregate)
+        semantic_errors   -> semantic invariant violations
+        semantic_warnings -> governance recommendations
+        links             -> [decision_id, supersedes, superseded_by] for the corpus pass
+    """
+    result = {
+        "error": None,
+        "schema_errors": [],
+        "schema_errors_omitted": 0,
+        "schema_error_kinds": [],
+        "semantic_errors": [],
+        "semantic_warnings": [],
+        "links": [],
+    }
+
+    if profile is not None:
+        profile.reset()
+
+    try:
+        with profile.phase("load") if profile else nullcontext():
+            instance = read_json(path)
+    except Exception as e:
+        result["error"] = f"[ERROR] Failed to read JSON: {path}\n  {e}"
+        return result
+
+    result["links"] = list(record_links(instance))
+    if profile is None:
+        errors, omitted = collect_schema_errors(validator, instance, max_errors)
+    else:
+        errors, omitted = profile.run_schema(collect_schema_errors, validator, instance, max_errors)
+
+    if errors:
+        result["schema_errors"] = [f"{format_path(e.path)}: {e.message}" for e in errors]
+        result["schema_errors_omitted"] = omitted
+        result["schema_error_kinds"] = [[normalize_path(e.path), e.validator] for e in errors]
+    else:
+        with profile.phase("semantic") if profile else nullcontext():
+            sem_errs, sem_warns = semantic_checks(instance, plan, profile.rules if profile else None)
+        result["semantic_errors"] = sem_errs
+        result["semantic_warnings"] = sem_warns
+
+    if profile is not None:
+        result["profile"] = profile.snapshot()
+    return result
+
+
+def report(label: str, result: dict, strict: bool) -> tuple[bool, bool]:
     """
-    Semantic governance checks that JSON Schema alone cannot express.
+    Print the outcome for one file.
 
     Returns:
-        errors   -> semantic violations that FAIL CI
-        warnings -> strong governance recommendations (non-fatal unless --strict)
+        (failed, warned)
+    """
+    if result["schema_errors"]:
+        print(f"\n[FAIL] {label}")
+        for line in result["schema_errors"]:
+            print(f"  - {line}")
+        if result["schema_errors_omitted"]:
+            print(f"  - ... {result['schema_errors_omitted']} more schema error(s) not shown (--max-errors)")
+        return True, False
+
+    sem_errs = result["semantic_errors"]
+    sem_warns = result["semantic_warnings"]
+
+    if sem_errs:
+        print(f"\n[FAIL] {label} (semantic)")
+        for msg in sem_errs:
+            print(f"  - {msg}")
+        return True, False
+
+    # If strict, warnings are treated as failures
+    if sem_warns and strict:
+        print(f"\n[FAIL] {label} (warnings treated as errors --strict)")
+        for msg in sem_warns:
+            print(f"  - {msg}")
+        return True, False
+
+    print(f"[PASS] {label} (schema + semantic)")
+
+    if sem_warns:
+        print(f"[WARN] {label}")
+        for msg in sem_warns:
+            print(f"  - {msg}")
+        return False, True
+
+    return False, False
+
+
+def report_corpus(corpus: list[tuple[str, Links]], strict: bool) -> tuple[bool, bool]:
+    """
+    Run and print the corpus integrity checks (one pass over every record's links).
 
-    Design principle:
-    - Schema enforces structure.
-    - Semantic checks enforce decision discipline.
+    Returns:
+        (failed, warned)
     """
-    errs: list[str] = []
-    warns: list[str] = []
-
-    decision_outcome = instance.get("decision_outcome", {}) or {}
-    outcome = decision_outcome.get("outcome")
-
-    conditions = decision_outcome.get("conditions") or []
-    actions = instance.get("actions") or []
-    gaps = (instance.get("known_gaps_and_assumptions", {}) or {}).get("gaps") or []
-
-    # ---------------------------------------------------------------------
-    # Outcome invariants
-    # ---------------------------------------------------------------------
-
-    # v1.0+ (core RGDS): conditional_go must have explicit conditions.
-    if outcome == "conditional_go":
-        if len(conditions) == 0:
-            errs.append("conditional_go requires decision_outcome.conditions (at least 1)")
-
-        # v1.0+ (recommended): conditions should be operationalized via actions.
-        if len(actions) == 0:
-            warns.append("conditional_go has no actions; consider adding actions to operationalize conditions")
-
-    # v1.1+ (introduced defer_with_required_evidence): must include explicit gaps + re-entry mechanics.
-    if outcome == "defer_with_required_evidence":
-        if len(gaps) == 0:
-            errs.append("defer_with_required_evidence requires known_gaps_and_assumptions.gaps (at least 1)")
-        if len(conditions) == 0:
-            errs.append("defer_with_required_evidence requires decision_outcome.conditions (at least 1)")
-        if len(actions) == 0:
-            errs.append("defer_with_required_evidence requires actions (at least 1)")
-
-    # v1.0+ (recommended): defer should not be a content-free pause.
-    if outcome == "defer":
-        if len(gaps) == 0 and len(actions) == 0:
-            warns.append("defer has no gaps or actions; consider recording re-entry criteria or follow-up actions")
-
-    # ---------------------------------------------------------------------
-    # Evidence completeness coherence
-    # ---------------------------------------------------------------------
-
-    # v1.4.0 (introduced evidence_completeness): incomplete evidence should be explicitly supported.
-    ec = instance.get("evidence_completeness")
-    if isinstance(ec, dict):
-        state = ec.get("state")
-        if state in ("partial", "placeholder"):
-            # v1.4.0 (recommended): if evidence is incomplete, record gaps and/or author-at-risk items.
-            author_at_risk_items = instance.get("author_at_risk_items") or []
-            if len(gaps) == 0 and len(author_at_risk_items) == 0:
-                warns.append(
-                    "evidence_completeness is partial/placeholder, but no known gaps or author_at_risk_items recorded"
-                )
-
-            # v1.4.0 (recommended): placeholders benefit from an expected resolution date.
-            if state == "placeholder" and not ec.get("expected_resolution_date"):
-                warns.append("evidence_completeness.state=placeholder; consider setting expected_resolution_date")
-
-    # ---------------------------------------------------------------------
-    # Governance coherence (authority / escalation)
-    # ---------------------------------------------------------------------
-
-    # v1.4.0 (introduced governance.authority_scope + governance.escalation_path)
-    gov = instance.get("governance", {}) or {}
-    authority_scope = gov.get("authority_scope")
-    escalation_path = gov.get("escalation_path") or []
-
-    # v1.4.0+: if authority_scope is present, a decision_owner must exist (auditable authority).
-    if authority_scope in ("recommend", "decide", "veto"):
-        owner = gov.get("decision_owner")
-        if not owner:
-            errs.append("governance.authority_scope is present but governance.decision_owner is missing")
-
-    # v1.4.0 (recommended): if escalation_path key exists, prefer at least one resolver.
-    if "escalation_path" in gov and isinstance(escalation_path, list) and len(escalation_path) == 0:
-        warns.append("governance.escalation_path is present but empty; consider specifying deadlock resolver(s)")
-
-    # ---------------------------------------------------------------------
-    # AI assistance disclosure integrity
-    # ---------------------------------------------------------------------
-
-    # v1.0+ (AI policy): AI use must be explicit and reviewable when used=true.
-    ai = instance.get("ai_assistance", {}) or {}
-    used = ai.get("used", False)
-
-    if used:
-        use_cases = ai.get("use_cases") or []
-        artifacts = ai.get("artifacts") or []
-        controls = ai.get("controls") or {}
-
-        if len(use_cases) == 0:
-            errs.append("ai_assistance.used=true requires ai_assistance.use_cases (at least 1)")
-        if len(artifacts) == 0:
-            errs.append("ai_assistance.used=true requires ai_assistance.artifacts (at least 1)")
-
-        # v1.0+ (recommended): controls fields should not be empty strings.
-        for k in ("prompt_or_instruction_ref", "schema_or_format_constraints", "versioning", "safety_notes"):
-            v = controls.get(k)
-            if not isinstance(v, str) or not v.strip():
-                warns.append(f"ai_assistance.controls.{k} is empty; consider adding a concrete reference")
-
-        # v1.4.0 (optional trust signals): if confidence_band is set, consider recording override status.
-        conf_band = ai.get("confidence_band")
-        human_override = ai.get("human_override")
-        if conf_band is not None and human_override is None:
-            warns.append("ai_assistance.confidence_band is set but human_override is null; consider recording override status")
+    errs, warns = corpus_checks(corpus)
+
+    if errs:
+        print(f"\n[FAIL] corpus integrity ({len(corpus)} record(s))")
+        for label, msg in errs:
+            print(f"  - {label}: {msg}")
+    if warns:
+        tag = "[FAIL]" if strict else "[WARN]"
+        suffix = " (warnings treated as errors --strict)" if strict else ""
+        print(f"\n{tag} corpus integrity{suffix}")
+        for label, msg in warns:
+            print(f"  - {label}: {msg}")
+    if not errs and not warns:
+        print(f"[PASS] corpus integrity ({len(corpus)} record(s))")
+
+    return bool(errs) or (bool(warns) and strict), bool(warns) and not strict
+
+
+def aggregate(aggregator: ErrorAggregator, label: str, result: dict, strict: bool, per_file=None) -> tuple[bool, bool]:
+    """
+    --aggregate: fold one file into the error clusters instead of printing it.
+    The usual per-file report goes to `per_file` (an open file) if given.
+
+    Returns:
+        (failed, warned)
+    """
+    aggregator.add(label, result, strict)
+    if per_file is not None:
+        with redirect_stdout(per_file):
+            if result["error"]:
+                print(result["error"])
+            else:
+                report(label, result, strict)
+    status = outcome_status(result, strict)
+    return status in ("FAIL", "ERROR"), status == "WARN"
+
+
+# -----------------------------
+# Parallel fan-out
+# -----------------------------
+
+# One validator per worker process, built by the pool initializer.
+_WORKER_VALIDATOR = None
+_WORKER_PLAN = None
+_WORKER_MAX_ERRORS = None
+_WORKER_PROFILE = None
+
+
+def _build(schema: dict, profiling: bool):
+    """(validator, per-file Profile or None); a profiled validator times its format checks."""
+    if not profiling:
+        return build_validator(schema, format_check=True), None
+    profile = Profile("worker")
+    return build_validator(schema, format_check=True, format_checker=profile.format_checker()), profile
+
+
+def _init_worker(schema: dict, plan, max_errors, profiling: bool) -> None:
+    global _WORKER_VALIDATOR, _WORKER_PLAN, _WORKER_MAX_ERRORS, _WORKER_PROFILE
+    _WORKER_VALIDATOR, _WORKER_PROFILE = _build(schema, profiling)
+    _WORKER_PLAN = plan
+    _WORKER_MAX_ERRORS = max_errors
+
+
+def _validate_in_worker(path: Path) -> dict:
+    return validate_one(path, _WORKER_VALIDATOR, _WORKER_PLAN, _WORKER_MAX_ERRORS, _WORKER_PROFILE)
+
+
+def iter_results(
+    paths: list[Path],
+    schema: dict,
+    jobs: int,
+    plan=None,
+    max_errors: int | None = None,
+    profiling: bool = False,
+):
+    """
+    Yield validation results in the same order as `paths`.
+
+    jobs <= 1 validates in-process; otherwise the list is sharded across a
+    process pool. executor.map preserves input order, so output is
+    deterministic regardless of which worker finishes first. Closing the
+    generator early (--fail-fast) cancels work that has not started yet.
+    """
+    if jobs <= 1 or len(paths) < 2:
+        validator, profile = _build(schema, profiling)
+        for path in paths:
+            yield validate_one(path, validator, plan, max_errors, profile)
+        return
+
+    jobs = min(jobs, len(paths))
+    chunksize = max(1, len(paths) // (jobs * 4))
+    pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(schema, plan, max_errors, profiling))
+    try:
+        yield from pool.map(_validate_in_worker, paths, chunksize=chunksize)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# -----------------------------
+# Incremental result cache
+# -----------------------------
+# Entries map a cache key to the stored result fields below. Load failures
+# are never cached, so a broken file is re-read (and re-reported) every run.
+CACHED_FIELDS = ("schema_errors", "schema_error_kinds", "semantic_errors", "semantic_warnings", "links")
+
+
+def cache_key(file_hash: str, schema_hash: str, strict: bool, rules: str = "", max_errors: int | None = None) -> str:
+    """
+    Result cache key: (instance file hash, schema hash, validation code hash, strict flag),
+    plus a digest of the semantic rule selection (codes and severities),
+    plus the --max-errors bound when one is set.
+    """
+    key = f"{file_hash}:{schema_hash}:{source_hash(*LOGIC_MODULES)[:16]}:{int(strict)}"
+    key += ":" + content_hash(rules.encode("utf-8"))[:16]
+    if max_errors is not None:
+        key += f":m{max_errors}"
+    return key
 
-    else:
-        # v1.0+ (recommended): avoid ambiguous disclosure where used=false but content exists.
-        if ai.get("use_cases") or ai.get("artifacts"):
-            warns.append(
-                "ai_assistance.used=false but use_cases/artifacts are present; consider setting used=true or clearing fields"
-            )
 
-    return errs, warns
+def load_result_cache(path: Path) -> dict:
+    """Load the result cache; a missing or unreadable cache is simply empty."""
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_result_cache(path: Path, entries: dict) -> None:
+    """Persist the result cache atomically (best-effort; never fails validation)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entries, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def file_cache_key(path: Path, schema_hash: str, strict: bool, rules: str = "", max_errors: int | None = None) -> str | None:
+    """Cache key for one file, or None if it cannot be read (the validator reports that)."""
+    try:
+        return cache_key(content_hash(path.read_bytes()), schema_hash, strict, rules, max_errors)
+    except OSError:
+        return None
+
+
+def cached_result(entry: dict) -> dict:
+    """Rebuild a validate_one() result from a cache entry."""
+    return {
+        "error": None,
+        **{f: list(entry.get(f) or []) for f in CACHED_FIELDS},
+        "schema_errors_omitted": entry.get("schema_errors_omitted", 0),
+    }
+
+
+def store_result(entries: dict, key: str | None, result: dict) -> None:
+    """Cache a fresh result (load failures are never cached)."""
+    if key is None or result["error"] is not None:
+        return
+    entries[key] = {f: result[f] for f in CACHED_FIELDS}
+    if result["schema_errors_omitted"]:
+        entries[key]["schema_errors_omitted"] = result["schema_errors_omitted"]
+
+
+def iter_cached_results(
+    paths: list[Path],
+    keys: list,
+    entries: dict,
+    schema: dict,
+    jobs: int,
+    stats: dict,
+    plan=None,
+    max_errors: int | None = None,
+    profiling: bool = False,
+):
+    """
+    Yield results in `paths` order, reusing cached entries and validating only misses.
+
+    Misses are validated through iter_results (serially or in the pool) and
+    merged back in place; fresh results are written into `entries`.
+    """
+    misses = [i for i, key in enumerate(keys) if key is None or key not in entries]
+    stats["hits"] = len(paths) - len(misses)
+    stats["misses"] = len(misses)
+
+    fresh = iter_results([paths[i] for i in misses], schema, jobs, plan, max_errors, profiling)
+    miss_set = set(misses)
+
+    try:
+        for i, key in enumerate(keys):
+            if i not in miss_set:
+                yield cached_result(entries[key])
+                continue
+
+            result = next(fresh)
+            store_result(entries, key, result)
+            yield result
+    finally:
+        fresh.close()
+
+
+# -----------------------------
+# Watch mode
+# -----------------------------
+# At or above this many changed files in one batch, revalidation goes to the
+# process pool instead of the warm in-process validator.
+WATCH_BULK_THRESHOLD = 32
+
+OUTCOME_FIELDS = ("error", "schema_errors", "schema_errors_omitted", "semantic_errors", "semantic_warnings")
+
+
+def outcome_status(result: dict, strict: bool) -> str:
+    """ERROR / FAIL / WARN / PASS for one result, with the same rules as report()."""
+    if result["error"]:
+        return "ERROR"
+    if result["schema_errors"] or result["semantic_errors"] or (strict and result["semantic_warnings"]):
+        return "FAIL"
+    return "WARN" if result["semantic_warnings"] else "PASS"
+
+
+def watch_directories(targets: list[str], paths: list[Path]) -> list[Path]:
+    """Directories to watch: directory targets (so new files are seen) plus every input's parent."""
+    dirs = {Path(t).resolve() for t in targets if Path(t).is_dir()} if targets else {EXAMPLES_DIR.resolve()}
+    dirs.update(source_file(p).parent for p in paths)
+    return sorted(dirs)
+
+
+def watch(args, watched: dict, keys: dict, entries: dict, schema: dict, schema_hash: str, plan, strict: bool, rules_key: str) -> int:
+    """
+    Revalidate changed files until interrupted (--watch).
+
+    `watched` maps path -> (label, result) from the initial run and `keys`
+    maps path -> result cache key. Each debounced batch of filesystem events
+    revalidates only files whose content changed (a changed cache key), with
+    a validator kept warm across batches; a content revert is answered from
+    the result cache. A schema change rebuilds the validator and revalidates
+    every file across the process pool. Only outcome changes are printed.
+
+    Returns the exit code for the final state (0 pass, 1 failures, 2 unreadable files).
+    """
+    from fs_watch import open_watcher, wait_for_changes
+
+    bulk_jobs = args.jobs or os.cpu_count() or 1
+    validator = build_validator(schema, format_check=True)
+    schema_file = SCHEMA_PATH.resolve()
+    corpus_state = corpus_checks([(label, Links(*r["links"])) for label, r in watched.values() if r["links"]]) if args.corpus else None
 
+    dirs = watch_directories(args.paths, list(watched))
+    watcher = open_watcher(dirs, [schema_file], args.poll_interval, args.poll)
+    print(f"\n[watch] Watching {len(watched)} file(s) in {len(dirs)} directory(ies) ({watcher.backend}); Ctrl-C to stop.")
 
-def main():
+    try:
+        while True:
+            changed = wait_for_changes(watcher, args.debounce)
+            rescan, watcher.overflowed = watcher.overflowed, False
+
+            schema_changed = False
+            if schema_file in changed or rescan:
+                try:
+                    new_schema, new_hash = load_compiled_schema(SCHEMA_PATH)
+                except Exception as e:
+                    print(f"\n[ERROR] Failed to read JSON: {SCHEMA_PATH}\n  {e}\n[watch] Keeping the previous schema.")
+                    new_schema, new_hash = schema, schema_hash
+                if new_hash != schema_hash:
+                    schema, schema_hash, schema_changed = new_schema, new_hash, True
+                    validator = build_validator(schema, format_check=True)
+                    print("\n[watch] Schema changed; revalidating every file.")
+
+            current = {path: label for label, path in collect_inputs(args.paths)}
+            for directory in {source_file(p).parent for p in current}:
+                watcher.add_directory(directory)
+
+            # `current` is in collect_inputs order, so batches report in sorted order too.
+            if schema_changed or rescan:
+                candidates = list(current)
+            else:
+                candidates = [p for p in current if source_file(p) in changed or p not in watched]
+            todo = []
+            for path in candidates:
+                key = file_cache_key(path, schema_hash, strict, rules_key, args.max_errors)
+                if path in watched and key is not None and key == keys.get(path) and not watched[path][1]["error"]:
+                    continue  # saved without a content change
+                keys[path] = key
+                todo.append(path)
+
+            fresh = [p for p in todo if keys[p] is None or keys[p] not in entries]
+            if schema_changed or len(fresh) >= WATCH_BULK_THRESHOLD:
+                validated = iter_results(fresh, schema, bulk_jobs, plan, args.max_errors)
+            else:
+                validated = (validate_one(p, validator, plan, args.max_errors) for p in fresh)
+            results = dict(zip(fresh, validated))
+
+            deltas = 0
+            for path in todo:
+                result = results[path] if path in results else cached_result(entries[keys[path]])
+                store_result(entries, keys[path], result)
+                label = current[path]
+                old = watched.get(path)
+                watched[path] = (label, result)
+                if old is not None and all(old[1].get(f) == result.get(f) for f in OUTCOME_FIELDS):
+                    continue
+                deltas += 1
+                was = outcome_status(old[1], strict) if old is not None else "NEW"
+                print(f"\n[watch] {label}: {was} -> {outcome_status(result, strict)}")
+                if result["error"]:
+                    print(result["error"])
+                else:
+                    report(label, result, strict)
+
+            for path in [p for p in watched if p not in current]:
+                label, result = watched.pop(path)
+                keys.pop(path, None)
+                deltas += 1
+                print(f"\n[watch] {label}: removed (was {outcome_status(result, strict)})")
+
+            if args.corpus:
+                records = [(label, Links(*r["links"])) for label, r in (watched[p] for p in sorted(watched)) if r["links"]]
+                state = corpus_checks(records)
+                if state != corpus_state:
+                    corpus_state = state
+                    deltas += 1
+                    report_corpus(records, strict)
+
+            if not todo and not deltas:
+                continue  # e.g. a save without a content change, or an editor swap file
+            save_result_cache(RESULT_CACHE_PATH, entries)
+            counts = {s: 0 for s in ("PASS", "WARN", "FAIL", "ERROR")}
+            for _, result in watched.values():
+                counts[outcome_status(result, strict)] += 1
+            print(
+                f"[watch] {time.strftime('%H:%M:%S')} {len(todo)} revalidated, {deltas} change(s): "
+                + ", ".join(f"{n} {s}" for s, n in counts.items())
+            )
+    except KeyboardInterrupt:
+        print("\n[watch] Stopped.")
+    finally:
+        watcher.close()
+        save_result_cache(RESULT_CACHE_PATH, entries)
+
+    statuses = {outcome_status(result, strict) for _, result in watched.values()}
+    if "ERROR" in statuses:
+        return 2
+    corpus_failed = corpus_state is not None and (bool(corpus_state[0]) or (strict and bool(corpus_state[1])))
+    return 1 if "FAIL" in statuses or corpus_failed else 0
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="validate_all_examples.py",
+        description="Validate a corpus of RGDS decision logs (schema + semantic governance checks).",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument(
+        "paths",
+        nargs="*",
+        help=(
+            "Directories, files, glob patterns, or zip/tar archives to validate.\n"
+            "Directories contribute their *.json files; quote globs to use ** recursion.\n"
+            "Archives contribute their *.json members; use \"archive!glob\" to select members.\n"
+            "Default: examples/"
+        ),
+    )
+    p.add_argument("--strict", action="store_true", help="Treat semantic warnings as errors.")
+    p.add_argument("--warn-as-error", dest="warn_as_error", action="store_true", help="Alias for --strict.")
+
+    p.add_argument("--select", dest="select", type=str, default=None, help="Run only these semantic rule codes (comma-separated).")
+    p.add_argument("--disable", dest="disable", type=str, default=None, help="Skip these semantic rule codes (comma-separated).")
+    p.add_argument(
+        "--promote",
+        dest="promote",
+        type=str,
+        default=None,
+        help="Treat these semantic warning codes as errors (comma-separated).",
+    )
+    p.add_argument("--list-rules", dest="list_rules", action="store_true", help="List semantic rule codes and exit.")
+    p.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Shard files across a process pool (one worker per CPU core unless --jobs is given).",
+    )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker process count for parallel validation (implies --parallel). Default: CPU core count",
+    )
+    p.add_argument(
+        "--max-errors",
+        dest="max_errors",
+        metavar="N",
+        type=int,
+        default=None,
+        help="Report at most N schema errors per file (first N by path; bounded memory).",
+    )
+    p.add_argument(
+        "--fail-fast",
+        dest="fail_fast",
+        action="store_true",
+        help="Stop the whole run at the first failing file (pending files are skipped).",
+    )
+    p.add_argument(
+        "--aggregate",
+        action="store_true",
+        help=(
+            "Print ranked failure clusters (normalized path, keyword, rule code) with\n"
+            "counts and sample files instead of every error of every file."
+        ),
+    )
+    p.add_argument(
+        "--top-k",
+        dest="top_k",
+        metavar="N",
+        type=int,
+        default=20,
+        help="Clusters to print with --aggregate. Default: 20",
+    )
+    p.add_argument(
+        "--samples",
+        metavar="N",
+        type=int,
+        default=3,
+        help="Sample files kept per cluster with --aggregate. Default: 3",
+    )
+    p.add_argument(
+        "--per-file-report",
+        dest="per_file_report",
+        metavar="PATH",
+        type=str,
+        default=None,
+        help="With --aggregate, also write the full per-file report to PATH.",
+    )
+    p.add_argument(
+        "--aggregate-out",
+        dest="aggregate_out",
+        metavar="PATH",
+        type=str,
+        default=None,
+        help="With --aggregate, also write the top-k clusters as JSON to PATH.",
+    )
+    p.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Record wall time and call counts per phase and per rule code, plus the slowest\n"
+            "files; write <prefix>.json and <prefix>.prom (implies --full)."
+        ),
+    )
+    p.add_argument(
+        "--profile-out",
+        dest="profile_out",
+        metavar="PREFIX",
+        type=str,
+        default=None,
+        help="Profile output prefix. Default: build/profile/validate_all_examples",
+    )
+    p.add_argument(
+        "--profile-top",
+        dest="profile_top",
+        metavar="N",
+        type=int,
+        default=10,
+        help="Slowest files to report with --profile. Default: 10",
+    )
+    p.add_argument(
+        "--corpus",
+        action="store_true",
+        help=(
+            "Also run corpus integrity checks across all files (see corpus_checks.py):\n"
+            "duplicate decision_ids, dangling or cyclic audit supersession links."
+        ),
+    )
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "After the initial run, keep watching the inputs and the schema (inotify,\n"
+            "else polling) and revalidate only changed files, printing outcome changes.\n"
+            "A schema change revalidates everything in parallel. Ctrl-C to stop."
+        ),
+    )
+    p.add_argument(
+        "--debounce",
+        metavar="SECONDS",
+        type=float,
+        default=0.3,
+        help="Quiet period that ends a burst of --watch events. Default: 0.3",
+    )
+    p.add_argument(
+        "--poll",
+        action="store_true",
+        help="Watch by polling file mtimes instead of inotify (e.g. network filesystems).",
+    )
+    p.add_argument(
+        "--poll-interval",
+        dest="poll_interval",
+        metavar="SECONDS",
+        type=float,
+        default=0.5,
+        help="Polling period for --watch without inotify. Default: 0.5",
+    )
+    p.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore cached results and revalidate every file (the cache is refreshed).",
+    )
+    return p.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
     """
     Entry point.
 
-    Validates every JSON file in /examples:
+    Validates every JSON file in /examples (or the given paths):
     - Schema validation first
     - Semantic validation second
 
@@ -217,59 +823,152 @@ def main():
     - [WARN]  — governance recommendations (non-fatal unless --strict)
     - [FAIL]  — schema or semantic invariant violation (blocks CI)
     """
-    strict = ("--strict" in sys.argv) or ("--warn-as-error" in sys.argv)
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    strict = args.strict or args.warn_as_error
+
+    if args.list_rules:
+        for line in rule_catalog():
+            print(line)
+        sys.exit(0)
+
+    try:
+        plan = build_plan(
+            select=parse_codes(args.select),
+            disable=parse_codes(args.disable),
+            promote=parse_codes(args.promote),
+        )
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(2)
+    rules_key = plan.fingerprint
+    if args.max_errors is not None and args.max_errors < 1:
+        print("[ERROR] --max-errors must be at least 1")
+        sys.exit(2)
+    if args.jobs is not None and args.jobs < 1:
+        print("[ERROR] --jobs must be at least 1")
+        sys.exit(2)
+    if args.watch and (args.fail_fast or args.profile or args.aggregate):
+        print("[ERROR] --watch cannot be combined with --fail-fast, --profile or --aggregate")
+        sys.exit(2)
+    if (args.per_file_report or args.aggregate_out) and not args.aggregate:
+        print("[ERROR] --per-file-report and --aggregate-out require --aggregate")
+        sys.exit(2)
+    if args.top_k < 1 or args.samples < 0:
+        print("[ERROR] --top-k must be at least 1 and --samples >= 0")
+        sys.exit(2)
+    if args.debounce < 0 or args.poll_interval <= 0:
+        print("[ERROR] --debounce must be >= 0 and --poll-interval > 0")
+        sys.exit(2)
+    if args.jobs is not None:
+        jobs = args.jobs
+    elif args.parallel:
+        jobs = os.cpu_count() or 1
+    else:
+        jobs = 1
 
     if not SCHEMA_PATH.exists():
         print(f"[ERROR] Schema not found: {SCHEMA_PATH}")
         sys.exit(2)
 
-    schema = load_json(SCHEMA_PATH)
-    validator = Draft202012Validator(schema, format_checker=FormatChecker())
+    schema, schema_hash = load_schema(SCHEMA_PATH)
 
-    examples = sorted(EXAMPLES_DIR.glob("*.json"))
+    examples = collect_inputs(args.paths)
     if not examples:
         print("[ERROR] No example JSON files found.")
         sys.exit(2)
 
     failed = False
     warned_any = False
+    unreadable = False
+
+    labels = [label for label, _ in examples]
+    paths = [path for _, path in examples]
+
+    # Profiling measures real work, so it never reads cached results.
+    full = args.full or args.profile
+    profile = Profile("validate_all_examples", top=args.profile_top) if args.profile else None
+
+    # Unchanged records reuse their stored results; only misses are validated.
+    entries = {} if full else load_result_cache(RESULT_CACHE_PATH)
+    keys = [file_cache_key(path, schema_hash, strict, rules_key, args.max_errors) for path in paths]
+    stats: dict = {}
+    corpus: list[tuple[str, Links]] = []
+    watched: dict = {}
+    checked = 0
+    aggregator = ErrorAggregator(samples=args.samples) if args.aggregate else None
+    try:
+        per_file = open(args.per_file_report, "w", encoding="utf-8") if args.per_file_report else None
+    except OSError as e:
+        print(f"[ERROR] Cannot write per-file report: {args.per_file_report}\n  {e}")
+        sys.exit(2)
 
-    for example in examples:
-        instance = load_json(example)
-        errors = sorted(validator.iter_errors(instance), key=lambda e: list(e.path))
-
-        if errors:
-            failed = True
-            print(f"\n[FAIL] {example.name}")
-            for e in errors:
-                print(f"  - {format_path(e.path)}: {e.message}")
-            continue
-
-        sem_errs, sem_warns = semantic_checks(instance)
-
-        if sem_errs:
-            failed = True
-            print(f"\n[FAIL] {example.name} (semantic)")
-            for msg in sem_errs:
-                print(f"  - {msg}")
-            continue
-
-        # If strict, warnings are treated as failures
-        if sem_warns and strict:
-            failed = True
-            print(f"\n[FAIL] {example.name} (warnings treated as errors --strict)")
-            for msg in sem_warns:
-                print(f"  - {msg}")
-            continue
-
-        print(f"[PASS] {example.name} (schema + semantic)")
-
-        if sem_warns:
-            warned_any = True
-            print(f"[WARN] {example.name}")
-            for msg in sem_warns:
-                print(f"  - {msg}")
-
+    results = iter_cached_results(paths, keys, entries, schema, jobs, stats, plan, args.max_errors, args.profile)
+    try:
+        for label, path, result in zip(labels, paths, results):
+            checked += 1
+            if result["error"] and aggregator is None:
+                print(result["error"])
+                sys.exit(2)
+            unreadable = unreadable or bool(result["error"])
+            if args.corpus and result["links"]:
+                corpus.append((label, Links(*result["links"])))
+            if args.watch:
+                watched[path] = (label, result)
+
+            if profile is not None:
+                cost = profile.merge(result.get("profile") or {})
+                t0 = time.perf_counter()
+            if aggregator is None:
+                file_failed, file_warned = report(label, result, strict)
+            else:
+                file_failed, file_warned = aggregate(aggregator, label, result, strict, per_file)
+            if profile is not None:
+                output = time.perf_counter() - t0
+                profile.add("output", output)
+                profile.file_done(label, cost + output)
+            failed = failed or file_failed
+            warned_any = warned_any or file_warned
+            if file_failed and args.fail_fast:
+                break
+    finally:
+        results.close()
+        save_result_cache(RESULT_CACHE_PATH, entries)
+        if per_file is not None:
+            per_file.close()
+
+    if aggregator is not None:
+        print()
+        for line in aggregator.summary_lines(args.top_k):
+            print(line)
+        if args.per_file_report:
+            print(f"  Per-file report: {args.per_file_report}")
+        if args.aggregate_out:
+            out = Path(args.aggregate_out)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_text(json.dumps(aggregator.to_dict(args.top_k), indent=2) + "\n", encoding="utf-8")
+            print(f"  Clusters: {out}")
+
+    if failed and args.fail_fast and checked < len(paths):
+        print(f"\n[FAIL] Stopped at the first failing file (--fail-fast); {len(paths) - checked} file(s) not validated.")
+    elif args.corpus:
+        corpus_failed, corpus_warned = report_corpus(corpus, strict)
+        failed = failed or corpus_failed
+        warned_any = warned_any or corpus_warned
+
+    print(f"\nCache: {stats['hits']} hit(s), {stats['misses']} miss(es){' (--full)' if full else ''}")
+
+    if profile is not None:
+        json_path, prom_path = profile.write(profile_prefix(args.profile_out, "validate_all_examples"))
+        print()
+        for line in profile.summary_lines():
+            print(line)
+        print(f"  Profile: {json_path}\n           {prom_path}")
+
+    if args.watch:
+        sys.exit(watch(args, watched, dict(zip(paths, keys)), entries, schema, schema_hash, plan, strict, rules_key))
+
+    if unreadable:
+        sys.exit(2)
     if failed:
         sys.exit(1)
 
@@ -31,9 +31,23 @@ Enhancements in this version
 - Backward-compatible positional args still supported
 - "Instance-first" single-arg convenience (if one *.json is supplied, treat it as instance)
 - Optional JSON output (--format json) for CI / tooling
-- Stable warning/error codes to support program policy and future "warn promotion"
+- Stable warning/error codes to support program policy and "warn promotion"
+  (rules live in semantic_rules.py; --select / --disable / --promote / --list-rules)
 - Strict mode works consistently: warnings become failures
 - Version stamping (--version)
+- Format checks (date / date-time) on by default, shared with validate_all_examples.py
+  through format_checks.py (fast, memoized parsers)
+- Streaming bulk validation of NDJSON / concatenated JSON (--ndjson) and of
+  single-file JSON array exports, element by element (--json-array)
+- Submission archives validated in place, without extraction (--archive pkg.zip,
+  or an "archive!member" instance); see archive_inputs.py
+- Bounded error collection for pathological records (--max-errors N / --fail-fast)
+- Tiered validation: a schema-derived precheck (--precheck) for in-editor feedback
+- Warm validation daemon (--serve) and thin client (--daemon) with in-process fallback
+- Profiling (--profile): time and call counts per phase and per semantic rule code,
+  exported as JSON + Prometheus textfile (see validation_profile.py)
+- Fast start: heavy imports are deferred; --version never builds a validator, and
+  already-validated records are answered from .rgds_cache/outcomes (--no-cache to bypass)
 
 Exit codes
 ----------
@@ -46,37 +60,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-from jsonschema import Draft202012Validator
+from schema_cache import CACHE_DIR, build_validator, collect_schema_errors, content_hash, get_validator, load_compiled_schema, source_hash
 
-SCRIPT_VERSION = "1.0.0"  # script version (not RGDS schema version)
+# Startup path: schema_cache defers jsonschema (~120 ms with the format
+# extras) until a validator is built, and the rule engine is imported where
+# it is first needed, so --version, --help, argument errors and cached
+# outcomes never pay for either.
+
+SCRIPT_VERSION = "1.6.0"  # script version (not RGDS schema version)
+
+# Modules whose source decides an outcome; their hash is part of the outcome cache key.
+LOGIC_MODULES = ("validate_decision_log", "semantic_rules", "format_checks", "schema_precheck", "schema_cache")
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_SCHEMA = ROOT / "decision-log" / "decision-log.schema.json"
 DEFAULT_INSTANCE = ROOT / "examples" / "rgds-dec-0001.json"
-
-
-# -----------------------------
-# Warning / Error Code Catalog
-# -----------------------------
-# Keep these stable once published.
-E_COND_001 = "E-COND-001"
-E_DEFERREQ_001 = "E-DEFERREQ-001"
-E_GOV_001 = "E-GOV-001"
-E_AI_001 = "E-AI-001"
-E_AI_002 = "E-AI-002"
-
-W_COND_001 = "W-COND-001"
-W_DEFER_001 = "W-DEFER-001"
-W_EVID_001 = "W-EVID-001"
-W_EVID_002 = "W-EVID-002"
-W_GOV_001 = "W-GOV-001"
-W_AI_001 = "W-AI-001"
-W_AI_002 = "W-AI-002"
-W_AI_003 = "W-AI-003"
+OUTCOME_CACHE_DIR = CACHE_DIR / "outcomes"
 
 
 def load_json(path: Path) -> Any:
@@ -88,6 +94,88 @@ def load_json(path: Path) -> Any:
         sys.exit(2)
 
 
+def load_schema(path: Path, profile=None):
+    """
+    Load the compiled schema validator (see schema_cache.py) or exit with a clear error.
+
+    With a profile, the validator uses the profile's timed format checker
+    so format checks are booked as "format_check" rather than "schema".
+
+    Returns:
+        (validator, schema_dict)
+    """
+    try:
+        if profile is None:
+            validator, schema_dict, _ = get_validator(path, format_check=True)
+        else:
+            schema_dict, _ = load_compiled_schema(path)
+            validator = build_validator(schema_dict, True, profile.format_checker())
+    except Exception as e:
+        print(f"[ERROR] Failed to read JSON: {path}\n  {e}")
+        sys.exit(2)
+    return validator, schema_dict
+
+
+def outcome_cache_key(
+    schema_path: Path,
+    instance_path: Path,
+    semantic: bool,
+    strict: bool,
+    plan=None,
+    max_errors: int | None = None,
+    fail_fast: bool = False,
+) -> str | None:
+    """
+    Outcome cache key: (instance hash, schema hash, hash of the validator and
+    rule sources, modes, rule selection, error limits). None if either file
+    cannot be read.
+    """
+    try:
+        schema_hash = content_hash(schema_path.read_bytes())
+        instance_hash = content_hash(instance_path.read_bytes())
+    except OSError:
+        return None
+    rules = plan.fingerprint if semantic and plan is not None else ""
+    limits = f"{max_errors}:{int(fail_fast)}"
+    return content_hash(f"{instance_hash}:{schema_hash}:{source_hash(*LOGIC_MODULES)}:{int(semantic)}:{int(strict)}:{rules}:{limits}".encode("utf-8"))
+
+
+def load_cached_outcome(key: str) -> Tuple[int, Dict[str, Any]] | None:
+    """
+    Return a stored (exit_code, outcome) for `key`, or None (best-effort).
+
+    An entry is only used if it records the code hash it was computed
+    with and that hash is this process's (see store_outcome).
+    """
+    try:
+        entry = json.loads((OUTCOME_CACHE_DIR / f"{key}.json").read_text(encoding="utf-8"))
+        if entry.get("code_hash") != source_hash(*LOGIC_MODULES):
+            return None
+        return int(entry["exit_code"]), entry["outcome"]
+    except Exception:
+        return None
+
+
+def store_outcome(key: str, rc: int, outcome: Dict[str, Any], code_hash: str) -> None:
+    """
+    Persist an outcome atomically (best-effort; never fails validation).
+
+    `code_hash` is the source hash of the code that produced the outcome
+    (this process, or a daemon reply); an outcome from other code is not
+    stored under this process's key.
+    """
+    if code_hash != source_hash(*LOGIC_MODULES):
+        return
+    try:
+        OUTCOME_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = OUTCOME_CACHE_DIR / f"{key}.json"
+        tmp = path.with_name(f"{key}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"exit_code": rc, "outcome": outcome, "code_hash": code_hash}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
 def format_path(err_path) -> str:
     """Format jsonschema error paths as a JSONPath-like string."""
     out = "$"
@@ -115,160 +203,6 @@ def schema_version(schema: Any) -> str | None:
     return None
 
 
-def _msg(code: str, text: str) -> str:
-    return f"{code}: {text}"
-
-
-def semantic_checks(instance: dict) -> Tuple[List[str], List[str]]:
-    """
-    Semantic governance checks that JSON Schema cannot express.
-
-    Returns:
-        (errors, warnings)
-        - errors: semantic invariants (fail validation / fail CI)
-        - warnings: strong recommendations (non-fatal unless strict)
-
-    NOTE: Keep this aligned with validate_all_examples.py to prevent drift.
-    """
-    errs: List[str] = []
-    warns: List[str] = []
-
-    decision_outcome = instance.get("decision_outcome", {}) or {}
-    outcome = decision_outcome.get("outcome")
-
-    conditions = decision_outcome.get("conditions") or []
-    actions = instance.get("actions") or []
-    gaps = (instance.get("known_gaps_and_assumptions", {}) or {}).get("gaps") or []
-
-    # ---------------------------------------------------------------------
-    # Outcome invariants
-    # ---------------------------------------------------------------------
-
-    # v1.0+ (core RGDS): conditional_go must have explicit conditions.
-    if outcome == "conditional_go":
-        if len(conditions) == 0:
-            errs.append(_msg(E_COND_001, "conditional_go requires decision_outcome.conditions (at least 1)"))
-
-        # v1.0+ (recommended): conditions should be operationalized via actions.
-        if len(actions) == 0:
-            warns.append(_msg(W_COND_001, "conditional_go has no actions; consider adding actions to operationalize conditions"))
-
-    # v1.1+ (introduced defer_with_required_evidence): must include explicit gaps + re-entry mechanics.
-    if outcome == "defer_with_required_evidence":
-        if len(gaps) == 0:
-            errs.append(_msg(E_DEFERREQ_001, "defer_with_required_evidence requires known_gaps_and_assumptions.gaps (at least 1)"))
-        if len(conditions) == 0:
-            errs.append(_msg(E_DEFERREQ_001, "defer_with_required_evidence requires decision_outcome.conditions (at least 1)"))
-        if len(actions) == 0:
-            errs.append(_msg(E_DEFERREQ_001, "defer_with_required_evidence requires actions (at least 1)"))
-
-    # v1.0+ (recommended): defer should not be a content-free pause.
-    if outcome == "defer":
-        if len(gaps) == 0 and len(actions) == 0:
-            warns.append(_msg(W_DEFER_001, "defer has no gaps or actions; consider recording re-entry criteria or follow-up actions"))
-
-    
-    # ---------------------------------------------------------------------
-    # Options completeness
-    # ---------------------------------------------------------------------
-
-    options = instance.get("options_considered") or []
-    if len(options) < 2:
-        errs.append(_msg("E_OPT_001", "options_considered must include at least two options"))
-
-
-    # ---------------------------------------------------------------------
-    # Evidence completeness coherence
-    # ---------------------------------------------------------------------
-
-    # v1.4.0 (introduced evidence_completeness): incomplete evidence should be explicitly supported.
-    ec = instance.get("evidence_completeness")
-    if isinstance(ec, dict):
-        state = ec.get("state")
-        if state in ("partial", "placeholder"):
-            # v1.4.0 (recommended): if evidence is incomplete, record gaps and/or author-at-risk items.
-            author_at_risk_items = instance.get("author_at_risk_items") or []
-            if len(gaps) == 0 and len(author_at_risk_items) == 0:
-                warns.append(_msg(W_EVID_001, "evidence_completeness is partial/placeholder, but no known gaps or author_at_risk_items recorded"))
-
-            # v1.4.0 (recommended): placeholders benefit from an expected resolution date.
-            if state == "placeholder" and not ec.get("expected_resolution_date"):
-                warns.append(_msg(W_EVID_002, "evidence_completeness.state=placeholder; consider setting expected_resolution_date"))
-
-    # ---------------------------------------------------------------------
-    # Governance coherence (authority / escalation)
-    # ---------------------------------------------------------------------
-
-    # v1.4.0 (introduced governance.authority_scope + governance.escalation_path)
-    gov = instance.get("governance", {}) or {}
-    authority_scope = gov.get("authority_scope")
-    escalation_path = gov.get("escalation_path") or []
-
-    # v1.4.0+: if authority_scope is present, a decision_owner must exist (auditable authority).
-    if authority_scope in ("recommend", "decide", "veto"):
-        owner = gov.get("decision_owner")
-        if not owner:
-            errs.append(_msg(E_GOV_001, "governance.authority_scope is present but governance.decision_owner is missing"))
-
-    # v1.4.0 (recommended): if escalation_path key exists, prefer at least one resolver.
-    if "escalation_path" in gov and isinstance(escalation_path, list) and len(escalation_path) == 0:
-        warns.append(_msg(W_GOV_001, "governance.escalation_path is present but empty; consider specifying deadlock resolver(s)"))
-
-    # ---------------------------------------------------------------------
-    # AI assistance disclosure integrity
-    # ---------------------------------------------------------------------
-
-    # v1.0+ (AI policy): AI use must be explicit and reviewable when used=true.
-    ai = instance.get("ai_assistance", {}) or {}
-    used = ai.get("used", False)
-
-    if used:
-        use_cases = ai.get("use_cases") or []
-        artifacts = ai.get("artifacts") or []
-        controls = ai.get("controls") or {}
-
-        if len(use_cases) == 0:
-            errs.append(_msg(E_AI_001, "ai_assistance.used=true requires ai_assistance.use_cases (at least 1)"))
-
-        # v2.0+ (whitepaper-aligned): require tool_name/tool_purpose and human_review when used=true
-        tool_name = ai.get("tool_name") or ""
-        tool_purpose = ai.get("tool_purpose") or ""
-        human_review = ai.get("human_review") or []
-        ai_risk = ai.get("ai_risk_assessment") or {}
-
-        if tool_name.strip() == "":
-            errs.append(_msg("E_AI_004", "ai_assistance.used=true requires ai_assistance.tool_name"))
-        if tool_purpose.strip() == "":
-            errs.append(_msg("E_AI_005", "ai_assistance.used=true requires ai_assistance.tool_purpose"))
-        if len(human_review) == 0:
-            errs.append(_msg("E_AI_006", "ai_assistance.used=true requires at least one human_review record"))
-        if not isinstance(ai_risk, dict) or (ai_risk.get("confidence_band") in (None, "")):
-            warns.append(_msg("W_AI_002", "ai_assistance.used=true should include ai_risk_assessment.confidence_band"))
-
-
-        if len(artifacts) == 0:
-            errs.append(_msg(E_AI_002, "ai_assistance.used=true requires ai_assistance.artifacts (at least 1)"))
-
-        # v1.0+ (recommended): controls fields should not be empty strings.
-        for k in ("prompt_or_instruction_ref", "schema_or_format_constraints", "versioning", "safety_notes"):
-            v = controls.get(k)
-            if not isinstance(v, str) or not v.strip():
-                warns.append(_msg(W_AI_001, f"ai_assistance.controls.{k} is empty; consider adding a concrete reference"))
-
-        # v1.4.0 (optional trust signals): if confidence_band is set, consider recording override status.
-        conf_band = ai.get("confidence_band")
-        human_override = ai.get("human_override")
-        if conf_band is not None and human_override is None:
-            warns.append(_msg(W_AI_002, "ai_assistance.confidence_band is set but human_override is null; consider recording override status"))
-
-    else:
-        # v1.0+ (recommended): avoid ambiguous disclosure where used=false but content exists.
-        if ai.get("use_cases") or ai.get("artifacts"):
-            warns.append(_msg(W_AI_003, "ai_assistance.used=false but use_cases/artifacts are present; consider setting used=true or clearing fields"))
-
-    return errs, warns
-
-
 def parse_args(argv: List[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(
         prog="validate_decision_log.py",
@@ -296,6 +230,17 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     p.add_argument("--strict", action="store_true", help="Treat semantic warnings as errors (implies --semantic).")
     p.add_argument("--warn-as-error", dest="warn_as_error", action="store_true", help="Alias for --strict.")
 
+    p.add_argument("--select", dest="select", type=str, default=None, help="Run only these semantic rule codes (comma-separated).")
+    p.add_argument("--disable", dest="disable", type=str, default=None, help="Skip these semantic rule codes (comma-separated).")
+    p.add_argument(
+        "--promote",
+        dest="promote",
+        type=str,
+        default=None,
+        help="Treat these semantic warning codes as errors (comma-separated).",
+    )
+    p.add_argument("--list-rules", dest="list_rules", action="store_true", help="List semantic rule codes and exit.")
+
     p.add_argument(
         "--format",
         dest="out_format",
@@ -304,7 +249,118 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         help="Output format (text or json). Default: text",
     )
 
+    p.add_argument(
+        "--json-array",
+        dest="json_array",
+        metavar="PATH",
+        type=str,
+        default=None,
+        help=(
+            "Stream-validate the elements of one top-level JSON array in PATH ('-' for stdin),\n"
+            "e.g. a multi-GB single-file export; memory is bounded by the largest element.\n"
+            "Output as for --ndjson, with instance.record = array index."
+        ),
+    )
+    p.add_argument(
+        "--archive",
+        dest="archive",
+        metavar="ARCHIVE[!GLOB]",
+        type=str,
+        default=None,
+        help=(
+            "Validate the *.json members (or members matching GLOB) of a zip / tar archive\n"
+            "in place, without extracting it. Output as for --ndjson, with instance.path\n"
+            "\"<archive>!<member>\". A single member can also be given as the instance."
+        ),
+    )
+    p.add_argument(
+        "--ndjson",
+        dest="ndjson",
+        metavar="PATH",
+        type=str,
+        default=None,
+        help=(
+            "Stream-validate NDJSON or concatenated JSON records from PATH ('-' for stdin).\n"
+            "Emits one --format json result per record, as NDJSON, as soon as it is checked."
+        ),
+    )
+
+    p.add_argument(
+        "--max-errors",
+        dest="max_errors",
+        metavar="N",
+        type=int,
+        default=None,
+        help="Report at most N schema errors (first N by path; bounded memory) plus an omitted count.",
+    )
+    p.add_argument(
+        "--fail-fast",
+        dest="fail_fast",
+        action="store_true",
+        help="Stop schema validation at the first error (the remaining count is not computed).",
+    )
+
+    p.add_argument(
+        "--precheck",
+        action="store_true",
+        help=(
+            "Fast first tier only: required fields, decision_id pattern, key enums and\n"
+            "allOf conditionals, derived from the schema (see schema_precheck.py).\n"
+            "Full schema + semantic validation is deferred to a run without --precheck."
+        ),
+    )
+
+    p.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Time each phase (load, schema, semantic, output) and each semantic rule;\n"
+            "write <prefix>.json and <prefix>.prom and print a summary to stderr.\n"
+            "Always validates in-process (no daemon, no outcome cache)."
+        ),
+    )
+    p.add_argument(
+        "--profile-out",
+        dest="profile_out",
+        metavar="PREFIX",
+        type=str,
+        default=None,
+        help="Profile output prefix. Default: build/profile/validate_decision_log",
+    )
+    p.add_argument(
+        "--profile-top",
+        dest="profile_top",
+        metavar="N",
+        type=int,
+        default=10,
+        help="Slowest NDJSON records to report with --profile. Default: 10",
+    )
+
     p.add_argument("--version", action="store_true", help="Print script + schema version (if available) and exit.")
+    p.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Always revalidate; do not read or write the outcome cache (.rgds_cache/outcomes).",
+    )
+
+    p.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run the validation daemon: keep the compiled validator warm and answer\nrequests on a local Unix socket (see --socket).",
+    )
+    p.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Thin client: ask a running daemon to validate; fall back to in-process\nvalidation if none is reachable.",
+    )
+    p.add_argument(
+        "--socket",
+        dest="socket",
+        type=str,
+        default=None,
+        help="Daemon socket path. Default: $RGDS_DAEMON_SOCKET or .rgds_cache/validator.sock",
+    )
     return p.parse_args(argv)
 
 
@@ -347,11 +403,16 @@ def print_text_result(
     sem_errors: List[str],
     sem_warnings: List[str],
     strict: bool,
+    schema_errors_omitted: int | None = 0,
 ):
     if not schema_ok:
         print("[FAIL] Decision log does NOT conform to schema.")
         for line in schema_errors:
             print(f" - {line}")
+        if schema_errors_omitted is None:
+            print(" - ... stopped at the first error (--fail-fast)")
+        elif schema_errors_omitted:
+            print(f" - ... {schema_errors_omitted} more schema error(s) not shown (--max-errors)")
         print("\nLegend: PASS = schema + semantic invariants satisfied; WARN = recommendations (non-fatal unless strict).")
         return
 
@@ -396,6 +457,32 @@ def emit_json_result(
     sem_warnings: List[Dict[str, Any]],
     strict: bool,
 ) -> str:
+    payload = build_json_payload(
+        schema_path=schema_path,
+        instance_path=instance_path,
+        schema_dict=schema_dict,
+        schema_ok=schema_ok,
+        schema_errors=schema_errors,
+        sem_enabled=sem_enabled,
+        sem_errors=sem_errors,
+        sem_warnings=sem_warnings,
+        strict=strict,
+    )
+    return json.dumps(payload, indent=2, sort_keys=False)
+
+
+def build_json_payload(
+    schema_path: Path,
+    instance_path: Path,
+    schema_dict: Any,
+    schema_ok: bool,
+    schema_errors: List[Dict[str, Any]],
+    sem_enabled: bool,
+    sem_errors: List[Dict[str, Any]],
+    sem_warnings: List[Dict[str, Any]],
+    strict: bool,
+) -> Dict[str, Any]:
+    """The --format json result object (also what the validation daemon returns)."""
     sv = schema_version(schema_dict)
     payload = {
         "script": {"name": "validate_decision_log.py", "version": SCRIPT_VERSION},
@@ -411,7 +498,7 @@ def emit_json_result(
         "semantic_errors": sem_errors,
         "semantic_warnings": sem_warnings,
     }
-    return json.dumps(payload, indent=2, sort_keys=False)
+    return payload
 
 
 def to_coded_list(items: List[str]) -> List[Dict[str, Any]]:
@@ -429,159 +516,480 @@ def to_coded_list(items: List[str]) -> List[Dict[str, Any]]:
     return out
 
 
-def main(argv: List[str] | None = None) -> int:
-    args = parse_args(sys.argv[1:] if argv is None else argv)
-    schema_path, instance_path, semantic, strict = resolve_paths(args)
+def precheck_instance(precheck, instance: Any) -> Tuple[int, Dict[str, Any]]:
+    """
+    Run only the schema-derived precheck (schema_precheck.py).
 
-    if not schema_path.exists():
-        print(f"[ERROR] Schema not found: {schema_path}")
-        return 2
-    if not instance_path.exists():
-        print(f"[ERROR] Instance not found: {instance_path}")
-        return 2
+    Returns (exit_code, outcome) in the same shape as validate_instance(), with
+    precheck findings reported as schema errors and no semantic results.
+    """
+    from schema_precheck import run_precheck
+
+    errors = run_precheck(precheck, instance)
+    outcome: Dict[str, Any] = {
+        "schema_ok": not errors,
+        "schema_errors": [f"{e['path']}: {e['message']}" for e in errors],
+        "schema_errors_json": errors,
+        "schema_errors_omitted": 0,
+        "sem_errors": [],
+        "sem_warnings": [],
+    }
+    return (1 if errors else 0), outcome
 
-    schema_dict = load_json(schema_path)
 
-    if args.version:
-        sv = schema_version(schema_dict)
-        print(f"validate_decision_log.py version: {SCRIPT_VERSION}")
-        print(f"schema version: {sv if sv else '(not declared)'}")
-        print(f"default schema: {DEFAULT_SCHEMA}")
-        return 0
+def validate_instance(
+    validator,
+    instance: Any,
+    semantic: bool,
+    strict: bool,
+    plan=None,
+    max_errors: int | None = None,
+    fail_fast: bool = False,
+    profile=None,
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Run schema (and optionally semantic) validation for one loaded instance.
 
-    instance = load_json(instance_path)
+    max_errors / fail_fast bound schema error collection (see
+    schema_cache.collect_schema_errors); only kept errors are formatted.
+    A validation_profile.Profile, if given, records the schema and semantic
+    phases and per-rule timings.
 
-    validator = Draft202012Validator(schema_dict)
-    schema_iter_errors = sorted(validator.iter_errors(instance), key=lambda e: list(e.path))
+    Returns:
+        (exit_code, outcome)
+        outcome keys: schema_ok, schema_errors (text lines), schema_errors_json,
+        schema_errors_omitted (0, a count, or None if stopped early),
+        sem_errors, sem_warnings (both "CODE: message" strings)
+    """
+    if profile is None:
+        schema_iter_errors, omitted = collect_schema_errors(validator, instance, max_errors, fail_fast)
+    else:
+        schema_iter_errors, omitted = profile.run_schema(collect_schema_errors, validator, instance, max_errors, fail_fast)
+    located = [(format_path(e.path), e.message) for e in schema_iter_errors]
 
     schema_ok = len(schema_iter_errors) == 0
-    schema_errors_text: List[str] = []
-    schema_errors_json: List[Dict[str, Any]] = []
-
+    outcome: Dict[str, Any] = {
+        "schema_ok": schema_ok,
+        "schema_errors": [f"{path}: {message}" for path, message in located],
+        "schema_errors_json": [{"path": path, "message": message} for path, message in located],
+        "schema_errors_omitted": omitted,
+        "sem_errors": [],
+        "sem_warnings": [],
+    }
     if not schema_ok:
-        for e in schema_iter_errors:
-            schema_errors_text.append(f"{format_path(e.path)}: {e.message}")
-        schema_errors_json = [{"path": format_path(e.path), "message": e.message} for e in schema_iter_errors]
-
-        if args.out_format == "json":
-            print(
-                emit_json_result(
-                    schema_path=schema_path,
-                    instance_path=instance_path,
-                    schema_dict=schema_dict,
-                    schema_ok=False,
-                    schema_errors=schema_errors_json,
-                    sem_enabled=semantic,
-                    sem_errors=[],
-                    sem_warnings=[],
-                    strict=strict,
-                )
-            )
+        return 1, outcome
+
+    if semantic:
+        from semantic_rules import semantic_checks
+
+        with profile.phase("semantic") if profile else nullcontext():
+            outcome["sem_errors"], outcome["sem_warnings"] = semantic_checks(instance, plan, profile.rules if profile else None)
+
+    # Semantic hard errors fail; in strict mode warnings become failures too.
+    if outcome["sem_errors"] or (strict and outcome["sem_warnings"]):
+        return 1, outcome
+    return 0, outcome
+
+
+def outcome_payload(
+    schema_path: Path,
+    instance_path: Path,
+    schema_dict: Any,
+    outcome: Dict[str, Any],
+    semantic: bool,
+    strict: bool,
+) -> Dict[str, Any]:
+    """JSON payload for a validate_instance() outcome."""
+    payload = build_json_payload(
+        schema_path=schema_path,
+        instance_path=instance_path,
+        schema_dict=schema_dict,
+        schema_ok=outcome["schema_ok"],
+        schema_errors=outcome["schema_errors_json"],
+        sem_enabled=semantic,
+        sem_errors=to_coded_list(outcome["sem_errors"]),
+        sem_warnings=to_coded_list(outcome["sem_warnings"]),
+        strict=strict,
+    )
+    omitted = outcome.get("schema_errors_omitted", 0)
+    if omitted != 0:
+        # Only present when errors were cut short; null = stopped early, total unknown.
+        payload["schema_errors_truncated"] = {"omitted": omitted}
+    return payload
+
+
+def print_outcome(
+    out_format: str,
+    schema_path: Path,
+    instance_path: Path,
+    schema_dict: Any,
+    outcome: Dict[str, Any],
+    semantic: bool,
+    strict: bool,
+    precheck: bool = False,
+) -> None:
+    if out_format == "json":
+        payload = outcome_payload(schema_path, instance_path, schema_dict, outcome, semantic, strict)
+        if precheck:
+            payload["modes"]["precheck"] = True
+        print(json.dumps(payload, indent=2, sort_keys=False))
+        return
+
+    if precheck:
+        if outcome["schema_ok"]:
+            print("[PASS] Decision log passes the precheck (required fields, identifiers, enums, conditionals).")
+            print(f"  Schema:   {schema_path}")
+            print(f"  Instance: {instance_path}")
+            print("  Full schema + semantic validation not run; rerun without --precheck.")
         else:
-            print_text_result(
+            print("[FAIL] Decision log fails the precheck.")
+            for line in outcome["schema_errors"]:
+                print(f" - {line}")
+        return
+
+    print_text_result(
+        schema_path=schema_path,
+        instance_path=instance_path,
+        schema_ok=outcome["schema_ok"],
+        schema_errors=outcome["schema_errors"],
+        sem_enabled=semantic,
+        sem_errors=outcome["sem_errors"],
+        sem_warnings=outcome["sem_warnings"],
+        strict=strict,
+        schema_errors_omitted=outcome.get("schema_errors_omitted", 0),
+    )
+
+
+def validate_records(
+    records,
+    schema_path: Path,
+    semantic: bool,
+    strict: bool,
+    plan=None,
+    max_errors: int | None = None,
+    fail_fast: bool = False,
+    profile=None,
+) -> int:
+    """
+    Validate a sequence of records, writing one compact --format json line each.
+
+    `records` yields (instance, value, error): `instance` becomes the
+    payload's "instance" object, and a record with an `error` (it could not
+    be decoded) is reported with schema_ok=false. Shared by --ndjson and
+    --archive. With a profile, the time spent producing each record is
+    booked as "load" and each record is timed under its instance path
+    (plus "#<record>" for streams).
+
+    Exit code: 0 all pass; 1 any validation failure; 2 any undecodable record.
+    """
+    validator, schema_dict = load_schema(schema_path, profile)
+
+    rc = 0
+    clock = time.perf_counter
+    records = iter(records)
+    while True:
+        t0 = clock()
+        item = next(records, None)
+        if item is None:
+            break
+        instance_info, value, error = item
+        if profile is not None:
+            profile.add("load", clock() - t0)
+
+        if error is not None:
+            payload = build_json_payload(
                 schema_path=schema_path,
-                instance_path=instance_path,
+                instance_path=Path(instance_info["path"]),
+                schema_dict=schema_dict,
                 schema_ok=False,
-                schema_errors=schema_errors_text,
+                schema_errors=[],
                 sem_enabled=semantic,
                 sem_errors=[],
                 sem_warnings=[],
                 strict=strict,
             )
-        return 1
+            payload["error"] = error
+            rec_rc = 2
+        else:
+            rec_rc, outcome = validate_instance(validator, value, semantic, strict, plan, max_errors, fail_fast, profile)
+            payload = outcome_payload(schema_path, Path(instance_info["path"]), schema_dict, outcome, semantic, strict)
 
-    sem_errs: List[str] = []
-    sem_warns: List[str] = []
+        payload["instance"] = instance_info
+        with profile.phase("output") if profile else nullcontext():
+            print(json.dumps(payload, sort_keys=False), flush=True)
+        rc = max(rc, rec_rc)
+        if profile is not None:
+            record = instance_info.get("record")
+            profile.file_done(instance_info["path"] + ("" if record is None else f"#{record}"), clock() - t0)
 
-    if semantic:
-        sem_errs, sem_warns = semantic_checks(instance)
-
-    # Strict mode: warnings become failures.
-    if semantic and strict and len(sem_warns) > 0:
-        if args.out_format == "json":
-            print(
-                emit_json_result(
-                    schema_path=schema_path,
-                    instance_path=instance_path,
-                    schema_dict=schema_dict,
-                    schema_ok=True,
-                    schema_errors=[],
-                    sem_enabled=True,
-                    sem_errors=to_coded_list(sem_errs),
-                    sem_warnings=to_coded_list(sem_warns),
-                    strict=True,
-                )
-            )
-        else:
-            print_text_result(
-                schema_path=schema_path,
-                instance_path=instance_path,
-                schema_ok=True,
-                schema_errors=[],
-                sem_enabled=True,
-                sem_errors=sem_errs,
-                sem_warnings=sem_warns,
-                strict=True,
-            )
-        return 1
-
-    # Semantic hard errors fail.
-    if semantic and len(sem_errs) > 0:
-        if args.out_format == "json":
-            print(
-                emit_json_result(
-                    schema_path=schema_path,
-                    instance_path=instance_path,
-                    schema_dict=schema_dict,
-                    schema_ok=True,
-                    schema_errors=[],
-                    sem_enabled=True,
-                    sem_errors=to_coded_list(sem_errs),
-                    sem_warnings=to_coded_list(sem_warns),
-                    strict=strict,
-                )
-            )
-        else:
-            print_text_result(
-                schema_path=schema_path,
-                instance_path=instance_path,
-                schema_ok=True,
-                schema_errors=[],
-                sem_enabled=True,
-                sem_errors=sem_errs,
-                sem_warnings=sem_warns,
-                strict=strict,
-            )
-        return 1
+    return rc
+
+
+def validate_stream(
+    source: str,
+    schema_path: Path,
+    semantic: bool,
+    strict: bool,
+    plan=None,
+    max_errors: int | None = None,
+    fail_fast: bool = False,
+    profile=None,
+    array: bool = False,
+) -> int:
+    """
+    Validate every record in an NDJSON / concatenated-JSON file (or "-" for stdin).
+
+    Each result is written immediately as one compact --format json line, with
+    instance.record (0-based) and instance.line (1-based start line) added.
+    With array=True the input is one top-level JSON array instead, walked
+    element by element (json_stream.iter_array_elements); instance.record
+    is then the array index.
+    """
+    from json_stream import iter_array_elements, iter_records
+
+    if source == "-":
+        stream, label = sys.stdin, "<stdin>"
+    else:
+        stream_path = Path(source).resolve()
+        try:
+            stream = stream_path.open("r", encoding="utf-8")
+        except OSError as e:
+            print(f"[ERROR] Failed to read JSON: {stream_path}\n  {e}")
+            return 2
+        label = str(stream_path)
+
+    records = (({"path": label, "record": rec.index, "line": rec.line}, rec.value, rec.error) for rec in (iter_array_elements if array else iter_records)(stream))
+    try:
+        return validate_records(records, schema_path, semantic, strict, plan, max_errors, fail_fast, profile)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
 
-    # Pass (schema OK; semantic OK; warnings may exist if not strict)
-    if args.out_format == "json":
-        print(
-            emit_json_result(
+
+def validate_archive(
+    source: str,
+    schema_path: Path,
+    semantic: bool,
+    strict: bool,
+    plan=None,
+    max_errors: int | None = None,
+    fail_fast: bool = False,
+    profile=None,
+) -> int:
+    """
+    Validate the JSON members of a zip / tar archive without extracting it.
+
+    `source` is "archive[!glob]" (default glob: *.json; see archive_inputs.py).
+    Output is the same as --ndjson, with instance.path "<archive>!<member>".
+    """
+    from archive_inputs import iter_members, split_spec
+
+    spec = split_spec(source)
+    if spec is None:
+        print(f"[ERROR] Archive not found (or not a .zip / .tar[.gz|.bz2|.xz] file): {source.partition('!')[0]}")
+        return 2
+
+    def records():
+        for member in iter_members(spec[0], spec[1]):
+            try:
+                yield {"path": str(member)}, json.loads(member.read_bytes()), None
+            except Exception as e:
+                yield {"path": str(member)}, None, f"Failed to read JSON: {e}"
+
+    try:
+        return validate_records(records(), schema_path, semantic, strict, plan, max_errors, fail_fast, profile)
+    except Exception as e:
+        print(f"[ERROR] Failed to read archive: {spec[0]}\n  {e}")
+        return 2
+
+
+def write_profile(profile, prefix: str | None) -> None:
+    """Write the --profile exports and print the summary to stderr (stdout may be JSON)."""
+    from validation_profile import profile_prefix
+
+    json_path, prom_path = profile.write(profile_prefix(prefix, "validate_decision_log"))
+    for line in profile.summary_lines():
+        print(line, file=sys.stderr)
+    print(f"  Profile: {json_path}\n           {prom_path}", file=sys.stderr)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.serve:
+        from validation_daemon import serve
+
+        return serve(Path(args.socket) if args.socket else None)
+
+    schema_path, instance_path, semantic, strict = resolve_paths(args)
+
+    if args.version:
+        # Fast path: plain JSON read of the schema; no validator, no instance.
+        if not schema_path.exists():
+            print(f"[ERROR] Schema not found: {schema_path}")
+            return 2
+        sv = schema_version(load_json(schema_path))
+        print(f"validate_decision_log.py version: {SCRIPT_VERSION}")
+        print(f"schema version: {sv if sv else '(not declared)'}")
+        print(f"default schema: {DEFAULT_SCHEMA}")
+        return 0
+
+    if args.list_rules:
+        from semantic_rules import rule_catalog
+
+        for line in rule_catalog():
+            print(line)
+        return 0
+
+    plan = None
+    rule_options = None
+    if semantic or args.select or args.disable or args.promote:
+        from semantic_rules import build_plan, parse_codes
+
+        rule_options = {
+            "select": parse_codes(args.select),
+            "disable": parse_codes(args.disable),
+            "promote": parse_codes(args.promote),
+        }
+        try:
+            plan = build_plan(**rule_options)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            return 2
+
+    if args.max_errors is not None and args.max_errors < 1:
+        print("[ERROR] --max-errors must be at least 1")
+        return 2
+
+    profile = None
+    if args.profile:
+        from validation_profile import Profile
+
+        profile = Profile("validate_decision_log", top=args.profile_top)
+
+    if sum(x is not None for x in (args.ndjson, args.json_array, args.archive)) > 1:
+        print("[ERROR] --ndjson, --json-array and --archive are mutually exclusive")
+        return 2
+
+    if args.ndjson is not None or args.json_array is not None:
+        if not schema_path.exists():
+            print(f"[ERROR] Schema not found: {schema_path}")
+            return 2
+        array = args.ndjson is None
+        rc = validate_stream(
+            args.json_array if array else args.ndjson,
+            schema_path,
+            semantic,
+            strict,
+            plan,
+            args.max_errors,
+            args.fail_fast,
+            profile,
+            array=array,
+        )
+        if profile is not None:
+            write_profile(profile, args.profile_out)
+        return rc
+
+    if args.archive is not None:
+        if not schema_path.exists():
+            print(f"[ERROR] Schema not found: {schema_path}")
+            return 2
+        rc = validate_archive(
+            args.archive, schema_path, semantic, strict, plan, args.max_errors, args.fail_fast, profile
+        )
+        if profile is not None:
+            write_profile(profile, args.profile_out)
+        return rc
+
+    if "!" in str(instance_path):
+        # "archive!member": read the member in place (duck-types Path.read_bytes / read_text).
+        from archive_inputs import resolve_input
+
+        instance_path = resolve_input(str(instance_path))
+
+    if not schema_path.exists():
+        print(f"[ERROR] Schema not found: {schema_path}")
+        return 2
+    if not instance_path.exists():
+        print(f"[ERROR] Instance not found: {instance_path}")
+        return 2
+
+    if args.precheck:
+        reply = None
+        if args.daemon:
+            from validation_daemon import request_validation
+
+            reply = request_validation(
+                Path(args.socket) if args.socket else None,
                 schema_path=schema_path,
                 instance_path=instance_path,
-                schema_dict=schema_dict,
-                schema_ok=True,
-                schema_errors=[],
-                sem_enabled=semantic,
-                sem_errors=to_coded_list(sem_errs) if semantic else [],
-                sem_warnings=to_coded_list(sem_warns) if semantic else [],
+                semantic=False,
                 strict=strict,
+                precheck=True,
+                code_hash=source_hash(*LOGIC_MODULES),
             )
-        )
-    else:
-        print_text_result(
+        if reply is not None:
+            rc, outcome, schema_dict = reply
+        else:
+            from schema_precheck import build_precheck
+
+            schema_dict = load_json(schema_path)
+            rc, outcome = precheck_instance(build_precheck(schema_dict), load_json(instance_path))
+        print_outcome(args.out_format, schema_path, instance_path, schema_dict, outcome, False, strict, precheck=True)
+        return rc
+
+    # A record already validated under the same schema, modes and rules is
+    # answered from the outcome cache without importing jsonschema.
+    cache_key = (
+        None
+        if args.no_cache or profile is not None
+        else outcome_cache_key(schema_path, instance_path, semantic, strict, plan, args.max_errors, args.fail_fast)
+    )
+    if cache_key is not None:
+        cached = load_cached_outcome(cache_key)
+        if cached is not None:
+            rc, outcome = cached
+            print_outcome(args.out_format, schema_path, instance_path, load_json(schema_path), outcome, semantic, strict)
+            return rc
+
+    reply = None
+    code_hash = source_hash(*LOGIC_MODULES)
+    if args.daemon and profile is None:
+        # Thin client: a warm daemon answers in milliseconds; otherwise fall through.
+        # Replies from a daemon running other code are discarded (code_hash).
+        from validation_daemon import request_validation
+
+        reply = request_validation(
+            Path(args.socket) if args.socket else None,
             schema_path=schema_path,
             instance_path=instance_path,
-            schema_ok=True,
-            schema_errors=[],
-            sem_enabled=semantic,
-            sem_errors=sem_errs,
-            sem_warnings=sem_warns,
+            semantic=semantic,
             strict=strict,
+            rules=rule_options,
+            max_errors=args.max_errors,
+            fail_fast=args.fail_fast,
+            code_hash=code_hash,
+        )
+
+    if reply is not None:
+        rc, outcome, schema_dict = reply
+    else:
+        validator, schema_dict = load_schema(schema_path, profile)
+        with profile.phase("load") if profile else nullcontext():
+            instance = load_json(instance_path)
+        rc, outcome = validate_instance(
+            validator, instance, semantic, strict, plan, args.max_errors, args.fail_fast, profile
         )
 
-    return 0
+    if cache_key is not None:
+        store_outcome(cache_key, rc, outcome, code_hash)
+    with profile.phase("output") if profile else nullcontext():
+        print_outcome(args.out_format, schema_path, instance_path, schema_dict, outcome, semantic, strict)
+    if profile is not None:
+        profile.file_done(str(instance_path), sum(seconds for seconds, _ in profile.phases.values()))
+        write_profile(profile, args.profile_out)
+    return rc
 
 
 if __name__ == "__main__":
@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+RGDS Validation Script — validate_distributed.py
+
+Purpose
+-------
+Runs validate_all_examples.py's checks across many processes on many
+machines: a coordinator splits the corpus into hash-partitioned shards and
+publishes them to a work queue (one SQLite file on shared storage, see
+shard_queue.py), any number of workers claim shards, validate them and
+store their results, and a merge step prints one report and returns one
+exit code.
+
+Roles
+-----
+plan    coordinator: collect the inputs (same targets as
+        validate_all_examples.py: directories, files, globs, archives),
+        assign each to shard sha256(path) % --shards, where path is the
+        file on disk (the archive, for a member), and write the queue
+        together with the run configuration (compiled schema, --strict,
+        rule selection, --max-errors, --corpus). Workers validate with
+        that configuration, not their own checkout's.
+work    worker: claim a shard, validate it with a warm validator, renew the
+        lease while working, store the results; repeat until every shard is
+        done. A worker whose lease expires (crash, kill, lost node) loses
+        its shard to the next worker that asks; a shard that expires
+        --max-attempts times is marked failed. A worker whose script
+        version or validation code (hash of the rule, format and
+        validator sources) differs from the coordinator's refuses to
+        start, so one run never mixes results.
+merge   print the per-file report in input order ([PASS] / [WARN] / [FAIL],
+        as validate_all_examples.py prints it), run the corpus pass if
+        planned with --corpus, write a JSON report, and exit 0 / 1 / 2.
+        --aggregate prints ranked failure clusters instead of the per-file
+        report (as in validate_all_examples.py); the JSON report then
+        carries the top --top-k clusters too.
+status  shard states, owners and attempts.
+run     plan + N local worker processes + merge, on one host.
+
+Every input path must be reachable at the same absolute path on every
+worker node (shared filesystem). Results are not read from or written to
+the per-node result cache; a distributed run always revalidates.
+
+Typical usage
+-------------
+    # one host, 8 worker processes
+    python3 scripts/validate_distributed.py run /data/corpus --workers 8 --corpus
+
+    # many hosts sharing /shared
+    python3 scripts/validate_distributed.py plan /data/corpus --queue /shared/rgds/queue.sqlite --shards 256
+    python3 scripts/validate_distributed.py work --queue /shared/rgds/queue.sqlite      # on each node, any number of times
+    python3 scripts/validate_distributed.py merge --queue /shared/rgds/queue.sqlite --wait
+
+Exit codes
+----------
+plan / work / status:
+0 — Success
+2 — Script/configuration error (missing inputs, unreadable or foreign queue,
+    or a worker running different code from the coordinator)
+
+merge / run (same meaning as validate_all_examples.py):
+0 — All files pass (warnings allowed unless strict)
+1 — Schema, semantic invariant, corpus, or (in strict mode) warning failure
+2 — Unreadable files, failed or unfinished shards, or a configuration error
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from archive_inputs import ArchiveMember, read_members, resolve_input, source_file
+from corpus_checks import Links
+from error_clusters import ErrorAggregator
+from schema_cache import build_validator, source_hash
+from semantic_rules import build_plan, parse_codes
+from shard_queue import claim, complete, create_queue, open_queue, read_config, renew, shard_rows, state_counts, stored_results, unfinished
+from validate_all_examples import (
+    LOGIC_MODULES,
+    OUTCOME_FIELDS,
+    SCHEMA_PATH,
+    SCRIPT_VERSION,
+    aggregate,
+    collect_inputs,
+    load_schema,
+    outcome_status,
+    report,
+    report_corpus,
+    validate_one,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_QUEUE = ROOT / "build" / "distributed" / "queue.sqlite"
+DEFAULT_REPORT = ROOT / "build" / "distributed" / "report.json"
+
+
+# -----------------------------
+# Coordinator
+# -----------------------------
+
+
+def plan(args) -> int:
+    """Write the queue for args.paths; refuses to replace a queue that is still running unless --force."""
+    queue = Path(args.queue)
+    if queue.exists() and not args.force:
+        try:
+            conn = open_queue(queue)
+            running = unfinished(conn)
+            conn.close()
+        except ValueError:
+            running = 0
+        if running:
+            print(f"[ERROR] Queue {queue} still has {running} unfinished shard(s); use --force to replace it.")
+            return 2
+
+    try:
+        build_plan(select=parse_codes(args.select), disable=parse_codes(args.disable), promote=parse_codes(args.promote))
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+    if not SCHEMA_PATH.exists():
+        print(f"[ERROR] Schema not found: {SCHEMA_PATH}")
+        return 2
+    schema, schema_hash = load_schema(SCHEMA_PATH)
+
+    examples = collect_inputs(args.paths)
+    if not examples:
+        print("[ERROR] No example JSON files found.")
+        return 2
+
+    # Partition by the file on disk, so all members of one archive share a shard
+    # and a tar archive is streamed once per shard rather than once per member.
+    inputs = [(label, str(path), str(source_file(path))) for label, path in examples]
+    config = {
+        "schema": schema,
+        "schema_hash": schema_hash,
+        "script_version": SCRIPT_VERSION,
+        "code_hash": source_hash(*LOGIC_MODULES),
+        "strict": args.strict or args.warn_as_error,
+        "select": args.select,
+        "disable": args.disable,
+        "promote": args.promote,
+        "max_errors": args.max_errors,
+        "corpus": args.corpus,
+        "lease_seconds": args.lease_seconds,
+        "max_attempts": args.max_attempts,
+    }
+    sizes = create_queue(queue, inputs, args.shards, config)
+    print(f"[PASS] Planned {len(inputs)} file(s) in {len(sizes)} shard(s) (largest: {max(sizes.values())} file(s))")
+    print(f"  Queue: {queue}")
+    return 0
+
+
+# -----------------------------
+# Worker
+# -----------------------------
+
+
+def _shard_inputs(items: List[Tuple[int, str, str]]) -> List[tuple]:
+    """(seq, label, input) for a leased shard; tar members are read in one pass per archive."""
+    resolved = [(seq, label, resolve_input(target, preload=False)) for seq, label, target in items]
+    wanted: Dict[Path, set] = {}
+    for _, _, item in resolved:
+        if isinstance(item, ArchiveMember) and not item.archive.name.lower().endswith(".zip"):
+            wanted.setdefault(item.archive, set()).add(item.member)
+
+    loaded: Dict[Path, Dict[str, bytes]] = {}
+    for archive, names in wanted.items():
+        try:
+            loaded[archive] = read_members(archive, names)
+        except Exception:
+            pass  # each member then fails on its own read, and is reported per file
+
+    def preloaded(item):
+        if isinstance(item, ArchiveMember):
+            data = loaded.get(item.archive, {}).get(item.member)
+            if data is not None:
+                return item._replace(data=data)
+        return item
+
+    return [(seq, label, preloaded(item)) for seq, label, item in resolved]
+
+
+def work(args) -> int:
+    """Claim and validate shards until the queue has none left (or --max-shards is reached)."""
+    try:
+        conn = open_queue(Path(args.queue))
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+    config = read_config(conn)
+    code = (SCRIPT_VERSION, source_hash(*LOGIC_MODULES))
+    planned = (config.get("script_version"), config.get("code_hash"))
+    if planned != code:
+        conn.close()
+        print(f"[ERROR] Queue {args.queue} was planned with different validation code than this worker runs.")
+        print(f"  Planned: script {planned[0]}, code {str(planned[1])[:12]}")
+        print(f"  Worker:  script {code[0]}, code {code[1][:12]}")
+        print("  Update this node's checkout (or re-plan the queue) and retry.")
+        return 2
+    try:
+        rule_plan = build_plan(
+            select=parse_codes(config["select"]),
+            disable=parse_codes(config["disable"]),
+            promote=parse_codes(config["promote"]),
+        )
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+
+    owner = args.worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    lease_seconds, max_errors = config["lease_seconds"], config["max_errors"]
+    validator = build_validator(config["schema"], format_check=True)
+    done = 0
+
+    try:
+        while args.max_shards is None or done < args.max_shards:
+            lease = claim(conn, owner, lease_seconds, config["max_attempts"])
+            if lease is None:
+                if not unfinished(conn):
+                    break
+                time.sleep(args.poll)  # other workers hold the rest; wait for results or expired leases
+                continue
+
+            # Reading a shard's tar members can take a while; renew the lease on both sides of it.
+            results, inputs = [], []
+            lost = not renew(conn, lease, lease_seconds)
+            if not lost:
+                inputs = _shard_inputs(lease.items)
+                if not renew(conn, lease, lease_seconds):
+                    lost, inputs = True, []
+            renewed = time.monotonic()
+            for seq, label, item in inputs:
+                results.append((seq, validate_one(item, validator, rule_plan, max_errors)))
+                if time.monotonic() - renewed > lease_seconds / 3:
+                    if not renew(conn, lease, lease_seconds):
+                        lost = True
+                        break
+                    renewed = time.monotonic()
+
+            if lost or not complete(conn, lease, results):
+                print(f"[WARN] [{owner}] shard {lease.shard_id}: lease lost to another worker; results discarded")
+                continue
+            done += 1
+            retry = f" (attempt {lease.attempt})" if lease.attempt > 1 else ""
+            print(f"[{owner}] shard {lease.shard_id}: {len(results)} file(s){retry}", flush=True)
+    finally:
+        conn.close()
+    return 0
+
+
+# -----------------------------
+# Merge
+# -----------------------------
+
+
+def merge(args) -> int:
+    """Print the combined report, write the JSON report, and return the run's exit code."""
+    try:
+        conn = open_queue(Path(args.queue))
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+    try:
+        while args.wait and unfinished(conn):
+            time.sleep(args.poll)
+        config = read_config(conn)
+        shards = shard_rows(conn)
+        results = list(stored_results(conn))
+    finally:
+        conn.close()
+
+    strict = config["strict"]
+    failed = errored = warned_any = False
+    counts = {s: 0 for s in ("PASS", "WARN", "FAIL", "ERROR", "MISSING")}
+    corpus: List[Tuple[str, Links]] = []
+    files = []
+    aggregator = ErrorAggregator(samples=args.samples) if args.aggregate else None
+
+    for _, label, _, result in results:
+        if result is None:
+            counts["MISSING"] += 1
+            files.append({"label": label, "status": "MISSING"})
+            continue
+        status = outcome_status(result, strict)
+        counts[status] += 1
+        files.append({"label": label, "status": status, **{f: result[f] for f in OUTCOME_FIELDS}})
+        if aggregator is not None:
+            errored = errored or bool(result["error"])
+            file_failed, file_warned = aggregate(aggregator, label, result, strict)
+        elif result["error"]:
+            print(result["error"])
+            errored = True
+            continue
+        else:
+            file_failed, file_warned = report(label, result, strict)
+        if config["corpus"] and result["links"]:
+            corpus.append((label, Links(*result["links"])))
+        failed = failed or file_failed
+        warned_any = warned_any or file_warned
+
+    if aggregator is not None:
+        print()
+        for line in aggregator.summary_lines(args.top_k):
+            print(line)
+
+    for shard in shards:
+        if shard["state"] == "failed":
+            print(f"\n[ERROR] Shard {shard['shard']} failed ({shard['files']} file(s) not validated): {shard['error']}")
+        elif shard["state"] != "done":
+            print(f"\n[ERROR] Shard {shard['shard']} is {shard['state']} ({shard['files']} file(s) not validated yet)")
+    complete_run = not counts["MISSING"]
+
+    corpus_failed = corpus_warned = False
+    if config["corpus"]:
+        if complete_run:
+            corpus_failed, corpus_warned = report_corpus(corpus, strict)
+        else:
+            print("\n[ERROR] Corpus integrity skipped: not every shard finished.")
+    failed = failed or corpus_failed
+    warned_any = warned_any or corpus_warned
+
+    workers = {s["worker"] for s in shards if s["state"] == "done"}
+    reclaimed = sum(max(0, s["attempts"] - 1) for s in shards)
+    print(
+        f"\nDistributed: {len(files)} file(s) in {len(shards)} shard(s) by {len(workers)} worker(s), "
+        f"{reclaimed} reclaimed lease(s); " + ", ".join(f"{n} {s}" for s, n in counts.items() if n)
+    )
+
+    exit_code = 2 if errored or not complete_run else 1 if failed else 0
+    out = Path(args.report) if args.report else DEFAULT_REPORT
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(
+        json.dumps(
+            {
+                "schema_hash": config["schema_hash"],
+                "script_version": config["script_version"],
+                "strict": strict,
+                "exit_code": exit_code,
+                "counts": counts,
+                "corpus": {"checked": config["corpus"] and complete_run, "failed": corpus_failed, "warned": corpus_warned},
+                "shards": shards,
+                "files": files,
+                **({"clusters": aggregator.to_dict(args.top_k)} if aggregator is not None else {}),
+            },
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    print(f"  Report: {out}")
+
+    if exit_code == 0:
+        if warned_any:
+            print("\nAll example decision logs conform to schema and semantic invariants (with warnings).")
+        else:
+            print("\nAll example decision logs conform to schema and semantic invariants.")
+        print("\nLegend: PASS = schema + semantic invariants satisfied; WARN = recommendations (non-fatal unless --strict).")
+    return exit_code
+
+
+def status(args) -> int:
+    try:
+        conn = open_queue(Path(args.queue))
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+    try:
+        counts = state_counts(conn)
+        shards = shard_rows(conn)
+    finally:
+        conn.close()
+    print(", ".join(f"{n} {state}" for state, n in counts.items()))
+    now = time.time()
+    for shard in shards:
+        if shard["state"] == "done":
+            continue
+        detail = ""
+        if shard["state"] == "leased":
+            left = shard["lease_expires"] - now
+            detail = f" by {shard['worker']}, lease {'expired' if left < 0 else f'{left:.0f}s left'}"
+        elif shard["state"] == "failed":
+            detail = f": {shard['error']}"
+        print(f"  shard {shard['shard']}: {shard['state']}, {shard['files']} file(s), {shard['attempts']} attempt(s){detail}")
+    return 0
+
+
+def run(args) -> int:
+    """plan, then --workers local worker processes, then merge."""
+    code = plan(args)
+    if code:
+        return code
+    print(f"[run] Starting {args.workers} worker process(es)")
+    worker_cmd = [sys.executable, str(Path(__file__).resolve()), "work", "--queue", args.queue, "--poll", str(args.poll)]
+    procs = [subprocess.Popen(worker_cmd) for _ in range(args.workers)]
+    for proc in procs:
+        proc.wait()
+    crashed = sum(1 for proc in procs if proc.returncode != 0)
+    if crashed:
+        print(f"[WARN] {crashed} worker process(es) exited abnormally")
+    print()
+    return merge(args)
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="validate_distributed.py",
+        description="Validate a corpus of RGDS decision logs across worker processes and hosts through a shared shard queue.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    sub = p.add_subparsers(dest="command", required=True)
+
+    queue = argparse.ArgumentParser(add_help=False)
+    queue.add_argument("--queue", type=str, default=str(DEFAULT_QUEUE), help="Queue database (shared by every node). Default: build/distributed/queue.sqlite")
+    poll = argparse.ArgumentParser(add_help=False)
+    poll.add_argument("--poll", metavar="SECONDS", type=float, default=2.0, help="How often to re-check the queue while waiting. Default: 2")
+    report_opts = argparse.ArgumentParser(add_help=False)
+    report_opts.add_argument("--report", type=str, default=None, help="JSON report path. Default: build/distributed/report.json")
+    report_opts.add_argument("--aggregate", action="store_true", help="Print ranked failure clusters instead of the per-file report.")
+    report_opts.add_argument("--top-k", dest="top_k", metavar="N", type=int, default=20, help="Clusters to print with --aggregate. Default: 20")
+    report_opts.add_argument("--samples", metavar="N", type=int, default=3, help="Sample files kept per cluster with --aggregate. Default: 3")
+
+    planning = argparse.ArgumentParser(add_help=False)
+    planning.add_argument("paths", nargs="*", help="Directories, files, glob patterns, or zip/tar archives (as validate_all_examples.py). Default: examples/")
+    planning.add_argument("--shards", type=int, default=64, help="Hash partitions. Default: 64")
+    planning.add_argument("--lease-seconds", dest="lease_seconds", type=float, default=300.0, help="Lease length; a silent worker's shard is reclaimed after this. Default: 300")
+    planning.add_argument("--max-attempts", dest="max_attempts", type=int, default=3, help="Leases per shard before it is marked failed. Default: 3")
+    planning.add_argument("--strict", action="store_true", help="Treat semantic warnings as errors.")
+    planning.add_argument("--warn-as-error", dest="warn_as_error", action="store_true", help="Alias for --strict.")
+    planning.add_argument("--select", type=str, default=None, help="Run only these semantic rule codes (comma-separated).")
+    planning.add_argument("--disable", type=str, default=None, help="Skip these semantic rule codes (comma-separated).")
+    planning.add_argument("--promote", type=str, default=None, help="Treat these semantic warning codes as errors (comma-separated).")
+    planning.add_argument("--max-errors", dest="max_errors", metavar="N", type=int, default=None, help="Report at most N schema errors per file.")
+    planning.add_argument("--corpus", action="store_true", help="Run the corpus integrity checks at merge time.")
+    planning.add_argument("--force", action="store_true", help="Replace a queue that still has unfinished shards.")
+
+    sub.add_parser("plan", parents=[queue, planning], help="Partition the corpus and publish the shards (coordinator).")
+
+    w = sub.add_parser("work", parents=[queue, poll], help="Claim and validate shards until none are left.")
+    w.add_argument("--worker-id", dest="worker_id", type=str, default=None, help="Worker name in the queue. Default: <hostname>:<pid>")
+    w.add_argument("--max-shards", dest="max_shards", metavar="N", type=int, default=None, help="Exit after N shards.")
+
+    m = sub.add_parser("merge", parents=[queue, poll, report_opts], help="Combine shard results into one report and exit code.")
+    m.add_argument("--wait", action="store_true", help="Wait until every shard is done or failed.")
+
+    sub.add_parser("status", parents=[queue], help="Show shard progress.")
+
+    r = sub.add_parser("run", parents=[queue, planning, poll, report_opts], help="plan + local workers + merge on this host.")
+    r.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes. Default: CPU core count")
+    r.set_defaults(wait=False)  # the workers have exited when merge runs
+
+    return p.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    args.queue = str(Path(args.queue).resolve())
+
+    if args.command in ("plan", "run"):
+        if args.shards < 1 or args.max_attempts < 1 or args.lease_seconds <= 0:
+            print("[ERROR] --shards and --max-attempts must be at least 1 and --lease-seconds > 0")
+            return 2
+        if args.max_errors is not None and args.max_errors < 1:
+            print("[ERROR] --max-errors must be at least 1")
+            return 2
+    if args.command == "run" and args.workers < 1:
+        print("[ERROR] --workers must be at least 1")
+        return 2
+    if getattr(args, "top_k", 1) < 1 or getattr(args, "samples", 0) < 0:
+        print("[ERROR] --top-k must be at least 1 and --samples >= 0")
+        return 2
+    if getattr(args, "poll", 1) <= 0:
+        print("[ERROR] --poll must be > 0")
+        return 2
+
+    return {"plan": plan, "work": work, "merge": merge, "status": status, "run": run}[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
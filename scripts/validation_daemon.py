@@ -0,0 +1,250 @@
+"""
+RGDS validation daemon — validation_daemon.py
+
+Purpose
+-------
+Keeps the compiled decision-log.schema.json validator (schema_cache.py) and
+semantic_checks warm in one long-running process so editors and hooks that
+validate on every save do not pay Python startup, the jsonschema import and
+validator construction per record.
+
+Usage
+-----
+    python3 scripts/validate_decision_log.py --serve [--socket PATH]
+    python3 scripts/validate_decision_log.py --daemon --semantic my_decision.json
+
+The --daemon client falls back to in-process validation whenever the daemon
+is not reachable, so it is always safe to pass.
+
+Protocol
+--------
+Local Unix socket, one request per connection, one JSON object per line:
+
+    request  {"schema_path": "...", "instance_path": "...", "semantic": bool, "strict": bool,
+              "rules": {"select": [...], "disable": [...], "promote": [...]},
+              "precheck": bool, "max_errors": int|null, "fail_fast": bool}
+    response {"ok": true, "exit_code": 0|1, "payload": {...}, "code_hash": "..."}
+             {"ok": false, "error": "..."}
+
+"payload" is exactly the object validate_decision_log.py prints with
+--format json. With "precheck": true only the schema-derived precheck runs
+(schema_precheck.py) and payload.modes.precheck is set. Paths are
+absolute; the daemon reads files from the shared local filesystem, and
+re-hashes the schema on every request so schema edits are picked up
+without a restart.
+
+"code_hash" is the hash of the validator and rule sources the daemon
+loaded (validate_decision_log.LOGIC_MODULES, read once at startup). A
+client whose own sources hash differently, because code or rules were
+edited after the daemon started, ignores the reply and validates
+in-process.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SOCKET = Path(os.environ.get("RGDS_DAEMON_SOCKET") or (ROOT / ".rgds_cache" / "validator.sock"))
+
+# Client-side connect/read timeout (seconds). A slow or wedged daemon must
+# never be worse than validating in-process.
+CLIENT_TIMEOUT = 10.0
+MAX_LINE = 1 << 20
+
+
+def _code_hash() -> str:
+    """Hash of the validator and rule sources this process runs (memoized by schema_cache.source_hash)."""
+    import validate_decision_log as vdl
+    from schema_cache import source_hash
+
+    return source_hash(*vdl.LOGIC_MODULES)
+
+
+def _handle(request: Dict[str, Any]) -> Dict[str, Any]:
+    import validate_decision_log as vdl
+    from archive_inputs import resolve_input
+    from schema_cache import get_validator
+
+    schema_path = Path(request["schema_path"])
+    instance_path = resolve_input(request["instance_path"])  # a Path, or an "archive!member"
+    semantic = bool(request.get("semantic"))
+    strict = bool(request.get("strict"))
+
+    rules = request.get("rules") or {}
+    plan = _plan(tuple(rules.get("select") or ()), tuple(rules.get("disable") or ()), tuple(rules.get("promote") or ()))
+
+    validator, schema_dict, _ = get_validator(schema_path, format_check=True)
+    instance = json.loads(instance_path.read_text(encoding="utf-8"))
+
+    if request.get("precheck"):
+        from schema_precheck import load_precheck
+
+        rc, outcome = vdl.precheck_instance(load_precheck(schema_path), instance)
+        payload = vdl.outcome_payload(schema_path, instance_path, schema_dict, outcome, False, strict)
+        payload["modes"]["precheck"] = True
+        return {"ok": True, "exit_code": rc, "payload": payload, "code_hash": _code_hash()}
+
+    rc, outcome = vdl.validate_instance(
+        validator, instance, semantic, strict, plan, request.get("max_errors"), bool(request.get("fail_fast"))
+    )
+    payload = vdl.outcome_payload(schema_path, instance_path, schema_dict, outcome, semantic, strict)
+    return {"ok": True, "exit_code": rc, "payload": payload, "code_hash": _code_hash()}
+
+
+@functools.lru_cache(maxsize=32)
+def _plan(select: Tuple[str, ...], disable: Tuple[str, ...], promote: Tuple[str, ...]):
+    from semantic_rules import build_plan
+
+    return build_plan(select=select, disable=disable, promote=promote)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            reply = _handle(json.loads(self.rfile.readline(MAX_LINE)))
+        except Exception as e:
+            reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path: Path | None = None) -> int:
+    """Run the daemon until interrupted. Returns a process exit code."""
+    import validate_decision_log as vdl
+    from schema_cache import get_validator
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("[ERROR] --serve requires Unix domain socket support on this platform.")
+        return 2
+
+    path = socket_path or DEFAULT_SOCKET
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.exists():
+        if request_ping(path):
+            print(f"[ERROR] A validation daemon is already listening on {path}")
+            return 2
+        path.unlink()  # stale socket from a previous daemon
+
+    # Pin the code hash to the sources loaded now, and warm the default
+    # schema so the first request is as fast as the rest.
+    _code_hash()
+    try:
+        get_validator(vdl.DEFAULT_SCHEMA, format_check=True)
+    except Exception as e:
+        print(f"[ERROR] Failed to read JSON: {vdl.DEFAULT_SCHEMA}\n  {e}")
+        return 2
+
+    server = _Server(str(path), _RequestHandler)
+    # SIGTERM (service managers, `kill`) shuts down as cleanly as Ctrl-C.
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    print(f"[INFO] RGDS validation daemon listening on {path} (Ctrl-C to stop)")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    return 0
+
+
+def _raise_interrupt(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+
+def _roundtrip(path: Path, request: Dict[str, Any]) -> Dict[str, Any] | None:
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                return json.loads(f.readline(MAX_LINE * 64))
+    except (OSError, ValueError):
+        return None
+
+
+def request_ping(path: Path) -> bool:
+    """True if something answers on `path` like a validation daemon."""
+    reply = _roundtrip(path, {})
+    return isinstance(reply, dict) and "ok" in reply
+
+
+def request_validation(
+    socket_path: Path | None,
+    schema_path: Path,
+    instance_path: Path,
+    semantic: bool,
+    strict: bool,
+    rules: Dict[str, Any] | None = None,
+    precheck: bool = False,
+    max_errors: int | None = None,
+    fail_fast: bool = False,
+    code_hash: str | None = None,
+) -> Tuple[int, Dict[str, Any], Dict[str, Any]] | None:
+    """
+    Ask the daemon to validate one instance.
+
+    With `code_hash` (the caller's source_hash of LOGIC_MODULES), a reply
+    from a daemon running other code is discarded.
+
+    Returns:
+        (exit_code, outcome, schema_dict) in the shape validate_decision_log.print_outcome
+        expects, or None if no daemon answered, or it runs different code
+        (caller validates in-process).
+    """
+    reply = _roundtrip(
+        socket_path or DEFAULT_SOCKET,
+        {
+            "schema_path": str(schema_path),
+            "instance_path": str(instance_path),
+            "semantic": semantic,
+            "strict": strict,
+            "rules": {k: list(v) for k, v in (rules or {}).items()},
+            "precheck": precheck,
+            "max_errors": max_errors,
+            "fail_fast": fail_fast,
+        },
+    )
+    if not isinstance(reply, dict) or not reply.get("ok"):
+        return None
+    if code_hash is not None and reply.get("code_hash") != code_hash:
+        return None
+
+    payload = reply["payload"]
+    outcome = {
+        "schema_ok": payload["result"]["schema_ok"],
+        "schema_errors": [f"{e['path']}: {e['message']}" for e in payload["schema_errors"]],
+        "schema_errors_json": payload["schema_errors"],
+        "schema_errors_omitted": (payload.get("schema_errors_truncated") or {"omitted": 0})["omitted"],
+        "sem_errors": [_uncoded(e) for e in payload["semantic_errors"]],
+        "sem_warnings": [_uncoded(e) for e in payload["semantic_warnings"]],
+    }
+    schema_dict = {"version": payload["schema"]["version"]} if payload["schema"]["version"] else {}
+    return reply["exit_code"], outcome, schema_dict
+
+
+def _uncoded(item: Dict[str, Any]) -> str:
+    """Inverse of validate_decision_log.to_coded_list for one entry."""
+    if item.get("code") is None:
+        return item["message"]
+    return f"{item['code']}: {item['message']}"
@@ -0,0 +1,241 @@
+"""
+RGDS validation profiling — validation_profile.py
+
+Purpose
+-------
+Backs --profile in validate_decision_log.py and validate_all_examples.py:
+where did the time of a slow validation run go?
+
+Recorded per run:
+- phases: wall time and call count for load (read + JSON parse), schema
+  (JSON Schema validation, excluding format checks), format_check
+  (FormatChecker date / date-time / ... calls), semantic, and output
+- rules: wall time and call count per semantic rule code (E-COND-001, ...)
+- the slowest N files (or NDJSON records)
+
+Exports
+-------
+<prefix>.json  machine-readable profile
+<prefix>.prom  Prometheus textfile-collector format, e.g.
+
+    rgds_validation_phase_seconds_total{script="validate_all_examples",phase="schema"} 1.234
+    rgds_validation_rule_seconds_total{script="validate_all_examples",code="E-COND-001"} 0.0012
+
+Both files are written atomically so a collector never reads a partial file.
+
+Worker processes profile each file into their own Profile and return
+snapshot() with the result; the parent merge()s them.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+PROFILE_VERSION = "1"
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_PROFILE_DIR = ROOT / "build" / "profile"
+
+PHASE_ORDER = ("load", "schema", "format_check", "semantic", "output")
+
+
+class Profile:
+    """Accumulates phase / rule timings and the slowest files of one run."""
+
+    def __init__(self, script: str, top: int = 10):
+        self.script = script
+        self.top = top
+        self.phases: Dict[str, List[float]] = {}  # name -> [seconds, calls]
+        self.rules: Dict[str, List[float]] = {}  # code -> [seconds, calls]
+        self.files = 0
+        self._slowest: List[Tuple[float, int, str]] = []  # min-heap of the top N
+        self._started = time.perf_counter()
+
+    # -- recording ----------------------------------------------------
+
+    def add(self, phase: str, seconds: float, calls: int = 1) -> None:
+        slot = self.phases.setdefault(phase, [0.0, 0])
+        slot[0] += seconds
+        slot[1] += calls
+
+    def seconds(self, phase: str) -> float:
+        return self.phases.get(phase, (0.0, 0))[0]
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - t0)
+
+    def run_schema(self, fn, *args):
+        """Call a schema validation function, booking format checks to their own phase."""
+        fmt_before = self.seconds("format_check")
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - t0
+            self.add("schema", elapsed - (self.seconds("format_check") - fmt_before))
+
+    def file_done(self, label: str, seconds: float) -> None:
+        """Record one file's total time; keeps only the slowest `top` files."""
+        self.files += 1
+        if self.top <= 0:
+            return
+        item = (seconds, self.files, label)
+        if len(self._slowest) < self.top:
+            heapq.heappush(self._slowest, item)
+        elif item > self._slowest[0]:
+            heapq.heapreplace(self._slowest, item)
+
+    def format_checker(self):
+        """The shared format checker (format_checks.py), with checks timed into the format_check phase."""
+        from format_checks import format_checker
+
+        checker = format_checker()
+        clock = time.perf_counter
+
+        def timed(func):
+            def run(instance):
+                t0 = clock()
+                try:
+                    return func(instance)
+                finally:
+                    self.add("format_check", clock() - t0)
+
+            return run
+
+        checker.checkers = {name: (timed(func), raises) for name, (func, raises) in checker.checkers.items()}
+        return checker
+
+    # -- combining ----------------------------------------------------
+
+    def reset(self) -> None:
+        self.phases.clear()
+        self.rules.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Phase and rule tables as plain data (crosses process boundaries)."""
+        return {"phases": {k: list(v) for k, v in self.phases.items()}, "rules": {k: list(v) for k, v in self.rules.items()}}
+
+    def merge(self, snapshot: Dict[str, Any]) -> float:
+        """Fold a snapshot in; returns its total phase time (the file's cost)."""
+        total = 0.0
+        for name, (seconds, calls) in snapshot.get("phases", {}).items():
+            self.add(name, seconds, calls)
+            total += seconds
+        for code, (seconds, calls) in snapshot.get("rules", {}).items():
+            slot = self.rules.setdefault(code, [0.0, 0])
+            slot[0] += seconds
+            slot[1] += calls
+        return total
+
+    # -- export -------------------------------------------------------
+
+    def _ordered_phases(self) -> List[str]:
+        return [p for p in PHASE_ORDER if p in self.phases] + sorted(p for p in self.phases if p not in PHASE_ORDER)
+
+    def slowest(self) -> List[Tuple[str, float]]:
+        return [(label, seconds) for seconds, _, label in sorted(self._slowest, key=lambda i: (-i[0], i[1]))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "profile_version": PROFILE_VERSION,
+            "script": self.script,
+            "wall_s": round(time.perf_counter() - self._started, 6),
+            "files": self.files,
+            "phases": {p: {"seconds": round(self.phases[p][0], 6), "calls": int(self.phases[p][1])} for p in self._ordered_phases()},
+            "rules": {
+                code: {"seconds": round(s, 6), "calls": int(c)}
+                for code, (s, c) in sorted(self.rules.items(), key=lambda kv: -kv[1][0])
+            },
+            "slowest_files": [{"file": label, "seconds": round(seconds, 6)} for label, seconds in self.slowest()],
+        }
+
+    def to_prometheus(self) -> str:
+        data = self.to_dict()
+        script = _label(self.script)
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[Tuple[str, float]]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{{script=\"{script}\"{labels}}} {value:g}")
+
+        metric("rgds_validation_run_seconds", "gauge", "Wall time of the profiled validation run.", [("", data["wall_s"])])
+        metric("rgds_validation_files", "gauge", "Files (or records) validated in the run.", [("", data["files"])])
+        metric(
+            "rgds_validation_phase_seconds_total",
+            "counter",
+            "Wall time spent per validation phase.",
+            [(f',phase="{_label(p)}"', v["seconds"]) for p, v in data["phases"].items()],
+        )
+        metric(
+            "rgds_validation_phase_calls_total",
+            "counter",
+            "Calls per validation phase.",
+            [(f',phase="{_label(p)}"', v["calls"]) for p, v in data["phases"].items()],
+        )
+        metric(
+            "rgds_validation_rule_seconds_total",
+            "counter",
+            "Wall time spent per semantic rule code.",
+            [(f',code="{_label(c)}"', v["seconds"]) for c, v in data["rules"].items()],
+        )
+        metric(
+            "rgds_validation_rule_calls_total",
+            "counter",
+            "Evaluations per semantic rule code.",
+            [(f',code="{_label(c)}"', v["calls"]) for c, v in data["rules"].items()],
+        )
+        metric(
+            "rgds_validation_file_seconds",
+            "gauge",
+            "Validation time of the slowest files.",
+            [(f',file="{_label(f["file"])}"', f["seconds"]) for f in data["slowest_files"]],
+        )
+        return "\n".join(lines) + "\n"
+
+    def write(self, prefix: Path) -> Tuple[Path, Path]:
+        """Write <prefix>.json and <prefix>.prom atomically."""
+        json_path = prefix.with_name(prefix.name + ".json")
+        prom_path = prefix.with_name(prefix.name + ".prom")
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(json_path, json.dumps(self.to_dict(), indent=2) + "\n")
+        _atomic_write(prom_path, self.to_prometheus())
+        return json_path, prom_path
+
+    def summary_lines(self) -> List[str]:
+        data = self.to_dict()
+        out = [f"Profile: {data['files']} file(s) in {data['wall_s']:.3f}s"]
+        for p, v in data["phases"].items():
+            out.append(f"  phase {p:<13} {v['seconds']:9.4f}s  {v['calls']:>8} call(s)")
+        for code, v in list(data["rules"].items())[: self.top]:
+            out.append(f"  rule  {code:<13} {v['seconds']:9.4f}s  {v['calls']:>8} call(s)")
+        for f in data["slowest_files"]:
+            out.append(f"  slow  {f['seconds']:9.4f}s  {f['file']}")
+        return out
+
+
+def profile_prefix(value: str | None, script: str) -> Path:
+    """--profile-out PREFIX, defaulting to build/profile/<script>."""
+    return Path(value) if value else DEFAULT_PROFILE_DIR / script
+
+
+def _label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)